@@ -0,0 +1,57 @@
+import numpy as np
+
+class Alias_table:
+    """
+    Walker's alias method for drawing indices with given weights.
+
+    Building the table is O(n) (Vose's variant). Each draw is then O(1):
+    one uniform column plus one biased coin flip between the column and
+    its alias.
+    """
+
+    def __init__(self, weights):
+        """
+        Args:
+            weights (array): Non-negative weights, not all zero.
+
+        Raises:
+            ValueError: If weights are empty, negative or all zero.
+        """
+        weights = np.asarray(weights, dtype=float)
+
+        if len(weights) == 0 or (weights < 0).any() or not weights.sum() > 0:
+            raise ValueError("Weights must be non-negative and not all zero")
+
+        size = len(weights)
+        scaled = weights * size / weights.sum()
+
+        self.probabilities = np.ones(size)
+        self.aliases = np.arange(size)
+
+        small = [i for i in range(size) if scaled[i] < 1]
+        large = [i for i in range(size) if scaled[i] >= 1]
+
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+
+        # Whatever is left is 1 up to rounding error and keeps probability 1
+
+    def __len__(self):
+        return len(self.probabilities)
+
+    def sample(self, rng):
+        """
+        Draw one index.
+
+        Args:
+            rng (Generator): numpy random generator to draw from.
+
+        Returns:
+            int: An index, with probability proportional to its weight.
+        """
+        column = int(rng.integers(len(self.probabilities)))
+        return column if rng.random() < self.probabilities[column] else int(self.aliases[column])
@@ -0,0 +1,269 @@
+import html
+import json
+import os
+import re
+import sqlite3
+
+from src.atomic_write import atomic_path
+from src.sentence_bank import normalize_text
+
+# Anki separates the fields of a note with this character
+FIELD_SEPARATOR = "\x1f"
+# Formatting tags inside note fields
+HTML_TAG_PATTERN = re.compile(r'<[^>]*>')
+# Anki calls a card mature once its interval reaches three weeks
+MATURE_INTERVAL_DAYS = 21
+# Entries of the graves table, Anki's log of deleted objects
+GRAVE_CARD = 0
+GRAVE_NOTE = 1
+
+def field_text(fields, field):
+    """
+    Get the plain, normalized text of one field of a note.
+
+    Args:
+        fields (str): The note's flds column.
+        field (int): Index of the field.
+
+    Returns:
+        str: The field without HTML, normalized with normalize_text. Empty
+             if the note has no such field.
+    """
+    values = fields.split(FIELD_SEPARATOR)
+    if field >= len(values):
+        return ""
+    return normalize_text(html.unescape(HTML_TAG_PATTERN.sub("", values[field])).strip())
+
+class Anki_known_words:
+    """
+    Known words taken from the matured cards of an Anki collection.
+
+    A word is known when at least one card of its note has an interval of
+    mature_interval days or more. The first sync reads every note and card.
+    Later syncs only query notes and cards whose modification time is at or
+    after the newest one already seen, plus the entries of Anki's log of
+    deletions that are pending (usn -1) or newer than the last one seen,
+    and update the set in place, so their Python-side cost follows the
+    number of changes. The collection is only ever opened read-only.
+
+    Deletions do not always reach the log: a full sync replaces the
+    collection with an empty one and deletions made on another device
+    arrive without entries. Every sync therefore compares the number of
+    mature cards with its own count and, when they differ, rescans the
+    whole collection.
+
+    Instances are iterables of words, so they can be passed straight to
+    Sentence_bank.rank_sentences or to Word as known_words.
+    """
+
+    def __init__(self, path_to_collection, field=0, mature_interval=MATURE_INTERVAL_DAYS, state_path=None):
+        """
+        Args:
+            path_to_collection (str): Path of a collection.anki2 file.
+            field (int): Index of the note field holding the word. Defaults to 0.
+            mature_interval (int): Interval in days from which a card counts
+                                   as mature. Defaults to 21.
+            state_path (str): Optional JSON file to keep the sync state in,
+                              so a new process continues incrementally.
+
+        Raises:
+            ValueError: If field or mature_interval is not a non-negative int.
+            FileNotFoundError: If the collection does not exist.
+        """
+        if isinstance(field, bool) or not isinstance(field, int) or field < 0:
+            raise ValueError("field must be a non-negative int")
+
+        if isinstance(mature_interval, bool) or not isinstance(mature_interval, int) or mature_interval < 0:
+            raise ValueError("mature_interval must be a non-negative int")
+
+        if not os.path.exists(path_to_collection):
+            raise FileNotFoundError(f"[Errno 2] No such file or directory: '{path_to_collection}'")
+
+        self.path_to_collection = path_to_collection
+        self.field = field
+        self.mature_interval = mature_interval
+        self.state_path = state_path
+
+        # Newest modification times and deletion log usn seen, -1 before the first sync
+        self.notes_mod = -1
+        self.cards_mod = -1
+        self.graves_usn = -1
+
+        # Note id -> word, mature card id -> note id, note id -> mature cards
+        self._note_words = {}
+        self._mature_cards = {}
+        self._mature_notes = {}
+
+        # Word -> number of notes with mature cards, its keys are the known words
+        self._word_notes = {}
+
+        # Word -> whether it was known before the running sync touched it
+        self._touched = {}
+
+        if state_path is not None and os.path.exists(state_path):
+            self._load_state()
+
+    @property
+    def known_words(self):
+        """Set-like view of the known words, updated in place by sync."""
+        return self._word_notes.keys()
+
+    def __iter__(self):
+        return iter(self._word_notes)
+
+    def __contains__(self, word):
+        return word in self._word_notes
+
+    def __len__(self):
+        return len(self._word_notes)
+
+    def _count_word(self, word, change):
+        if not word:
+            return
+        self._touched.setdefault(word, word in self._word_notes)
+        count = self._word_notes.get(word, 0) + change
+        if count > 0:
+            self._word_notes[word] = count
+        else:
+            self._word_notes.pop(word, None)
+
+    def _set_note(self, note_id, word):
+        previous = self._note_words.get(note_id)
+        self._note_words[note_id] = word
+
+        if previous != word and note_id in self._mature_notes:
+            self._count_word(previous, -1)
+            self._count_word(word, 1)
+
+    def _remove_note(self, note_id):
+        word = self._note_words.pop(note_id, None)
+        if self._mature_notes.pop(note_id, None):
+            self._count_word(word, -1)
+
+    def _set_card(self, card_id, note_id, mature):
+        if mature and card_id not in self._mature_cards:
+            self._mature_cards[card_id] = note_id
+            self._mature_notes[note_id] = self._mature_notes.get(note_id, 0) + 1
+            if self._mature_notes[note_id] == 1:
+                self._count_word(self._note_words.get(note_id), 1)
+        elif not mature and card_id in self._mature_cards:
+            self._remove_card(card_id)
+
+    def _remove_card(self, card_id):
+        note_id = self._mature_cards.pop(card_id, None)
+        if note_id is None:
+            return
+        self._mature_notes[note_id] -= 1
+        if self._mature_notes[note_id] == 0:
+            del self._mature_notes[note_id]
+            self._count_word(self._note_words.get(note_id), -1)
+
+    def sync(self):
+        """
+        Apply the changes made to the collection since the last sync.
+
+        Returns:
+            tuple: (added, removed) sets of words that became known or
+                   stopped being known.
+        """
+        self._touched = {}
+
+        connection = sqlite3.connect(f"file:{self.path_to_collection}?mode=ro", uri=True)
+        try:
+            self._apply_changes(connection)
+
+            # Deletions missing from the log leave mature cards behind
+            mature_count = connection.execute(
+                "SELECT COUNT(*) FROM cards WHERE ivl >= ?", (self.mature_interval,)
+            ).fetchone()[0]
+            if mature_count != len(self._mature_cards):
+                self._rescan(connection)
+        finally:
+            connection.close()
+
+        if self.state_path is not None:
+            self._save_state()
+
+        added = {word for word, was_known in self._touched.items() if not was_known and word in self._word_notes}
+        removed = {word for word, was_known in self._touched.items() if was_known and word not in self._word_notes}
+        return added, removed
+
+    def _apply_changes(self, connection):
+        """Read the notes, cards and deletions changed since the last sync."""
+        # Anki stores modification times in whole seconds, so rows of the
+        # newest second seen are read again, which is harmless
+        for note_id, mod, fields in connection.execute(
+            "SELECT id, mod, flds FROM notes WHERE mod >= ?", (self.notes_mod,)
+        ):
+            self._set_note(note_id, field_text(fields, self.field))
+            self.notes_mod = max(self.notes_mod, mod)
+
+        for card_id, note_id, mod, interval in connection.execute(
+            "SELECT id, nid, mod, ivl FROM cards WHERE mod >= ?", (self.cards_mod,)
+        ):
+            self._set_card(card_id, note_id, interval >= self.mature_interval)
+            self.cards_mod = max(self.cards_mod, mod)
+
+        # Pending deletions are read until Anki syncs them and assigns a usn,
+        # older synced ones were already applied
+        for object_id, object_type, usn in connection.execute(
+            "SELECT oid, type, usn FROM graves WHERE usn = -1 OR usn > ?", (self.graves_usn,)
+        ):
+            if object_type == GRAVE_CARD:
+                self._remove_card(object_id)
+            elif object_type == GRAVE_NOTE:
+                self._remove_note(object_id)
+            self.graves_usn = max(self.graves_usn, usn)
+
+    def _rescan(self, connection):
+        """Rebuild everything from the collection, keeping the sync's changes."""
+        # Whether each word was known before this sync started
+        was_known = dict.fromkeys(self._word_notes, True)
+        was_known.update(self._touched)
+
+        self.notes_mod = -1
+        self.cards_mod = -1
+        self.graves_usn = -1
+        self._note_words = {}
+        self._mature_cards = {}
+        self._mature_notes = {}
+        self._word_notes = {}
+
+        self._apply_changes(connection)
+
+        self._touched = {word: was_known.get(word, False) for word in was_known.keys() | self._word_notes.keys()}
+
+    def _save_state(self):
+        state = {
+            "path_to_collection": os.path.abspath(self.path_to_collection),
+            "field": self.field,
+            "mature_interval": self.mature_interval,
+            "notes_mod": self.notes_mod,
+            "cards_mod": self.cards_mod,
+            "graves_usn": self.graves_usn,
+            "note_words": self._note_words,
+            "mature_cards": self._mature_cards
+        }
+
+        with atomic_path(self.state_path) as temporary_path, open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(state, file, ensure_ascii=False)
+
+    def _load_state(self):
+        with open(self.state_path, encoding="utf-8") as file:
+            state = json.load(file)
+
+        # State of another collection or settings is ignored, the next sync starts over
+        if (
+            state["path_to_collection"] != os.path.abspath(self.path_to_collection)
+            or state["field"] != self.field
+            or state["mature_interval"] != self.mature_interval
+        ):
+            return
+
+        self.notes_mod = state["notes_mod"]
+        self.cards_mod = state["cards_mod"]
+        # States saved before graves_usn was kept read the whole log once
+        self.graves_usn = state.get("graves_usn", -1)
+        self._note_words = {int(note_id): word for note_id, word in state["note_words"].items()}
+        for card_id, note_id in state["mature_cards"].items():
+            self._set_card(int(card_id), note_id, True)
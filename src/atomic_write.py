@@ -0,0 +1,45 @@
+import contextlib
+import os
+import tempfile
+
+def _current_umask():
+    """Read the process umask, which os.umask only returns by replacing it."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+@contextlib.contextmanager
+def atomic_path(path):
+    """
+    Write a file through a temporary file next to it, moved in place once
+    the block completes.
+
+    The temporary file is unique, so processes writing the same file at once
+    never share one, and it is moved over the file with os.replace, so
+    readers see either the old or the complete new file, never a half
+    written one. If the block raises, the temporary file is removed and the
+    file is left as it was.
+
+    mkstemp creates the temporary file readable by its owner only, so it is
+    given the permissions open would have, 0o666 minus the umask, before it
+    replaces the file.
+
+    Args:
+        path (str): Path of the file to write.
+
+    Yields:
+        str: Path of the temporary file to write to. It ends in the file's
+             name, so e.g. its extension picks the same compression.
+    """
+    directory, name = os.path.split(path)
+    descriptor, temporary_path = tempfile.mkstemp(dir=directory or ".", prefix=".tmp-", suffix="-" + name)
+    os.close(descriptor)
+
+    try:
+        yield temporary_path
+        os.chmod(temporary_path, 0o666 & ~_current_umask())
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
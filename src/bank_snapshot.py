@@ -0,0 +1,232 @@
+import hashlib
+import numpy as np
+import pandas as pd
+import threading
+
+class Bank_snapshot:
+    """
+    One immutable version of a Sentence_bank's rows, ranking state and indexes.
+
+    A writer never modifies a published snapshot. rank_sentences and
+    add_sentences build a new DataFrame next to the old one and publish it
+    as a new snapshot with a single attribute assignment, so a reader that
+    took a snapshot keeps seeing one consistent set of rows, ratios,
+    orderings, indexes and known words for as long as it holds it, without
+    taking a lock.
+
+    The indexes over the rows (token, trigram and fuzzy indexes, the token
+    id encoding, the frequency table) are built on first use and never
+    modified afterwards. A version with the same rows, e.g. after a
+    re-rank, shares them. An append hands the next version extended
+    copies instead.
+    """
+
+    __slots__ = (
+        "frame", "version", "known_words", "lemmatizer",
+        "_ratio_order", "_ratio_ranks", "_secondary_indexes", "_derived", "_indexes", "_lock"
+    )
+
+    # Most values kept by cached before the oldest is dropped
+    MAX_DERIVED = 1024
+
+    def __init__(self, frame, version=0, known_words=None, lemmatizer=None, indexes=None):
+        """
+        Args:
+            frame (DataFrame): The bank's rows. Its arrays are made
+                               read-only, so writing to them raises.
+            version (int): Increases by one with every published snapshot.
+            known_words (set): Known words of the last rank_sentences call.
+            lemmatizer (Lemmatizer): Lemmatizer of the last rank_sentences call.
+            indexes (dict): Already built indexes over exactly these rows,
+                            by name.
+        """
+        # Block in-place writes, e.g. frame.loc[0, "Custom Ratio"] = 1.0, so
+        # code mutating a published version fails instead of racing readers
+        for array in frame._mgr.arrays:
+            if isinstance(array, np.ndarray):
+                array.flags.writeable = False
+
+        self.frame = frame
+        self.version = version
+        self.known_words = known_words
+        self.lemmatizer = lemmatizer
+        self._ratio_order = None
+        self._ratio_ranks = None
+        self._secondary_indexes = {}
+        self._derived = {}
+        self._indexes = dict(indexes) if indexes else {}
+
+        # Serializes building lazily derived values, reading them never waits
+        self._lock = threading.RLock()
+
+    def evolve(self, indexes=None, **changes):
+        """
+        Build the next version with some fields replaced.
+
+        Args:
+            indexes (dict): Indexes over the new version's rows. None shares
+                            this version's indexes, which is only right when
+                            the rows stay the same, e.g. for new ratios.
+            **changes: New values for frame, known_words or lemmatizer.
+
+        Returns:
+            Bank_snapshot: A new snapshot with the version incremented.
+        """
+        fields = {"frame": self.frame, "known_words": self.known_words, "lemmatizer": self.lemmatizer}
+        fields.update(changes)
+        return Bank_snapshot(
+            version=self.version + 1,
+            indexes=self.built_indexes() if indexes is None else indexes,
+            **fields
+        )
+
+    def __len__(self):
+        return len(self.frame)
+
+    @property
+    def ratios(self):
+        """
+        Returns:
+            array: Read-only view of the "Custom Ratio" column.
+        """
+        ratios = self.frame["Custom Ratio"].to_numpy().view()
+        ratios.flags.writeable = False
+        return ratios
+
+    @property
+    def ratio_order(self):
+        """
+        Row positions by descending Custom Ratio, ties in row order, built
+        on first use.
+
+        Returns:
+            array: Read-only int64 row positions.
+        """
+        if self._ratio_order is None:
+            with self._lock:
+                if self._ratio_order is None:
+                    order = np.argsort(-self.ratios, kind="stable").astype(np.int64)
+                    order.flags.writeable = False
+                    self._ratio_order = order
+
+        return self._ratio_order
+
+    @property
+    def ratio_ranks(self):
+        """
+        Index of every row in ratio_order, built on first use, so a set of
+        rows is put in ratio order by sorting their ranks.
+
+        Returns:
+            array: Read-only int64 ranks, ratio_ranks[ratio_order[i]] == i.
+        """
+        if self._ratio_ranks is None:
+            with self._lock:
+                if self._ratio_ranks is None:
+                    ranks = np.empty(len(self.frame), dtype=np.int64)
+                    ranks[self.ratio_order] = np.arange(len(self.frame), dtype=np.int64)
+                    ranks.flags.writeable = False
+                    self._ratio_ranks = ranks
+
+        return self._ratio_ranks
+
+    @property
+    def content_id(self):
+        """
+        Identifies the sentences in ratio order, built on first use.
+
+        Derived from the rows rather than the version number, so two
+        snapshots share an id only when a position in ratio_order means the
+        same sentence in both, whichever bank instance or process they
+        belong to.
+
+        Returns:
+            str: 16 hex digits.
+        """
+        def build():
+            hashes = pd.util.hash_pandas_object(self.frame["Sentence"], index=False).to_numpy()
+            return hashlib.blake2b(hashes[self.ratio_order].tobytes(), digest_size=8).hexdigest()
+
+        return self.cached("content_id", build)
+
+    def secondary_index(self, column):
+        """
+        Get a sorted index over a numeric column, building it on first use.
+
+        Args:
+            column (str): Name of a numeric column of the frame.
+
+        Returns:
+            tuple: (values, positions) where values are the column's non-NaN
+                   values in ascending order and positions the rows they
+                   belong to, so a range of values is one searchsorted away.
+        """
+        if column not in self._secondary_indexes:
+            with self._lock:
+                if column not in self._secondary_indexes:
+                    values = self.frame[column].to_numpy(dtype=float)
+                    positions = np.flatnonzero(~np.isnan(values))
+                    positions = positions[np.argsort(values[positions], kind="stable")]
+                    self._secondary_indexes[column] = (values[positions], positions)
+
+        return self._secondary_indexes[column]
+
+    def index(self, name, build, stale=None):
+        """
+        Get an index over the rows, building it on first use.
+
+        Args:
+            name (str): Identifies the index, e.g. "token".
+            build (callable): Computes the index from this version's rows.
+            stale (callable): Optional check of a built index, True when it
+                              cannot serve the caller, e.g. is too coarse,
+                              and must be built again.
+
+        Returns:
+            object: The index. Callers must not modify it.
+        """
+        index = self._indexes.get(name)
+        if index is None or (stale is not None and stale(index)):
+            with self._lock:
+                index = self._indexes.get(name)
+                if index is None or (stale is not None and stale(index)):
+                    index = build()
+                    self._indexes[name] = index
+
+        return index
+
+    def built_indexes(self):
+        """
+        Returns:
+            dict: The indexes built so far, by name.
+        """
+        with self._lock:
+            return dict(self._indexes)
+
+    def cached(self, key, build):
+        """
+        Get a value derived from this version, building it on first use.
+
+        Derived values, e.g. per word sampling tables, are dropped with the
+        snapshot, so they never outlive the ratios they were built from.
+
+        Args:
+            key (hashable): Identifies the value.
+            build (callable): Computes the value when it is not cached.
+
+        Returns:
+            object: The cached or newly built value.
+        """
+        with self._lock:
+            if key not in self._derived:
+                if len(self._derived) >= self.MAX_DERIVED:
+                    self._derived.pop(next(iter(self._derived)))
+                self._derived[key] = build()
+
+            return self._derived[key]
+
+    def is_known(self, token):
+        """Check a normalized token against the snapshot's known words."""
+        if self.lemmatizer is not None:
+            return self.lemmatizer.lemmatize(token) in self.known_words
+        return token in self.known_words
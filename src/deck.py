@@ -1,11 +1,44 @@
 import genanki
 
 from random import randint
-from src.word import Word
+from src.deck_checkpoint import Deck_checkpoint
+from src.word import Word, WordValidationError
+
+# Ways Deck can handle words that normalize to the same form
+DUPLICATE_POLICIES = ("merge", "first", "error")
 
 class Deck:
     #@FIXME Figure out how to handle language
-    def __init__(self, input_words: list, language="en"):
+    def __init__(self, input_words: list, language="en", duplicates="merge", work_dir=None, checkpoint_every=1000, resume=False, path_to_known_csv="./data/known.csv"):
+        """
+        Build the Word objects for a list of input words.
+
+        Words are interned by the normalization Word applies (strip, lower)
+        so each distinct word is constructed and packaged once.
+
+        Args:
+            input_words (list): Non-empty list of non-empty strings.
+            language (str): The language of the words. Defaults to "en".
+            duplicates (str): What to do with words that normalize to the
+                              same form. "merge" keeps one Word and records
+                              every spelling in word_sources, "first" keeps
+                              the first spelling only and "error" raises.
+            work_dir (str): Directory for checkpoints of the build. None
+                            (default) builds without checkpoints.
+            checkpoint_every (int): Words built between checkpoints.
+            resume (bool): Continue from the checkpoint in work_dir instead
+                           of starting over. A build that fails or is
+                           killed loses at most checkpoint_every words.
+            path_to_known_csv (str): Path to the CSV file containing known
+                                     words. Defaults to "./data/known.csv".
+
+        Raises:
+            ValueError: If the input is not a non-empty list of non-empty
+                        strings, the policy is unknown or duplicates is
+                        "error" and duplicates exist, or the checkpoint
+                        in work_dir belongs to a different build.
+            TypeError: If the list contains non-strings.
+        """
         if not isinstance(input_words,list):
             raise ValueError
 
@@ -18,24 +51,94 @@ class Deck:
         if any([len(elem) < 1 for elem in input_words]):
             raise ValueError
 
+        if duplicates not in DUPLICATE_POLICIES:
+            raise ValueError(f"duplicates must be one of {DUPLICATE_POLICIES}")
+
+        if isinstance(checkpoint_every, bool) or not isinstance(checkpoint_every, int) or checkpoint_every < 1:
+            raise ValueError("checkpoint_every must be a positive int")
+
         self.input_words = input_words
+        self.duplicates = duplicates
+        self.path_to_known_csv = path_to_known_csv
+
+        # Normalized form -> spellings from the input that map to it
+        self.word_sources = {}
+        unique_positions = []
+        for position, word in enumerate(self.input_words):
+            key = word.strip().lower()
+
+            if key not in self.word_sources:
+                self.word_sources[key] = [word]
+                unique_positions.append(position)
+            elif duplicates == "merge":
+                self.word_sources[key].append(word)
+            elif duplicates == "error":
+                raise ValueError(f"Duplicate word {word!r} at position {position}")
+
+        unique_words = [self.input_words[position] for position in unique_positions]
+
+        if work_dir is None:
+            # Validate and build every distinct word in one pass against a single known set
+            self.words = self._build_words(unique_words, unique_positions, 0, language, path_to_known_csv)
+            return
+
+        # Reject the whole build before the first chunk, so a bad word never
+        # leaves a partial checkpoint behind
+        try:
+            Word.validate_many(unique_words, language)
+        except WordValidationError as error:
+            raise self._input_positions(error, unique_positions, 0) from None
+
+        checkpoint = Deck_checkpoint(work_dir, language, duplicates)
+        if resume:
+            self.words = checkpoint.resume(unique_words, path_to_known_csv)
+        else:
+            checkpoint.clear()
+            self.words = []
+
+        # Build the rest in chunks, committing a checkpoint after each
+        for start in range(len(self.words), len(unique_words), checkpoint_every):
+            chunk = self._build_words(
+                unique_words[start:start + checkpoint_every], unique_positions, start, language, path_to_known_csv
+            )
+            checkpoint.save(unique_words, chunk)
+            self.words.extend(chunk)
+
+    @staticmethod
+    def _build_words(words, unique_positions, start, language, path_to_known_csv):
+        """
+        Build the distinct words starting at index start of the deduplicated list.
 
-        self.words = []
+        Raises:
+            WordValidationError: With positions in the caller's input list.
+        """
+        try:
+            return Word.from_many(words, language, path_to_known_csv=path_to_known_csv)
+        except WordValidationError as error:
+            raise Deck._input_positions(error, unique_positions, start) from None
 
-        for word in self.input_words:
-            self.words.append(Word(word,language))
+    @staticmethod
+    def _input_positions(error, unique_positions, start):
+        """
+        Report the positions of a WordValidationError for the distinct words
+        starting at index start in the caller's list, not the deduplicated one.
+        """
+        return WordValidationError([
+            (unique_positions[start + index], word, message) for index, word, message in error.errors
+        ])
 
     def create_deck(self):
         self.deck = genanki.Deck(
-                    randint(10**(15-1),(10*15)-1),
+                    randint(10**(15-1),(10**15)-1),
                     "To Add"
                 )
 
         self.media = list()
 
-        for word in self.input_words:
-            self.deck.add_note(word.get_note())
-            self.media.extend(word.get_media())
+        # Known words have no note, every other distinct word has exactly one
+        for word in self.words:
+            if word.vocab_note is not None:
+                self.deck.add_note(word.vocab_note)
 
         self.package = genanki.Package(self.deck)
         self.package.media_files = self.media
@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+
+from src.atomic_write import atomic_path
+from src.word import Word, load_known_words
+
+# Completed words, one JSON state per line, only ever appended to
+WORDS_FILE = "words.jsonl"
+# How much of WORDS_FILE belongs to the last complete checkpoint
+MANIFEST_FILE = "checkpoint.json"
+
+def _hash_words(digest, words):
+    """Extend a running hash of input words, to recognize the same build."""
+    for word in words:
+        digest.update(word.encode("utf-8"))
+        digest.update(b"\0")
+    return digest
+
+class Deck_checkpoint:
+    """
+    Periodic checkpoints of a deck build in a work directory.
+
+    Completed Words are appended to words.jsonl and made durable with
+    fsync. checkpoint.json then records how many words and bytes of that
+    file are complete, replaced atomically so a crash at any point leaves
+    the last checkpoint intact. Bytes written after it are discarded on
+    resume. Notes are not stored: they are rebuilt from the restored
+    Words and come out identical. Known status is resolved again on resume,
+    as the known words may have changed since the checkpoint.
+    """
+
+    def __init__(self, work_dir, language, duplicates):
+        """
+        Args:
+            work_dir (str): Directory holding the checkpoint, created if missing.
+            language (str): Language of the build.
+            duplicates (str): Duplicate policy of the build.
+        """
+        if not isinstance(work_dir, str) or not work_dir:
+            raise ValueError("work_dir must be a non-empty string")
+
+        os.makedirs(work_dir, exist_ok=True)
+
+        self.work_dir = work_dir
+        self.language = language
+        self.duplicates = duplicates
+        self.words_path = os.path.join(work_dir, WORDS_FILE)
+        self.manifest_path = os.path.join(work_dir, MANIFEST_FILE)
+
+        # Completed words, the size of their part of words.jsonl and their hash
+        self.completed = 0
+        self.offset = 0
+        self._digest = hashlib.blake2b(digest_size=16)
+
+    def clear(self):
+        """Discard any previous checkpoint and start an empty one."""
+        for path in (self.manifest_path, self.words_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+        self.completed = 0
+        self.offset = 0
+        self._digest = hashlib.blake2b(digest_size=16)
+
+    def resume(self, input_words, path_to_known_csv="./data/known.csv"):
+        """
+        Restore the words completed by the last checkpoint.
+
+        Args:
+            input_words (list): The distinct input words of this build, in
+                                build order.
+            path_to_known_csv (str): Known words of this build, which decide
+                                     the known status of restored words.
+
+        Returns:
+            list: Restored Words for a prefix of input_words, empty if
+                  there is no checkpoint or its words file is missing or
+                  shorter than the manifest records.
+
+        Raises:
+            ValueError: If the checkpoint belongs to a different build.
+        """
+        if not os.path.exists(self.manifest_path):
+            self.clear()
+            return []
+
+        with open(self.manifest_path, encoding="utf-8") as file:
+            manifest = json.load(file)
+
+        completed = manifest["completed"]
+        digest = _hash_words(hashlib.blake2b(digest_size=16), input_words[:completed])
+        if (
+            manifest["language"] != self.language
+            or manifest["duplicates"] != self.duplicates
+            or completed > len(input_words)
+            or manifest["prefix_hash"] != digest.hexdigest()
+        ):
+            raise ValueError(f"The checkpoint in {self.work_dir} belongs to a different build")
+
+        # The words never became durable, nothing can be restored
+        if not os.path.exists(self.words_path) or os.path.getsize(self.words_path) < manifest["offset"]:
+            self.clear()
+            return []
+
+        known_words = load_known_words(path_to_known_csv)
+
+        words = []
+        with open(self.words_path, "rb") as file:
+            for line in file.read(manifest["offset"]).splitlines():
+                word = Word.from_state(json.loads(line))
+                word.path_to_known_csv = path_to_known_csv
+                word.known_word = word.word in known_words
+                words.append(word)
+
+        # Drop anything written after the checkpoint
+        with open(self.words_path, "r+b") as file:
+            file.truncate(manifest["offset"])
+
+        self.completed = completed
+        self.offset = manifest["offset"]
+        self._digest = digest
+        return words
+
+    def save(self, input_words, words):
+        """
+        Append newly completed words and commit a checkpoint covering them.
+
+        Args:
+            input_words (list): The distinct input words of the build.
+            words (list): Words completed since the last checkpoint, for
+                          the next len(words) input words.
+        """
+        with open(self.words_path, "ab") as file:
+            for word in words:
+                file.write(json.dumps(word.to_state(), ensure_ascii=False).encode("utf-8") + b"\n")
+            file.flush()
+            os.fsync(file.fileno())
+            offset = file.tell()
+
+        completed = self.completed + len(words)
+        _hash_words(self._digest, input_words[self.completed:completed])
+        manifest = {
+            "language": self.language,
+            "duplicates": self.duplicates,
+            "completed": completed,
+            "offset": offset,
+            "prefix_hash": self._digest.hexdigest()
+        }
+
+        # Replaced atomically so a crash never leaves a half-written manifest
+        with atomic_path(self.manifest_path) as temporary_path, open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(manifest, file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        self.completed = completed
+        self.offset = offset
@@ -0,0 +1,171 @@
+import csv
+import gzip
+import io
+import json
+
+from itertools import islice
+
+from src.atomic_write import atomic_path
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Bytes buffered before compressing and writing to disk
+DEFAULT_BUFFER_SIZE = 1 << 20
+# Fast enough to keep up with the disk, still close to the best ratio
+GZIP_LEVEL = 6
+
+def _open_output(path, buffer_size):
+    """
+    Open a file for buffered text writes, compressing .gz and .zst.
+
+    Args:
+        path (str): Path of the file.
+        buffer_size (int): Bytes buffered in front of the compressor.
+
+    Returns:
+        file: A text file object.
+
+    Raises:
+        ImportError: If path ends with .zst and zstandard is not installed.
+    """
+    if path.endswith(".zst"):
+        if zstandard is None:
+            raise ImportError("Writing .zst files requires the zstandard package")
+        binary = zstandard.open(path, "wb")
+    elif path.endswith(".gz"):
+        binary = gzip.open(path, "wb", compresslevel=GZIP_LEVEL)
+    else:
+        binary = open(path, "wb", buffering=0)
+
+    return io.TextIOWrapper(
+        io.BufferedWriter(binary, buffer_size),
+        encoding="utf-8",
+        newline=""
+    )
+
+def _note_rows(deck, sentence_bank, num_sentences):
+    """
+    Stream the words of a deck that would get a note, with their sentences.
+
+    Only one word's sentences are held at a time, and no genanki notes
+    are built.
+
+    Yields:
+        tuple: (word, list of Sentence records)
+    """
+    for word in deck.words:
+        if word.known_word:
+            continue
+
+        if sentence_bank is None:
+            yield word.word, []
+        else:
+            yield word.word, list(islice(sentence_bank.iter_sentences(word.word), num_sentences))
+
+def _export(path, write_rows, buffer_size):
+    """Write through a temporary file and move it in place once complete."""
+    if not isinstance(path, str) or not path:
+        raise ValueError("path must be a non-empty string")
+
+    if isinstance(buffer_size, bool) or not isinstance(buffer_size, int) or buffer_size <= 0:
+        raise ValueError("buffer_size must be a positive int")
+
+    # The temporary file keeps the extension, so it is compressed the same way
+    with atomic_path(path) as temporary_path, _open_output(temporary_path, buffer_size) as file:
+        return write_rows(file)
+
+def _validate_num_sentences(num_sentences):
+    if isinstance(num_sentences, bool) or not isinstance(num_sentences, int) or num_sentences < 0:
+        raise ValueError("num_sentences must be a non-negative int")
+
+def export_tsv(deck, path, sentence_bank=None, num_sentences=1, buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Export the notes of a deck as a file for Anki's plain text import.
+
+    One line per unknown word with columns "Word", "Sentence 1",
+    "Meaning 1", ... up to num_sentences, preceded by the header lines
+    Anki reads the separator and column names from. Much cheaper than
+    building an .apkg with Deck.create_deck for very large decks.
+
+    Args:
+        deck (Deck): The deck to export.
+        path (str): Output path. ".gz" and ".zst" paths are compressed.
+        sentence_bank (Sentence_bank): Bank to take each word's highest
+                                       ratio sentences from. None exports
+                                       words only.
+        num_sentences (int): Sentences per word. Defaults to 1.
+        buffer_size (int): Bytes buffered per write to disk.
+
+    Returns:
+        int: The number of notes written.
+
+    Raises:
+        ValueError: If the arguments are invalid.
+        ImportError: If path ends with .zst and zstandard is not installed.
+    """
+    _validate_num_sentences(num_sentences)
+
+    columns = ["Word"]
+    if sentence_bank is not None:
+        for i in range(1, num_sentences + 1):
+            columns.extend([f"Sentence {i}", f"Meaning {i}"])
+
+    def write_rows(file):
+        file.write("#separator:tab\n#html:false\n")
+        file.write("#columns:" + "\t".join(columns) + "\n")
+
+        writer = csv.writer(file, delimiter="\t", lineterminator="\n")
+        count = 0
+        for word, sentences in _note_rows(deck, sentence_bank, num_sentences):
+            row = [word]
+            if sentence_bank is not None:
+                for sentence in sentences:
+                    row.extend([sentence.sentence, sentence.meaning])
+                # Every line has the same number of columns
+                row.extend([""] * (len(columns) - len(row)))
+            writer.writerow(row)
+            count += 1
+        return count
+
+    return _export(path, write_rows, buffer_size)
+
+def export_jsonl(deck, path, sentence_bank=None, num_sentences=1, buffer_size=DEFAULT_BUFFER_SIZE):
+    """
+    Export the notes of a deck as JSON Lines.
+
+    One object per unknown word, e.g.
+    {"Word": "火车", "Sentences": [{"Sentence": ..., "Meaning": ..., "Custom Ratio": ...}]}
+
+    Args:
+        deck (Deck): The deck to export.
+        path (str): Output path. ".gz" and ".zst" paths are compressed.
+        sentence_bank (Sentence_bank): Bank to take each word's highest
+                                       ratio sentences from. None leaves
+                                       "Sentences" empty.
+        num_sentences (int): Sentences per word. Defaults to 1.
+        buffer_size (int): Bytes buffered per write to disk.
+
+    Returns:
+        int: The number of notes written.
+
+    Raises:
+        ValueError: If the arguments are invalid.
+        ImportError: If path ends with .zst and zstandard is not installed.
+    """
+    _validate_num_sentences(num_sentences)
+
+    def write_rows(file):
+        count = 0
+        for word, sentences in _note_rows(deck, sentence_bank, num_sentences):
+            file.write(json.dumps(
+                {"Word": word, "Sentences": [sentence.to_dict() for sentence in sentences]},
+                ensure_ascii=False
+            ))
+            file.write("\n")
+            count += 1
+        return count
+
+    return _export(path, write_rows, buffer_size)
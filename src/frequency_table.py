@@ -0,0 +1,273 @@
+import hashlib
+import pandas as pd
+
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from src.atomic_write import atomic_path
+
+def count_tokens(token_lists):
+    """
+    Count the tokens of one chunk of sentences.
+
+    Args:
+        token_lists (iterable): Token tuples, one per sentence.
+
+    Returns:
+        Counter: Token to number of occurrences.
+    """
+    counts = Counter()
+    for tokens in token_lists:
+        counts.update(tokens)
+    return counts
+
+def sentences_hash(sentences, running=None):
+    """
+    Hash sentences in row order, so a table can tell which rows it counted.
+
+    Args:
+        sentences (iterable): Stripped sentence strings.
+        running (hash): Hash of the preceding sentences, left unchanged.
+                        None starts a new hash.
+
+    Returns:
+        hash: A blake2b hash object covering the preceding sentences and
+              these ones.
+    """
+    running = hashlib.blake2b(digest_size=16) if running is None else running.copy()
+    for sentence in sentences:
+        encoded = sentence.encode("utf-8")
+        # Length prefixes keep ("ab", "c") and ("a", "bc") apart
+        running.update(len(encoded).to_bytes(8, "little"))
+        running.update(encoded)
+    return running
+
+def frequency_table_path(path_to_sentences_tsv):
+    """
+    Get the path a bank's frequency table is persisted to.
+
+    Args:
+        path_to_sentences_tsv (str): Path of the sentence bank TSV.
+
+    Returns:
+        str: The same path with ".tsv" replaced by ".freq.tsv".
+    """
+    return path_to_sentences_tsv[:-len(".tsv")] + ".freq.tsv"
+
+class Frequency_table:
+    """
+    Corpus token frequencies with fast frequency and rank lookups.
+
+    Counts are built in chunks (optionally in a process pool) and merged,
+    so tables of separate shards can be merged as well. Ranks are computed
+    lazily and cached until the counts change.
+
+    A table can carry the hash of the sentences it counted (see
+    sentences_hash), which is saved with it so a persisted table is only
+    reused for the rows it was built from.
+    """
+
+    def __init__(self, counts=None, sentence_count=0, source=None):
+        """
+        Args:
+            counts (Counter): Initial token counts. Defaults to empty.
+            sentence_count (int): Number of sentences the counts cover.
+            source (hash): sentences_hash of the counted sentences in row
+                           order, or None if unknown.
+        """
+        self.counts = Counter(counts) if counts is not None else Counter()
+        self.sentence_count = sentence_count
+        self.source = source
+        # File the table is kept saved to as sentences are added, if any
+        self.path = None
+        self._ranks = None
+
+    @classmethod
+    def from_token_lists(cls, token_lists, chunk_size=10000, workers=None):
+        """
+        Count tokens in a streaming, chunked pass.
+
+        Args:
+            token_lists (iterable): Token tuples, one per sentence.
+            chunk_size (int): Sentences counted per chunk.
+            workers (int): Worker processes. None or 1 counts in process.
+
+        Returns:
+            Frequency_table: The merged counts of every chunk.
+
+        Raises:
+            ValueError: If chunk_size or workers is invalid.
+        """
+        if isinstance(chunk_size, bool) or not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("chunk_size must be a positive int")
+
+        if workers is not None and (isinstance(workers, bool) or not isinstance(workers, int) or workers < 1):
+            raise ValueError("workers must be a positive int")
+
+        table = cls()
+
+        def chunks():
+            # Sentences are counted here, in the calling process
+            chunk = []
+            for tokens in token_lists:
+                chunk.append(tokens)
+                if len(chunk) == chunk_size:
+                    table.sentence_count += len(chunk)
+                    yield chunk
+                    chunk = []
+            if chunk:
+                table.sentence_count += len(chunk)
+                yield chunk
+
+        if workers is not None and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for chunk_counts in executor.map(count_tokens, chunks()):
+                    table.counts.update(chunk_counts)
+        else:
+            for chunk in chunks():
+                table.counts.update(count_tokens(chunk))
+
+        return table
+
+    @classmethod
+    def from_sentence_bank(cls, sentence_bank, chunk_size=10000, workers=None):
+        """
+        Count the tokens of every sentence in a Sentence_bank.
+
+        Args:
+            sentence_bank (Sentence_bank): The bank to count.
+            chunk_size (int): Sentences counted per chunk.
+            workers (int): Worker processes. None or 1 counts in process.
+
+        Returns:
+            Frequency_table: The bank's token frequencies.
+        """
+        return cls.from_token_lists(sentence_bank.snapshot().frame["Tokens"], chunk_size, workers)
+
+    @property
+    def source_key(self):
+        """
+        Returns:
+            str: Hex digest of the counted sentences, or None if unknown.
+        """
+        return self.source.hexdigest() if self.source is not None else None
+
+    def update(self, token_lists, sentences=None):
+        """
+        Add the tokens of newly added sentences.
+
+        Args:
+            token_lists (iterable): Token tuples, one per new sentence.
+            sentences (list): The new sentences' texts, extending the
+                              source hash. Without them the source is
+                              no longer known.
+        """
+        for tokens in token_lists:
+            self.counts.update(tokens)
+            self.sentence_count += 1
+
+        if sentences is not None and self.source is not None:
+            self.source = sentences_hash(sentences, self.source)
+        else:
+            self.source = None
+        self._ranks = None
+
+    def merge(self, other):
+        """
+        Add the counts of another table, e.g. of another shard. The merged
+        table's source is no longer known.
+
+        Args:
+            other (Frequency_table): The table to merge in.
+        """
+        self.counts.update(other.counts)
+        self.sentence_count += other.sentence_count
+        self.source = None
+        self._ranks = None
+
+    def frequency(self, token):
+        """
+        Args:
+            token (str): A normalized token.
+
+        Returns:
+            int: Number of occurrences of the token, 0 if never seen.
+        """
+        return self.counts.get(token, 0)
+
+    def rank(self, token):
+        """
+        Get the frequency rank of a token, 1 being the most frequent.
+        Ties are ordered alphabetically so ranks are stable.
+
+        Args:
+            token (str): A normalized token.
+
+        Returns:
+            int: The rank, or None if the token was never seen.
+        """
+        if self._ranks is None:
+            ordered = sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))
+            self._ranks = {token: rank for rank, (token, _) in enumerate(ordered, start=1)}
+
+        return self._ranks.get(token)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def save(self, path):
+        """
+        Persist the table as a TSV whose first line records the number of
+        sentences counted and their source key.
+
+        Args:
+            path (str): Path of the TSV file to write.
+        """
+        with atomic_path(path) as temporary_path, open(temporary_path, "w", encoding="utf-8", newline="") as file:
+            file.write(f"# sentences\t{self.sentence_count}\t{self.source_key or ''}\n")
+            pd.DataFrame({
+                "Token": list(self.counts.keys()),
+                "Count": list(self.counts.values())
+            }, columns=["Token", "Count"]).to_csv(file, sep="\t", index=False)
+
+    @classmethod
+    def load(cls, path, sentences=None):
+        """
+        Load a table written by save.
+
+        Args:
+            path (str): Path of the TSV file.
+            sentences (list): The bank's sentences in row order. When given,
+                              the table is only returned if it was counted
+                              from a prefix of them, and its source hash is
+                              restored so later updates extend it.
+
+        Returns:
+            Frequency_table: The loaded table, or None if it does not match
+                             sentences.
+
+        Raises:
+            ValueError: If the file is not a frequency table.
+        """
+        with open(path, encoding="utf-8") as file:
+            header = file.readline().rstrip("\n").split("\t")
+            # Tables saved before source keys have no third field
+            if len(header) not in (2, 3) or header[0] != "# sentences":
+                raise ValueError(f"{path} is not a frequency table")
+
+            sentence_count = int(header[1])
+            source_key = header[2] if len(header) == 3 and header[2] else None
+
+            source = None
+            if sentences is not None:
+                if source_key is None or sentence_count > len(sentences):
+                    return None
+
+                source = sentences_hash(islice(sentences, sentence_count))
+                if source.hexdigest() != source_key:
+                    return None
+
+            frequency_df = pd.read_csv(file, sep="\t", dtype={"Token": str}, keep_default_na=False)
+
+        return cls(dict(zip(frequency_df["Token"], frequency_df["Count"].astype(int))), sentence_count, source)
@@ -0,0 +1,190 @@
+import unicodedata
+
+def fold_accents(text):
+    """
+    Remove accents and other combining marks, e.g. "está" -> "esta".
+
+    Args:
+        text (str): Text to fold.
+
+    Returns:
+        str: The text without combining marks, NFC-normalized.
+    """
+    decomposed = unicodedata.normalize("NFD", text)
+    return unicodedata.normalize("NFC", "".join(c for c in decomposed if not unicodedata.combining(c)))
+
+def edit_distance(first, second, max_distance):
+    """
+    Optimal string alignment distance (Levenshtein plus adjacent
+    transpositions), giving up once it must exceed max_distance.
+
+    Args:
+        first (str): First string.
+        second (str): Second string.
+        max_distance (int): Largest distance of interest.
+
+    Returns:
+        int: The distance, or max_distance + 1 if it is larger.
+    """
+    if abs(len(first) - len(second)) > max_distance:
+        return max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len(second) + 1))
+    for i in range(1, len(first) + 1):
+        current = [i] + [0] * len(second)
+        for j in range(1, len(second) + 1):
+            cost = 0 if first[i - 1] == second[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and i > 1 and j > 1
+                    and first[i - 1] == second[j - 2] and first[i - 2] == second[j - 1]):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+
+    return previous[-1] if previous[-1] <= max_distance else max_distance + 1
+
+def _deletes(term, max_distance):
+    """Every string reachable from term by deleting up to max_distance characters."""
+    variants = {term}
+    frontier = {term}
+    for _ in range(max_distance):
+        frontier = {variant[:i] + variant[i + 1:] for variant in frontier for i in range(len(variant))}
+        variants |= frontier
+    return variants
+
+class Fuzzy_index:
+    """
+    Typo and accent tolerant lookup over a token vocabulary (SymSpell).
+
+    Every term is accent folded and all its deletions up to max_distance
+    characters (within the first prefix_length characters) are
+    precomputed into a hash table. A lookup only generates the deletions of
+    the query, collects the terms sharing one and verifies their real edit
+    distance, so its cost does not grow with the vocabulary.
+    """
+
+    def __init__(self, vocabulary, max_distance=2, prefix_length=7):
+        """
+        Build the deletes table.
+
+        Args:
+            vocabulary (iterable): Normalized tokens to index.
+            max_distance (int): Largest edit distance lookups may ask for.
+            prefix_length (int): Characters of each term used for deletes.
+
+        Raises:
+            ValueError: If max_distance or prefix_length is invalid.
+        """
+        if isinstance(max_distance, bool) or not isinstance(max_distance, int) or max_distance < 0:
+            raise ValueError("max_distance must be a non-negative int")
+
+        if isinstance(prefix_length, bool) or not isinstance(prefix_length, int) or prefix_length <= max_distance:
+            raise ValueError("prefix_length must be an int greater than max_distance")
+
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+
+        # Folded term -> original terms, and delete variant -> folded terms
+        self.terms = {}
+        self.deletes = {}
+
+        for term in vocabulary:
+            self.add(term)
+
+    def add(self, term):
+        """
+        Index one more term.
+
+        Args:
+            term (str): A normalized token.
+        """
+        folded = fold_accents(term)
+
+        if folded in self.terms:
+            self.terms[folded].add(term)
+            return
+
+        self.terms[folded] = {term}
+        for variant in _deletes(folded[:self.prefix_length], self.max_distance):
+            self.deletes.setdefault(variant, set()).add(folded)
+
+    def extended(self, terms):
+        """
+        Get a copy with more terms indexed, leaving this index as it is.
+
+        Only the entries the new terms change are copied, every other one
+        is shared with this index.
+
+        Args:
+            terms (iterable): Normalized tokens to add.
+
+        Returns:
+            Fuzzy_index: The extended copy.
+        """
+        index = Fuzzy_index((), self.max_distance, self.prefix_length)
+        index.terms = dict(self.terms)
+        index.deletes = dict(self.deletes)
+
+        copied_terms = set()
+        copied_deletes = set()
+        for term in terms:
+            folded = fold_accents(term)
+            spellings = index.terms.get(folded)
+            if spellings is not None and term in spellings:
+                continue
+
+            if folded not in copied_terms:
+                index.terms[folded] = set(spellings or ())
+                copied_terms.add(folded)
+            index.terms[folded].add(term)
+
+            # Deletes only depend on the folded term, a known one has them
+            if spellings:
+                continue
+
+            for variant in _deletes(folded[:self.prefix_length], self.max_distance):
+                if variant not in copied_deletes:
+                    index.deletes[variant] = set(index.deletes.get(variant, ()))
+                    copied_deletes.add(variant)
+                index.deletes[variant].add(folded)
+
+        return index
+
+    def __len__(self):
+        return len(self.terms)
+
+    def lookup(self, word, max_distance):
+        """
+        Find indexed terms within max_distance edits of a word, ignoring accents.
+
+        Args:
+            word (str): A normalized word.
+            max_distance (int): Largest edit distance to accept.
+
+        Returns:
+            list: Matching original terms, closest first, then alphabetical.
+
+        Raises:
+            ValueError: If max_distance is larger than the index supports.
+        """
+        if isinstance(max_distance, bool) or not isinstance(max_distance, int) or max_distance < 0:
+            raise ValueError("max_distance must be a non-negative int")
+
+        if max_distance > self.max_distance:
+            raise ValueError(f"max_distance must be at most {self.max_distance} for this index")
+
+        folded = fold_accents(word)
+
+        candidates = set()
+        for variant in _deletes(folded[:self.prefix_length], max_distance):
+            candidates |= self.deletes.get(variant, set())
+
+        matches = []
+        for candidate in candidates:
+            distance = edit_distance(folded, candidate, max_distance)
+            if distance <= max_distance:
+                matches.extend((distance, term) for term in self.terms[candidate])
+
+        return [term for _, term in sorted(matches)]
@@ -0,0 +1,224 @@
+import hashlib
+import io
+import os
+import pandas as pd
+import threading
+
+# Bytes read per step when hashing the consumed part of the TSV
+HASH_CHUNK_SIZE = 1 << 20
+
+class File_watcher:
+    """
+    Detects changes of a file by polling its modification time, size and inode.
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): The file to watch. It may not exist yet.
+        """
+        self.path = path
+        self.stat = self._stat()
+
+    def _stat(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def changed(self):
+        """
+        Check whether the file changed since the last call.
+
+        Returns:
+            bool: True if its modification time, size or inode changed,
+                  or it appeared or disappeared.
+        """
+        stat = self._stat()
+        if stat == self.stat:
+            return False
+        self.stat = stat
+        return True
+
+def _prefix_hash(file, end):
+    """Running hash of the bytes before end, extendable with update."""
+    digest = hashlib.blake2b(digest_size=16)
+    file.seek(0)
+    remaining = end
+    while remaining > 0:
+        chunk = file.read(min(remaining, HASH_CHUNK_SIZE))
+        if not chunk:
+            break
+        digest.update(chunk)
+        remaining -= len(chunk)
+    return digest
+
+class Hot_reloader:
+    """
+    Keeps a Sentence_bank in step with its sentences TSV and known words
+    file in a long-running process.
+
+    Rows appended to the TSV are parsed on their own and added with
+    add_sentences, ranked in the same snapshot when the bank is ranked.
+    The file counts as appended to when the bytes already consumed still
+    hash the same, so any other edit, wherever it is, reloads the bank. A changed known words
+    file re-ranks only the sentences containing words that became known or
+    unknown (update_known_words). Every change is published as a new bank
+    snapshot, so queries already running finish on the state they started
+    with.
+
+    Files are polled: call poll yourself or start a background thread.
+    """
+
+    def __init__(self, sentence_bank, known_words_path=None, interval=1.0):
+        """
+        Args:
+            sentence_bank (Sentence_bank): The bank to keep current. When a
+                                           known words path is given it must
+                                           already be ranked.
+            known_words_path (str): Optional known words CSV to watch, as
+                                    accepted by rank_sentences.
+            interval (float): Seconds between polls of the background thread.
+
+        Raises:
+            ValueError: If interval is not positive or a known words path is
+                        given for a bank that was never ranked.
+        """
+        if isinstance(interval, bool) or not isinstance(interval, (int, float)) or interval <= 0:
+            raise ValueError("interval must be a positive number")
+
+        if known_words_path is not None and sentence_bank.known_words is None:
+            raise ValueError("rank_sentences must be called before watching known words")
+
+        self.sentence_bank = sentence_bank
+        self.known_words_path = known_words_path
+        self.interval = interval
+
+        self.sentences_watcher = File_watcher(sentence_bank.path_to_sentences_tsv)
+        self.known_words_watcher = File_watcher(known_words_path) if known_words_path is not None else None
+
+        # Bytes of the TSV already in the bank and a running hash of them
+        with open(sentence_bank.path_to_sentences_tsv, "rb") as file:
+            self.offset = file.seek(0, os.SEEK_END)
+            self._digest = _prefix_hash(file, self.offset)
+
+        # Error of the last failed background poll, if any
+        self.last_error = None
+
+        self._stop = threading.Event()
+        self._thread = None
+
+    def poll(self):
+        """
+        Apply changes made to the watched files since the last poll.
+
+        Returns:
+            dict: What was applied, with "appended" (number of rows),
+                  "reloaded" (bool), "known_added" and "known_removed" (sets).
+
+        Raises:
+            ValueError: If the changed files are invalid. The bank keeps its
+                        previous state.
+        """
+        result = {"appended": 0, "reloaded": False, "known_added": set(), "known_removed": set()}
+
+        if self.sentences_watcher.changed() and self.sentences_watcher.stat is not None:
+            appended, offset, digest = self._read_appended()
+
+            if appended is None:
+                self.sentence_bank.reload()
+                result["reloaded"] = True
+            elif len(appended) > 0:
+                # A ranked bank ranks new rows like the rest, in one snapshot
+                self.sentence_bank.add_sentences(
+                    list(appended["Sentence"]),
+                    list(appended["Meaning"]),
+                    list(appended["Custom Ratio"]),
+                    rank=self.sentence_bank.known_words is not None
+                )
+                result["appended"] = len(appended)
+
+            # Only consumed once applied, invalid rows are read again after the next edit
+            self.offset, self._digest = offset, digest
+
+        if self.known_words_watcher is not None and self.known_words_watcher.changed():
+            result["known_added"], result["known_removed"] = self.sentence_bank.update_known_words(
+                self.known_words_path
+            )
+
+        return result
+
+    def _read_appended(self):
+        """
+        Parse the complete rows appended to the TSV since the last read.
+
+        The file counts as appended to when it did not shrink and every
+        byte before the old end hashes as before, so a touch or a save
+        with the same content reads no rows. Hashing the whole consumed part
+        costs one sequential read per change, which also catches edits far
+        from the end. A final line without newline is left for the next
+        poll.
+
+        Returns:
+            tuple: (rows, offset, digest) where rows is a DataFrame of the
+                   new rows, cleaned like Sentence_bank cleans its columns,
+                   or None if the file was edited otherwise, offset is the
+                   end of what was read and digest the running hash of the
+                   bytes before it.
+        """
+        with open(self.sentence_bank.path_to_sentences_tsv, "rb") as file:
+            size = file.seek(0, os.SEEK_END)
+            if size < self.offset or _prefix_hash(file, self.offset).digest() != self._digest.digest():
+                return None, size, _prefix_hash(file, size)
+
+            file.seek(self.offset)
+            appended = file.read(size - self.offset)
+            complete = appended[:appended.rfind(b"\n") + 1]
+            end = self.offset + len(complete)
+
+            digest = self._digest.copy()
+            digest.update(complete)
+
+            if not complete:
+                return pd.DataFrame(columns=["Sentence", "Meaning", "Custom Ratio"]), end, digest
+
+            file.seek(0)
+            header = file.readline()
+
+        rows = pd.read_csv(io.BytesIO(header + complete), sep="\t")
+        for column_name in ["Sentence", "Meaning", "Custom Ratio"]:
+            if column_name not in rows.columns:
+                raise ValueError(f"Column {column_name} not found in appended rows")
+
+        rows["Sentence"] = rows["Sentence"].fillna("").astype(str)
+        rows["Meaning"] = rows["Meaning"].fillna("").astype(str)
+        rows["Custom Ratio"] = pd.to_numeric(rows["Custom Ratio"].fillna(0).astype(float))
+        return rows, end, digest
+
+    def start(self):
+        """Poll every interval seconds in a daemon thread until stop."""
+        if self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread and wait for it."""
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.poll()
+                self.last_error = None
+            except Exception as error:
+                # A half-written or invalid file is retried on the next change
+                self.last_error = error
@@ -0,0 +1,92 @@
+import pandas as pd
+
+from functools import lru_cache
+from src.sentence_bank import normalize_text
+
+class Lemmatizer:
+    """
+    Maps inflected surface forms to their lemmas using a local table.
+
+    The TSV file must contain at least two columns:
+    - "Form": An inflected surface form, e.g. "estás"
+    - "Lemma": The lemma of that form, e.g. "estar"
+
+    The table is loaded once into a dict keyed by normalized form, so each
+    lookup is a single hash probe.
+    """
+
+    def __init__(self, path_to_lemma_tsv):
+        """
+        Load the inflection table.
+
+        Args:
+            path_to_lemma_tsv (str): Path to the TSV file of forms and lemmas.
+
+        Raises:
+            ValueError: If the path is invalid or required columns are missing.
+        """
+        if not isinstance(path_to_lemma_tsv, str) or not path_to_lemma_tsv:
+            raise ValueError("path_to_lemma_tsv must be a non-empty string")
+
+        if not path_to_lemma_tsv.split('.')[-1] == "tsv":
+            raise ValueError("path_to_lemma_tsv must end with .tsv")
+
+        lemma_df = pd.read_csv(path_to_lemma_tsv, sep='\t', dtype=str)
+
+        REQUIRED_LEMMA_COLUMNS = ["Form", "Lemma"]
+        for column_name in REQUIRED_LEMMA_COLUMNS:
+            if column_name not in lemma_df.columns:
+                raise ValueError(
+                    f"Column {column_name} not found. Expected at least '{REQUIRED_LEMMA_COLUMNS}', "
+                    f"but found {lemma_df.columns}"
+                )
+
+        self.path_to_lemma_tsv = path_to_lemma_tsv
+
+        # Precompute the surface form -> lemma hash table
+        self.lemmas = {
+            normalize_text(form.strip()): normalize_text(lemma.strip())
+            for form, lemma in zip(lemma_df["Form"], lemma_df["Lemma"])
+            if isinstance(form, str) and isinstance(lemma, str) and form.strip() and lemma.strip()
+        }
+
+    def lemmatize(self, token):
+        """
+        Get the lemma of an already normalized token.
+
+        Args:
+            token (str): Token normalized with normalize_text.
+
+        Returns:
+            str: The lemma, or the token itself if it is not in the table.
+        """
+        return self.lemmas.get(token, token)
+
+    def lemmatize_all(self, tokens):
+        """
+        Get the set of lemmas of many already normalized tokens.
+
+        Args:
+            tokens (iterable): Tokens normalized with normalize_text.
+
+        Returns:
+            set: The lemmas of the tokens.
+        """
+        lemmas = self.lemmas
+        return set(lemmas.get(token, token) for token in tokens)
+
+    def __len__(self):
+        return len(self.lemmas)
+
+@lru_cache(maxsize=None)
+def load_lemmatizer(path_to_lemma_tsv):
+    """
+    Load a Lemmatizer, reusing the table if the path was loaded before.
+
+    Args:
+        path_to_lemma_tsv (str): Path to the TSV file of forms and lemmas.
+
+    Returns:
+        Lemmatizer: The shared lemmatizer for the path.
+    """
+    return Lemmatizer(path_to_lemma_tsv)
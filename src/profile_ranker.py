@@ -0,0 +1,124 @@
+import numpy as np
+
+from src.sentence_bank import load_known_set
+
+class Profile_ranker:
+    """
+    Ranks one Sentence_bank for many learner profiles at once.
+
+    The bank is turned into a sparse sentence x token incidence matrix in
+    CSR form once (row pointers, token ids, implicit data of 1 per token
+    occurrence). Each profile's known words become a 0/1 vector over the
+    token vocabulary, so known counts for a batch of profiles are a single
+    sparse matrix x dense matrix product. The bank itself is never mutated.
+    """
+
+    def __init__(self, sentence_bank, lemmatizer=None):
+        """
+        Build the incidence matrix of a bank.
+
+        Args:
+            sentence_bank (Sentence_bank): The bank to rank.
+            lemmatizer (Lemmatizer): Optional lemmatizer so known words and
+                                     tokens are compared by lemma.
+        """
+        self.vocabulary, self.token_ids, self.offsets = sentence_bank.encode_tokens()
+        self.token_counts = np.diff(self.offsets)
+        self.lemmatizer = lemmatizer
+
+        # Lemma of every vocabulary entry, looked up once
+        if lemmatizer is not None:
+            self._vocabulary_lemmas = [lemmatizer.lemmatize(token) for token in self.vocabulary]
+        else:
+            self._vocabulary_lemmas = self.vocabulary
+
+    def known_vector(self, known_words_path):
+        """
+        Build the known vector of one profile.
+
+        Args:
+            known_words_path (str or iterable): Path to a known words CSV
+                                                or the known words themselves.
+
+        Returns:
+            array: uint8 array over the vocabulary, 1 for known tokens.
+        """
+        known_words = load_known_set(known_words_path)
+        if self.lemmatizer is not None:
+            known_words = self.lemmatizer.lemmatize_all(known_words)
+
+        return np.fromiter(
+            (token in known_words for token in self._vocabulary_lemmas),
+            dtype=np.uint8,
+            count=len(self.vocabulary)
+        )
+
+    def known_counts(self, known_matrix):
+        """
+        Multiply the incidence matrix by a vocabulary x profiles matrix.
+
+        Args:
+            known_matrix (array): vocabulary x profiles 0/1 matrix.
+
+        Returns:
+            array: sentences x profiles matrix of known token counts.
+        """
+        # Gather every token occurrence's row of the known matrix, then sum
+        # per sentence through prefix sums (empty sentences give 0). The
+        # sums never exceed the token total, so int32 is enough below 2**31
+        gathered = known_matrix[self.token_ids]
+        dtype = np.int32 if len(self.token_ids) < 2 ** 31 else np.int64
+        cumulative = np.zeros((len(self.token_ids) + 1, known_matrix.shape[1]), dtype=dtype)
+        np.cumsum(gathered, axis=0, out=cumulative[1:])
+
+        return cumulative[self.offsets[1:]] - cumulative[self.offsets[:-1]]
+
+    def rank(self, profiles, batch_size=64):
+        """
+        Compute Custom Ratios of every sentence for many profiles.
+
+        Args:
+            profiles (dict): Profile name to known words CSV path or
+                             iterable of known words.
+            batch_size (int): Profiles multiplied together per batch, which
+                              bounds the temporary memory to about
+                              tokens x batch_size x 5 bytes (uint8
+                              gathered flags plus int32 prefix sums).
+
+        Returns:
+            dict: Profile name to a float array of ratios in row order,
+                  equal to what rank_sentences would store.
+
+        Raises:
+            ValueError: If profiles is not a dict or batch_size is invalid.
+        """
+        if not isinstance(profiles, dict):
+            raise ValueError("Profiles must be a dict of name to known words")
+
+        if isinstance(batch_size, bool) or not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError("batch_size must be a positive int")
+
+        names = list(profiles)
+        results = {}
+
+        for batch_start in range(0, len(names), batch_size):
+            batch = names[batch_start:batch_start + batch_size]
+
+            known_matrix = np.empty((len(self.vocabulary), len(batch)), dtype=np.uint8)
+            for column, name in enumerate(batch):
+                known_matrix[:, column] = self.known_vector(profiles[name])
+
+            counts = self.known_counts(known_matrix)
+
+            # Ratio of known tokens, 0 for sentences without tokens
+            ratios = np.divide(
+                counts,
+                self.token_counts[:, None],
+                out=np.zeros(counts.shape, dtype=float),
+                where=self.token_counts[:, None] > 0
+            )
+
+            for column, name in enumerate(batch):
+                results[name] = ratios[:, column].copy()
+
+        return results
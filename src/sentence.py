@@ -1,3 +1,98 @@
 class Sentence:
-    def __init__(self, sentence):
-        self.sentence = sentence
+    """
+    A compact, immutable record of one sentence bank row.
+
+    Records are built in bulk from the bank's column arrays and only hold
+    references to the column's string objects, so no text is copied. For
+    existing callers they also behave like the dicts get_sentences used to
+    return, e.g. sentence["Sentence"] or dict(sentence). Attributes cannot
+    be set after construction, so records are hashable and can be shared
+    between callers; use to_dict() for a mutable copy.
+    """
+
+    __slots__ = ("sentence", "meaning", "custom_ratio")
+
+    # Dict key of every attribute, in dict order
+    KEYS = {"Sentence": "sentence", "Meaning": "meaning", "Custom Ratio": "custom_ratio"}
+
+    def __init__(self, sentence, meaning="", custom_ratio=0.0):
+        """
+        Args:
+            sentence (str): The text of the sentence.
+            meaning (str): The meaning of the sentence. Defaults to "".
+            custom_ratio (float): The sentence's Custom Ratio. Defaults to 0.0.
+        """
+        object.__setattr__(self, "sentence", sentence)
+        object.__setattr__(self, "meaning", meaning)
+        object.__setattr__(self, "custom_ratio", custom_ratio)
+
+    @classmethod
+    def from_columns(cls, sentences, meanings, custom_ratios):
+        """
+        Build many records from parallel column arrays.
+
+        Args:
+            sentences (iterable): Sentence texts.
+            meanings (iterable): Meanings.
+            custom_ratios (iterable): Custom Ratios.
+
+        Returns:
+            list: One Sentence per row.
+        """
+        return list(map(cls, sentences, meanings, custom_ratios))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Sentence is immutable, cannot set {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Sentence is immutable, cannot delete {name!r}")
+
+    def __reduce__(self):
+        # Rebuild through __init__, setting slots directly is blocked
+        return (type(self), tuple(self.values()))
+
+    def __getitem__(self, key):
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, self.KEYS[key])
+
+    def get(self, key, default=None):
+        return self[key] if key in self.KEYS else default
+
+    def keys(self):
+        return self.KEYS.keys()
+
+    def values(self):
+        return [getattr(self, attribute) for attribute in self.KEYS.values()]
+
+    def items(self):
+        return [(key, getattr(self, attribute)) for key, attribute in self.KEYS.items()]
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self):
+        return len(self.KEYS)
+
+    def __contains__(self, key):
+        return key in self.KEYS
+
+    def to_dict(self):
+        """
+        Returns:
+            dict: The record as a dict with "Sentence", "Meaning" and "Custom Ratio".
+        """
+        return dict(self.items())
+
+    def __eq__(self, other):
+        if isinstance(other, Sentence):
+            return self.values() == other.values()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self.values()))
+
+    def __repr__(self):
+        return f"Sentence({self.sentence!r}, {self.meaning!r}, {self.custom_ratio!r})"
@@ -1,5 +1,140 @@
+import numpy as np
+import os
 import pandas as pd
 import re
+import sys
+import tempfile
+import threading
+import unicodedata
+
+from concurrent.futures import ProcessPoolExecutor
+from src.alias_table import Alias_table
+from src.bank_snapshot import Bank_snapshot
+from src.frequency_table import Frequency_table, frequency_table_path, sentences_hash
+from src.fuzzy_index import Fuzzy_index
+from src.sentence import Sentence
+from src.sentence_cursor import Sentence_cursor
+from src.token_cache import Token_cache, sentence_keys, token_cache_path
+from src.trigram_index import Trigram_index, parse_query
+
+# Characters stripped from space-delimited sentences before splitting
+PUNCTUATION_PATTERN = re.compile(r'[^\w\s]')
+# Characters kept as tokens in scripts where every character is a word
+WORD_CHARACTER_PATTERN = re.compile(r'\w', re.UNICODE)
+# Sampling weight added to every Custom Ratio so zero ratios stay drawable
+SAMPLING_WEIGHT_FLOOR = 1e-6
+# Alias table draws per requested sentence before sampling falls back
+SAMPLING_ATTEMPTS_PER_SENTENCE = 20
+# Share of the rows above which a word's candidates are not worth sorting,
+# iter_sentences and cursors then scan in ratio order and stop early
+DENSE_CANDIDATE_SHARE = 0.25
+
+def normalize_text(text):
+    """
+    Normalize text for matching by casefolding and applying NFKC.
+
+    Args:
+        text (str): Text to normalize.
+
+    Returns:
+        str: The casefolded, NFKC-normalized text.
+    """
+    return unicodedata.normalize("NFKC", text.casefold())
+
+def tokenize(normalized_sentence):
+    """
+    Split an already normalized sentence into word tokens.
+
+    Sentences containing ASCII letters, digits or whitespace are treated as
+    space delimited, everything else (e.g. Chinese or Japanese) is split into
+    characters. ASCII punctuation alone does not count, as NFKC turns
+    full-width punctuation such as "！" into its ASCII form.
+
+    Args:
+        normalized_sentence (str): Sentence returned by normalize_text.
+
+    Returns:
+        tuple: The tokens of the sentence, punctuation removed.
+    """
+    if not normalized_sentence.strip():
+        return ()
+
+    # For languages using spaces (like English, Spanish, etc.)
+    if any(ord(c) < 128 and (c.isalnum() or c.isspace()) for c in normalized_sentence):
+        # Remove punctuation and split by whitespace
+        return tuple(PUNCTUATION_PATTERN.sub(' ', normalized_sentence).split())
+
+    # For languages like Chinese where characters are words
+    return tuple(c for c in normalized_sentence if WORD_CHARACTER_PATTERN.match(c))
+
+def load_known_set(known_words_path):
+    """
+    Load the normalized set of known words used for ranking.
+
+    Args:
+        known_words_path (str or iterable): Path to a CSV file with a
+                                            'known' column, or the known
+                                            words themselves.
+
+    Returns:
+        set: The known words, normalized with normalize_text. Missing or
+             empty files give an empty set.
+    """
+    if not isinstance(known_words_path, str):
+        return set(normalize_text(word) for word in known_words_path if isinstance(word, str))
+
+    try:
+        known_df = pd.read_csv(known_words_path)
+        # Convert to lowercase for case-insensitive matching and handle empty dataframe
+        if 'known' in known_df.columns and not known_df.empty:
+            return set(normalize_text(word) for word in known_df['known'] if isinstance(word, str))
+        return set()
+    except (pd.errors.EmptyDataError, FileNotFoundError):
+        return set()
+
+# Memory-mapped arrays of a parallel ranking, attached once per worker process
+_RANK_WORKER_ARRAYS = {}
+
+def _init_rank_worker(array_directory):
+    """
+    Attach a ranking worker to the memory-mapped token arrays.
+
+    Args:
+        array_directory (str): Directory holding token_ids.npy, offsets.npy
+                               and known_flags.npy.
+    """
+    for name in ("token_ids", "offsets", "known_flags"):
+        _RANK_WORKER_ARRAYS[name] = np.load(os.path.join(array_directory, f"{name}.npy"), mmap_mode="r")
+
+def _count_known_tokens(token_ids, offsets, known_flags, start, end):
+    """
+    Count the known tokens of the sentences in rows [start, end).
+
+    Args:
+        token_ids (array): Token ids of every sentence, concatenated.
+        offsets (array): Start of each sentence in token_ids, plus the end.
+        known_flags (array): 1 for every known token id, else 0.
+        start (int): First row.
+        end (int): Row after the last.
+
+    Returns:
+        array: Known token count per row.
+    """
+    base = offsets[start]
+    flags = known_flags[token_ids[base:offsets[end]]]
+    cumulative = np.concatenate(([0], np.cumsum(flags, dtype=np.int64)))
+    return cumulative[offsets[start + 1:end + 1] - base] - cumulative[offsets[start:end] - base]
+
+def _rank_shard(bounds):
+    """Count known tokens for one shard inside a worker process."""
+    start, end = bounds
+    return _count_known_tokens(
+        _RANK_WORKER_ARRAYS["token_ids"],
+        _RANK_WORKER_ARRAYS["offsets"],
+        _RANK_WORKER_ARRAYS["known_flags"],
+        start,
+        end
+    )
 
 class Sentence_bank:
     """
@@ -9,15 +144,31 @@ class Sentence_bank:
     - "Sentence": The text of the sentence
     - "Meaning": The meaning or interpretation of the sentence
     - "Custom Ratio": A numeric value between 0 and 1
+
+    On load (and whenever a sentence is added) the following derived columns
+    are computed once so queries and ranking never redo Unicode work:
+    - "Normalized": The casefolded, NFKC-normalized sentence
+    - "Tokens": A tuple of the sentence's word tokens
+    - "Token Count": The number of tokens in the sentence
+
+    The rows, ranking state and indexes live in an immutable Bank_snapshot.
+    Writers publish a new snapshot instead of modifying the current one, so
+    queries can run concurrently with rank_sentences and add_sentences
+    without locks.
     """
     
-    def __init__(self, path_to_sentences_tsv="./data/sentences.tsv"):
+    def __init__(self, path_to_sentences_tsv="./data/sentences.tsv", token_cache=False):
         """
         Initialize the SentenceBank by loading and validating the sentences TSV file.
         
         Args:
             path_to_sentences_tsv (str): Path to the TSV file containing sentences.
                                          Defaults to "./data/sentences.tsv".
+            token_cache (bool): Reuse and update the token ids persisted next
+                                to the TSV (see token_cache_path), so sentences
+                                tokenized by an earlier load are not tokenized
+                                again. Writes a file next to the TSV, so it
+                                is opt-in. Defaults to False.
                                          
         Raises:
             ValueError: If the path is invalid, file format is incorrect,
@@ -31,67 +182,242 @@ class Sentence_bank:
         if not path_to_sentences_tsv.split('.')[-1] == "tsv":
             raise ValueError("path_to_sentences_tsv must end with .tsv")
         
-        # Load the TSV file into a pandas DataFrame
-        self.sentence_bank = pd.read_csv(
+        self.path_to_sentences_tsv = path_to_sentences_tsv
+        self.token_cache = token_cache
+
+        # Load the TSV file into a pandas DataFrame, published once it is valid
+        sentence_bank = pd.read_csv(
             path_to_sentences_tsv,
             sep='\t'
         )
+
+        # Serializes writers, readers never take it
+        self._write_lock = threading.Lock()
         
         # Define required columns and validate their presence
         REQUIRED_SENTENCE_BANK_COLUMNS = ["Sentence", "Meaning", "Custom Ratio"]
         for column_name in REQUIRED_SENTENCE_BANK_COLUMNS:
-            if column_name not in self.sentence_bank.columns:
+            if column_name not in sentence_bank.columns:
                 raise ValueError(
                     f"Column {column_name} not found. Expected at least '{REQUIRED_SENTENCE_BANK_COLUMNS}', "
-                    f"but found {self.sentence_bank.columns}"
+                    f"but found {sentence_bank.columns}"
                 )
         
         # Process and validate the Sentence column
         # Fill any NaN values with empty strings
-        self.sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[0]] = self.sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[0]].fillna("")
+        sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[0]] = sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[0]].fillna("")
         # Strip whitespace from each sentence
-        self.sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[0]] = [
-            i.strip() for i in self.sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[0]]
+        sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[0]] = [
+            i.strip() for i in sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[0]]
         ]
         
         # Check for duplicate sentences
-        if self.sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[0]].duplicated().any():
-            for idx, row in self.sentence_bank.loc[
-                self.sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[0]].duplicated(), :
+        if sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[0]].duplicated().any():
+            for idx, row in sentence_bank.loc[
+                sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[0]].duplicated(), :
             ].iterrows():
                 print(row)
                 # Commented out code to remove duplicated rows
-                # self.sentence_bank = self.sentence_bank.drop(idx)
-            # self.sentence_bank.to_csv(path_to_sentences_tsv, sep="\t")
+                # sentence_bank = sentence_bank.drop(idx)
+            # sentence_bank.to_csv(path_to_sentences_tsv, sep="\t")
             raise ValueError("Sentence column cannot contain duplicates")
         
         # Process and validate the Meaning column
         # Fill any NaN values with empty strings
-        self.sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[1]] = self.sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[1]].fillna("")
+        sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[1]] = sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[1]].fillna("")
         # Strip whitespace from each meaning
-        self.sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[1]] = [
-            i.strip() for i in self.sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[1]]
+        sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[1]] = [
+            i.strip() for i in sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[1]]
         ]
         
         # Process and validate the Custom Ratio column
         # Fill any NaN values with 0
-        self.sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[2]] = self.sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[2]].fillna(0)
+        sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[2]] = sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[2]].fillna(0)
         # Convert to numeric values
-        self.sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[2]] = pd.to_numeric(self.sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[2]].astype(float))
+        sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[2]] = pd.to_numeric(sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[2]].astype(float))
         # Validate that all ratios are between 0 and 1
-        if not self.sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[2]].between(0, 1, inclusive="both").all():
+        if not sentence_bank[REQUIRED_SENTENCE_BANK_COLUMNS[2]].between(0, 1, inclusive="both").all():
             raise ValueError("Custom Ratios must be between 0 and 1")
 
-    def get_sentences(self, word, num_sentences):
+        # Precompute the normalized form, tokens and token count of every sentence
+        if token_cache:
+            derived, encoded_tokens = self._derive_columns_cached(sentence_bank["Sentence"])
+        else:
+            derived, encoded_tokens = self._derive_columns(sentence_bank["Sentence"]), None
+
+        for column_name, values in derived.items():
+            sentence_bank[column_name] = values
+
+        # The first snapshot. The token id encoding comes with the token
+        # cache, every other index is built on first use
+        self._snapshot = Bank_snapshot(
+            sentence_bank,
+            indexes={"encoded_tokens": encoded_tokens} if encoded_tokens is not None else None
+        )
+
+    @property
+    def sentence_bank(self):
+        """
+        The DataFrame of the current snapshot, sharing its read-only rows,
+        so reading is cheap and writing a value, e.g.
+        sentence_bank.loc[0, "Custom Ratio"] = 1.0, raises ValueError. Edit
+        a .copy() and assign it back to publish it.
+        """
+        return self._snapshot.frame.copy(deep=False)
+
+    @sentence_bank.setter
+    def sentence_bank(self, frame):
+        with self._write_lock:
+            # Other rows, so every index is built again on first use
+            self._snapshot = self._snapshot.evolve(frame=frame.copy(), indexes={})
+
+    @property
+    def known_words(self):
+        """Known words of the last rank_sentences call, None before it."""
+        return self._snapshot.known_words
+
+    @property
+    def lemmatizer(self):
+        """Lemmatizer of the last rank_sentences call."""
+        return self._snapshot.lemmatizer
+
+    def snapshot(self):
+        """
+        Get the current version of the bank's rows and ranking state.
+
+        Queries that must see a single version, e.g. across several calls,
+        can hold on to it while writers publish newer versions.
+
+        Returns:
+            Bank_snapshot: The latest published snapshot.
+        """
+        return self._snapshot
+
+    @staticmethod
+    def _derive_columns(sentences):
+        """
+        Compute the derived matching columns for a sequence of sentences.
+
+        Args:
+            sentences (iterable): Stripped sentence strings.
+
+        Returns:
+            dict: Column name to list of values for "Normalized", "Tokens"
+                  and "Token Count".
+        """
+        normalized = [normalize_text(sentence) for sentence in sentences]
+        tokens = [tokenize(sentence) for sentence in normalized]
+
+        return {
+            "Normalized": normalized,
+            "Tokens": tokens,
+            "Token Count": [len(sentence_tokens) for sentence_tokens in tokens]
+        }
+
+    def _derive_columns_cached(self, sentences):
+        """
+        Compute the derived matching columns, taking the tokens of
+        sentences seen before from the persisted token cache and saving
+        the cache again if any sentence was new.
+
+        Args:
+            sentences (iterable): Stripped sentence strings.
+
+        Returns:
+            tuple: (columns, encoded_tokens) where columns is like the
+                   result of _derive_columns and encoded_tokens like the
+                   result of encode_tokens.
+        """
+        sentences = list(sentences)
+        normalized = [normalize_text(sentence) for sentence in sentences]
+        keys = sentence_keys(sentences)
+
+        path = token_cache_path(self.path_to_sentences_tsv)
+        cache = Token_cache.load(path) if os.path.exists(path) else None
+
+        if cache is None:
+            cache = Token_cache([], [], [], [0])
+        rows = cache.find(keys).tolist()
+
+        vocabulary = list(cache.vocabulary)
+        cached_ids = cache.token_ids.tolist()
+        cached_offsets = cache.offsets.tolist()
+
+        # Token to id, only built once a sentence misses the cache
+        token_ids_by_token = None
+
+        tokens = []
+        token_ids = []
+        offsets = [0]
+        for sentence, row in zip(normalized, rows):
+            if row >= 0:
+                sentence_ids = cached_ids[cached_offsets[row]:cached_offsets[row + 1]]
+                sentence_tokens = tuple(map(vocabulary.__getitem__, sentence_ids))
+            else:
+                if token_ids_by_token is None:
+                    token_ids_by_token = {token: token_id for token_id, token in enumerate(vocabulary)}
+
+                sentence_tokens = tokenize(sentence)
+                sentence_ids = []
+                for token in sentence_tokens:
+                    if token not in token_ids_by_token:
+                        token_ids_by_token[token] = len(vocabulary)
+                        vocabulary.append(token)
+                    sentence_ids.append(token_ids_by_token[token])
+
+            tokens.append(sentence_tokens)
+            token_ids.extend(sentence_ids)
+            offsets.append(len(token_ids))
+
+        encoded_tokens = (vocabulary, np.array(token_ids, dtype=np.int32), np.array(offsets, dtype=np.int64))
+
+        # Rewrite the cache unless it already holds exactly these sentences
+        if not np.array_equal(keys, cache.keys):
+            try:
+                Token_cache(keys, *encoded_tokens).save(path)
+            except OSError:
+                # The cache only saves time, a read-only directory just goes without
+                pass
+
+        columns = {
+            "Normalized": normalized,
+            "Tokens": tokens,
+            "Token Count": [len(sentence_tokens) for sentence_tokens in tokens]
+        }
+        return columns, encoded_tokens
+
+    def derived_memory_usage(self):
+        """
+        Report the extra memory held by the precomputed matching columns.
+
+        Returns:
+            int: Approximate number of bytes used by the "Normalized",
+                 "Tokens" and "Token Count" columns, including the strings
+                 and tuples they reference.
+        """
+        frame = self._snapshot.frame
+        usage = int(frame[["Normalized", "Token Count"]].memory_usage(index=False, deep=True).sum())
+
+        # pandas only counts the tuple objects themselves, not the token strings
+        for sentence_tokens in frame["Tokens"]:
+            usage += sys.getsizeof(sentence_tokens) + sum(sys.getsizeof(token) for token in sentence_tokens)
+
+        return usage
+
+    def get_sentences(self, word, num_sentences, fuzzy=0):
         """
         Get sentences containing the specified word.
         
         Parameters:
         word (str): Word to search for in sentences
         num_sentences (int): Number of sentences to return
+        fuzzy (int): Edit distance tolerated between the word and the
+                     bank's tokens, ignoring accents. 0 (default) matches
+                     the word literally
         
         Returns:
-        list: List of dictionaries containing matching sentences
+        list: Sentence records of the matches, which also support
+              dictionary access by "Sentence", "Meaning" and "Custom Ratio"
         
         Raises:
         ValueError: If inputs are invalid
@@ -103,91 +429,1186 @@ class Sentence_bank:
         if not isinstance(num_sentences, int) or num_sentences <= 0:
             raise ValueError("Num_sentences must be a int greater than zero and less than len(sentences.tsv)")
             
-        if num_sentences > len(self.sentence_bank):
+        snapshot = self._snapshot
+
+        if num_sentences > len(snapshot):
             raise ValueError("Num_sentences must be a int greater than zero and less than len(sentences.tsv)")
+
+        if isinstance(fuzzy, bool) or not isinstance(fuzzy, int) or fuzzy < 0:
+            raise ValueError("Fuzzy must be a non-negative int")
             
-        # Create a safe pattern for case-insensitive search
-        # This handles special regex chars by escaping them
-        search_pattern = re.escape(word)
+        # Normalize the word the same way the sentences were normalized on load
+        # so a plain substring test is case insensitive
+        search_terms = [normalize_text(word)]
+
+        # Resolve typos and missing accents to tokens of the bank first
+        if fuzzy > 0:
+            search_terms = self.get_fuzzy_index(fuzzy, snapshot).lookup(search_terms[0], fuzzy)
+            if not search_terms:
+                return []
         
-        # Find matching sentences (case insensitive)
-        matches = self.sentence_bank[self.sentence_bank["Sentence"].str.contains(search_pattern, case=False, regex=True, na=False)]
+        # Find matching sentences against the precomputed normalized column
+        positions = np.flatnonzero([
+            any(search_term in sentence for search_term in search_terms)
+            for sentence in snapshot.frame["Normalized"]
+        ])
         
         # Sort by Custom Ratio (descending)
-        sorted_matches = matches.sort_values(by="Custom Ratio", ascending=False)
+        sorted_positions = positions[np.argsort(-snapshot.ratios[positions], kind="stable")]
         
         # Limit to requested number of sentences (or all if fewer matches exist)
-        limit = min(num_sentences, len(sorted_matches))
-        top_matches = sorted_matches.head(limit)
-        
-        # Convert to list of dictionaries
-        result = []
-        for _, row in top_matches.iterrows():
-            result.append({
-                "Sentence": row["Sentence"],
-                "Meaning": row["Meaning"],
-                "Custom Ratio": row["Custom Ratio"]
-            })
-            
-        return result
+        return self.sentences_at(sorted_positions[:num_sentences], snapshot)
+
+    def get_ratio_order(self):
+        """
+        Get the row positions of the current snapshot sorted by descending
+        Custom Ratio, ties in row order, building it on first use.
+
+        Returns:
+            array: Read-only int64 row positions.
+        """
+        return self._snapshot.ratio_order
+
+    def _candidate_positions(self, snapshot, search_term):
+        """
+        Get the rows that can contain a term, a superset of the matches.
+
+        Terms with a trigram come from the trigram index. Shorter terms made
+        of word characters come from the token index, as word characters
+        only ever occur inside tokens: every match contains a token holding
+        the term's rarest character.
+
+        Args:
+            snapshot (Bank_snapshot): The version to search.
+            search_term (str): Normalized term.
+
+        Returns:
+            array: Unordered int64 row positions, or None when nothing can
+                   be ruled out, e.g. for punctuation.
+        """
+        candidates = self.get_trigram_index(snapshot).candidates([search_term])
+        if candidates is not None:
+            return np.asarray(candidates, dtype=np.int64)
+
+        if not all(WORD_CHARACTER_PATTERN.match(c) for c in search_term):
+            return None
+
+        token_index = self.get_token_index(snapshot)
+        token_characters = self.get_token_characters(snapshot)
+
+        # The postings of the tokens holding the term's rarest character
+        posting_lists = None
+        for character in set(search_term):
+            character_lists = [token_index[token] for token in token_characters.get(character, ())]
+            if posting_lists is None or sum(map(len, character_lists)) < sum(map(len, posting_lists)):
+                posting_lists = character_lists
+
+        if not posting_lists:
+            return np.array([], dtype=np.int64)
+
+        return np.unique(np.concatenate(posting_lists)).astype(np.int64)
+
+    def _scan_matches(self, word, snapshot, start=0, chunk_size=1024):
+        """
+        Lazily find the sentences containing a word in a snapshot's
+        ratio order.
+
+        When the trigram or token index narrows the word down to a small
+        share of the rows, only those candidates are put in ratio order and
+        checked. Otherwise the rows are scanned in ratio order, which stops
+        early for common words.
+
+        Args:
+            word (str): Word to search for in sentences.
+            snapshot (Bank_snapshot): The version to scan.
+            start (int): Index into the ratio order to start scanning from.
+            chunk_size (int): Rows fetched from the column per step.
+
+        Returns:
+            generator: Indices into the ratio order of the matching rows.
+
+        Raises:
+            ValueError: If the word is empty.
+        """
+        if not isinstance(word, str) or not word:
+            raise ValueError("Word must be non-empty string")
+
+        search_term = normalize_text(word)
+        normalized = snapshot.frame["Normalized"].to_numpy()
+        order = snapshot.ratio_order
+
+        candidates = self._candidate_positions(snapshot, search_term)
+        if candidates is not None and len(candidates) <= len(snapshot) * DENSE_CANDIDATE_SHARE:
+            ranks = np.sort(snapshot.ratio_ranks[candidates])
+            ranks = ranks[np.searchsorted(ranks, start):]
+
+            def check():
+                for rank in ranks.tolist():
+                    if search_term in normalized[order[rank]]:
+                        yield rank
+
+            return check()
+
+        def scan():
+            for chunk_start in range(start, len(order), chunk_size):
+                chunk = normalized[order[chunk_start:chunk_start + chunk_size]]
+                for offset, sentence in enumerate(chunk):
+                    if search_term in sentence:
+                        yield chunk_start + offset
+
+        return scan()
+
+    def iter_sentences(self, word):
+        """
+        Lazily get the sentences containing a word, highest Custom Ratio
+        first.
+
+        Unlike get_sentences nothing is scanned beyond the last match
+        consumed, so taking the first few results of a common word stops
+        early. Use cursor to page through matches across calls.
+
+        Args:
+            word (str): Word to search for in sentences.
+
+        Returns:
+            generator: Sentence records in the order of get_sentences.
+
+        Raises:
+            ValueError: If the word is empty.
+        """
+        snapshot = self._snapshot
+        order = snapshot.ratio_order
+        matches = self._scan_matches(word, snapshot)
+
+        def sentences():
+            for index in matches:
+                yield self.sentences_at(order[index:index + 1], snapshot)[0]
+
+        return sentences()
+
+    def cursor(self, word, token=None):
+        """
+        Get a resumable cursor over the sentences containing a word.
+
+        Args:
+            word (str): Word to search for in sentences.
+            token (str): The token of an earlier cursor to resume from.
+                         None starts at the first match.
+
+        Returns:
+            Sentence_cursor: Cursor whose fetch(n) returns the next page.
+
+        Raises:
+            ValueError: If the word is empty, or the token is malformed or
+                        from another version of the bank, e.g. taken before
+                        a re-rank. Start a new cursor then.
+        """
+        return Sentence_cursor(self, word, token)
+
+    def get_trigram_index(self, snapshot=None):
+        """
+        Get the character trigram index of the normalized sentences,
+        building it on first use.
+
+        Args:
+            snapshot (Bank_snapshot): Version to index. Defaults to the current one.
+
+        Returns:
+            Trigram_index: The index, extended for appended sentences by add_sentences.
+        """
+        snapshot = self._snapshot if snapshot is None else snapshot
+        return snapshot.index("trigram", lambda: Trigram_index(snapshot.frame["Normalized"]))
+
+    def search(self, query, num_sentences):
+        """
+        Get sentences matching a phrase, prefix or wildcard query.
+
+        Query syntax (case insensitive, all terms must match):
+        - word: the word anywhere, like get_sentences
+        - "several words": the words next to each other
+        - habl*: any word starting with "habl"
+        - *ción: any word ending with "ción"
+        - c?sa: "?" stands for exactly one letter
+
+        Candidates come from the trigram index of the query's literal
+        fragments and only they are checked against the real pattern.
+
+        Parameters:
+        query (str): Query to search for
+        num_sentences (int): Maximum number of sentences to return
+
+        Returns:
+        list: Matching Sentence records, highest Custom Ratio first
+
+        Raises:
+        ValueError: If inputs are invalid
+        """
+        if not isinstance(query, str) or not query.strip():
+            raise ValueError("Query must be non-empty string")
+
+        if isinstance(num_sentences, bool) or not isinstance(num_sentences, int) or num_sentences <= 0:
+            raise ValueError("Num_sentences must be a int greater than zero")
+
+        patterns, literals = parse_query(normalize_text(query))
+
+        snapshot = self._snapshot
+
+        candidates = self.get_trigram_index(snapshot).candidates(literals)
+        if candidates is None:
+            # Only wildcards or very short fragments, every row is a candidate
+            candidates = range(len(snapshot))
+
+        normalized = snapshot.frame["Normalized"].to_numpy()
+        positions = np.array(
+            [
+                position for position in candidates
+                if all(pattern.search(normalized[position]) for pattern in patterns)
+            ],
+            dtype=np.int64
+        )
+
+        order = np.argsort(-snapshot.ratios[positions], kind="stable")
+
+        return self.sentences_at(positions[order][:num_sentences], snapshot)
+
+    def _match_positions(self, snapshot, search_term, mask=None):
+        """
+        Find the rows of a snapshot whose normalized text contains a term.
 
-    def rank_sentences(self, known_words_path):
+        Args:
+            snapshot (Bank_snapshot): The version to search.
+            search_term (str): Normalized term.
+            mask (array): Optional bitmap of the rows to consider.
+
+        Returns:
+            array: Ascending int64 row positions.
+        """
+        mask = np.ones(len(snapshot), dtype=bool) if mask is None else mask
+
+        candidates = self.get_trigram_index(snapshot).candidates([search_term])
+        if candidates is not None:
+            in_index = np.zeros(len(snapshot), dtype=bool)
+            in_index[np.asarray(candidates, dtype=np.int64)] = True
+            mask = mask & in_index
+
+        normalized = snapshot.frame["Normalized"].to_numpy()
+        return np.array(
+            [position for position in np.flatnonzero(mask) if search_term in normalized[position]],
+            dtype=np.int64
+        )
+
+    def filter_sentences(self, word=None, num_sentences=None, filters=None):
+        """
+        Get sentences containing a word whose numeric columns fall in ranges.
+
+        Every filtered column gets a sorted secondary index per snapshot, so
+        each range is two binary searches. The ranges are intersected as
+        row bitmaps, then with the trigram candidates of the word, and only
+        the surviving rows are checked for the word and sorted.
+
+        Parameters:
+        word (str): Word to search for in sentences, like get_sentences.
+                    None matches every sentence
+        num_sentences (int): Maximum number of sentences to return. None
+                             returns every match
+        filters (dict): Column name to an inclusive (low, high) range, where
+                        None leaves a side open, e.g.
+                        {"HSK average": (None, 2), "Token Count": (5, 15),
+                        "Custom Ratio": (0.8, None)}. Rows with a missing
+                        value never match
+
+        Returns:
+        list: Matching Sentence records, highest Custom Ratio first
+
+        Raises:
+        ValueError: If inputs are invalid or a column is missing or not numeric
+        """
+        if word is not None and (not isinstance(word, str) or not word):
+            raise ValueError("Word must be non-empty string")
+
+        if num_sentences is not None and (
+            isinstance(num_sentences, bool) or not isinstance(num_sentences, int) or num_sentences <= 0
+        ):
+            raise ValueError("Num_sentences must be a int greater than zero")
+
+        filters = {} if filters is None else filters
+        if not isinstance(filters, dict):
+            raise ValueError("Filters must be a dict of column name to (low, high)")
+
+        snapshot = self._snapshot
+        frame = snapshot.frame
+
+        for column, bounds in filters.items():
+            if column not in frame.columns:
+                raise ValueError(f"Column {column} not found in the sentence bank")
+            if not pd.api.types.is_numeric_dtype(frame[column]) or pd.api.types.is_bool_dtype(frame[column]):
+                raise ValueError(f"Column {column} must be numeric to filter on")
+            if not isinstance(bounds, (tuple, list)) or len(bounds) != 2 or any(
+                bound is not None and (isinstance(bound, bool) or not isinstance(bound, (int, float)))
+                for bound in bounds
+            ):
+                raise ValueError(f"Filter of {column} must be a (low, high) pair of numbers or None")
+
+        # Bitmap of the rows inside every range
+        mask = np.ones(len(snapshot), dtype=bool)
+        for column, (low, high) in filters.items():
+            values, positions = snapshot.secondary_index(column)
+            start = 0 if low is None else np.searchsorted(values, low, side="left")
+            end = len(values) if high is None else np.searchsorted(values, high, side="right")
+
+            in_range = np.zeros(len(snapshot), dtype=bool)
+            in_range[positions[start:end]] = True
+            mask &= in_range
+
+        if word is not None:
+            positions = self._match_positions(snapshot, normalize_text(word), mask)
+        else:
+            positions = np.flatnonzero(mask)
+
+        order = np.argsort(-snapshot.ratios[positions], kind="stable")
+
+        return self.sentences_at(positions[order][:num_sentences], snapshot)
+
+    def sample_sentences(self, word, num_sentences, seed=None, diversity=0.0):
+        """
+        Draw sentences containing a word at random, weighted by Custom Ratio.
+
+        The matches of a word and their alias table are built once per
+        snapshot, after which every draw is O(1). Draws repeat until
+        num_sentences distinct sentences are accepted. With a diversity
+        penalty a drawn sentence is only accepted with probability
+        1 / (1 + diversity * shared), where shared counts its tokens already
+        used by accepted sentences, so the sample covers more vocabulary.
+        When too many draws are rejected the rest are drawn without the
+        penalty.
+
+        Parameters:
+        word (str): Word to search for in sentences, like get_sentences
+        num_sentences (int): Number of sentences to draw, fewer if the word
+                             has fewer matches
+        seed (int): Seed for reproducible samples. None draws fresh ones
+        diversity (float): Strength of the shared token penalty. 0 (default)
+                           samples by ratio alone
+
+        Returns:
+        list: Sampled Sentence records in the order they were drawn
+
+        Raises:
+        ValueError: If inputs are invalid
+        """
+        if not isinstance(word, str) or not word:
+            raise ValueError("Word must be non-empty string")
+
+        if isinstance(num_sentences, bool) or not isinstance(num_sentences, int) or num_sentences <= 0:
+            raise ValueError("Num_sentences must be a int greater than zero")
+
+        if isinstance(diversity, bool) or not isinstance(diversity, (int, float)) or diversity < 0:
+            raise ValueError("Diversity must be a non-negative number")
+
+        snapshot = self._snapshot
+        search_term = normalize_text(word)
+
+        def build():
+            positions = self._match_positions(snapshot, search_term)
+            if len(positions) == 0:
+                return positions, None
+            # Sentences nobody can read yet stay possible, just very unlikely
+            return positions, Alias_table(snapshot.ratios[positions] + SAMPLING_WEIGHT_FLOOR)
+
+        positions, table = snapshot.cached(("sample", search_term), build)
+        if table is None:
+            return []
+
+        rng = np.random.default_rng(seed)
+        num_sentences = min(num_sentences, len(positions))
+        tokens_column = snapshot.frame["Tokens"].to_numpy()
+        own_tokens = set(tokenize(search_term))
+
+        chosen = []
+        chosen_set = set()
+        used_tokens = set()
+
+        # Rejections pile up when few matches are left, finish without them then
+        for _ in range(SAMPLING_ATTEMPTS_PER_SENTENCE * num_sentences):
+            if len(chosen) == num_sentences:
+                break
+
+            index = table.sample(rng)
+            if index in chosen_set:
+                continue
+
+            tokens = set(tokens_column[positions[index]]) - own_tokens
+            if diversity > 0 and rng.random() >= 1 / (1 + diversity * len(tokens & used_tokens)):
+                continue
+
+            chosen.append(index)
+            chosen_set.add(index)
+            used_tokens |= tokens
+
+        if len(chosen) < num_sentences:
+            remaining = np.setdiff1d(np.arange(len(positions)), chosen)
+            weights = snapshot.ratios[positions[remaining]] + SAMPLING_WEIGHT_FLOOR
+            chosen.extend(rng.choice(
+                remaining, size=num_sentences - len(chosen), replace=False, p=weights / weights.sum()
+            ).tolist())
+
+        return self.sentences_at(positions[chosen], snapshot)
+
+    def get_fuzzy_index(self, max_distance=2, snapshot=None):
+        """
+        Get the fuzzy index over the bank's token vocabulary, building it
+        on first use or when a larger max_distance is needed.
+
+        Args:
+            max_distance (int): Largest edit distance lookups will use.
+            snapshot (Bank_snapshot): Version to index. Defaults to the current one.
+
+        Returns:
+            Fuzzy_index: The index, extended for appended sentences by add_sentences.
+        """
+        snapshot = self._snapshot if snapshot is None else snapshot
+        return snapshot.index(
+            "fuzzy",
+            lambda: Fuzzy_index(self.get_token_index(snapshot).keys(), max_distance),
+            stale=lambda fuzzy_index: fuzzy_index.max_distance < max_distance
+        )
+
+    def _is_known(self, token):
+        """Check an already normalized token against the last ranking's known set."""
+        return self._snapshot.is_known(token)
+
+    def encode_tokens(self, snapshot=None):
+        """
+        Get the Tokens column encoded as flat token-id arrays, building it
+        on first use.
+
+        Args:
+            snapshot (Bank_snapshot): Version to encode. Defaults to the current one.
+
+        Returns:
+            tuple: (vocabulary, token_ids, offsets) where vocabulary is the
+                   list of distinct tokens indexed by id, token_ids is an
+                   int32 array of every sentence's token ids concatenated
+                   and offsets is an int64 array of length len(bank) + 1
+                   such that sentence i is token_ids[offsets[i]:offsets[i + 1]].
+        """
+        snapshot = self._snapshot if snapshot is None else snapshot
+
+        def build():
+            vocabulary = {}
+            token_ids = []
+            offsets = [0]
+            for sentence_tokens in snapshot.frame["Tokens"]:
+                for token in sentence_tokens:
+                    token_ids.append(vocabulary.setdefault(token, len(vocabulary)))
+                offsets.append(len(token_ids))
+
+            return (
+                list(vocabulary),
+                np.array(token_ids, dtype=np.int32),
+                np.array(offsets, dtype=np.int64)
+            )
+
+        return snapshot.index("encoded_tokens", build)
+
+    def _count_known_parallel(self, snapshot, known_words, lemmas, workers, shard_size):
+        """
+        Count the known tokens of every sentence in a process pool.
+
+        The token ids, offsets and per-token known flags are written once
+        to memory-mapped files that every worker maps read-only, so neither
+        the sentences nor the known set are pickled to the workers. Only
+        (start, end) shard bounds go out and count arrays come back.
+
+        Returns:
+            list: Known token count per row, in row order.
+        """
+        vocabulary, token_ids, offsets = self.encode_tokens(snapshot)
+        known_flags = np.fromiter(
+            (lemmas.get(token, token) in known_words for token in vocabulary),
+            dtype=np.uint8,
+            count=len(vocabulary)
+        )
+
+        row_count = len(snapshot)
+        if shard_size is None:
+            shard_size = max(1, -(-row_count // (workers * 4)))
+        shards = [(start, min(start + shard_size, row_count)) for start in range(0, row_count, shard_size)]
+
+        with tempfile.TemporaryDirectory() as array_directory:
+            for name, array in (("token_ids", token_ids), ("offsets", offsets), ("known_flags", known_flags)):
+                np.save(os.path.join(array_directory, f"{name}.npy"), array)
+
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_rank_worker,
+                initargs=(array_directory,)
+            ) as executor:
+                # map keeps shard order so counts line up with rows
+                counts = list(executor.map(_rank_shard, shards))
+
+        return np.concatenate(counts).tolist()
+
+    def get_frequency_table(self, persist=False, chunk_size=10000, workers=None):
+        """
+        Get the corpus token frequencies of the bank.
+
+        With persist, the table is kept next to the TSV (see
+        frequency_table_path) together with a hash of the sentences it
+        counted. Saving is best effort, so a read-only data directory just
+        goes without the file. A persisted table is only reused when it
+        counted a prefix of the bank's rows, then just the sentences after
+        that prefix are counted and merged in. Any other table is rebuilt.
+
+        Args:
+            persist (bool): Load from and save to the file next to the TSV.
+                            The saved table is kept current by add_sentences.
+            chunk_size (int): Sentences counted per chunk.
+            workers (int): Worker processes for counting. None counts in process.
+
+        Returns:
+            Frequency_table: The bank's token frequencies, updated for appended
+                             sentences by add_sentences.
+        """
+        snapshot = self._snapshot
+        tokens = snapshot.frame["Tokens"]
+        sentences = snapshot.frame["Sentence"]
+
+        def build():
+            path = frequency_table_path(self.path_to_sentences_tsv)
+            table = None
+
+            if persist and os.path.exists(path):
+                table = Frequency_table.load(path, sentences)
+
+            if table is None:
+                table = Frequency_table.from_token_lists(tokens, chunk_size, workers)
+                table.source = sentences_hash(sentences)
+            elif table.sentence_count < len(snapshot):
+                source = sentences_hash(sentences.iloc[table.sentence_count:], table.source)
+                table.merge(Frequency_table.from_token_lists(
+                    tokens.iloc[table.sentence_count:], chunk_size, workers
+                ))
+                table.source = source
+
+            if persist:
+                table.path = path
+                try:
+                    table.save(path)
+                except OSError:
+                    # The file only saves counting time on the next load
+                    pass
+
+            return table
+
+        return snapshot.index("frequency", build)
+
+    def rank_sentences(self, known_words_path, lemmatizer=None, workers=None, shard_size=None):
         """
         Rank sentences based on the ratio of known words they contain.
+
+        Besides "Custom Ratio", the number of unknown tokens of every
+        sentence is stored in "Unknown Count" for i+1 queries.
         
         Parameters:
         -----------
-        known_words_path : str
-            Path to the CSV file containing known words
+        known_words_path : str or iterable
+            Path to the CSV file containing known words, or the known words themselves
+        lemmatizer : Lemmatizer, optional
+            When given, tokens and known words are compared by lemma so
+            knowing "estar" also makes "estás" count as known
+        workers : int, optional
+            Number of worker processes. None or 1 ranks serially. The
+            result is identical either way
+        shard_size : int, optional
+            Rows per parallel task. Defaults to a quarter of each worker's share
         """
-        # If the sentence bank is empty, return early
-        if len(self.sentence_bank) == 0:
-            return
-            
+        if workers is not None and (isinstance(workers, bool) or not isinstance(workers, int) or workers < 1):
+            raise ValueError("workers must be a positive int")
+
+        if shard_size is not None and (isinstance(shard_size, bool) or not isinstance(shard_size, int) or shard_size < 1):
+            raise ValueError("shard_size must be a positive int")
+
         # Load known words
-        try:
-            known_df = pd.read_csv(known_words_path)
-            # Convert to lowercase for case-insensitive matching and handle empty dataframe
-            if 'known' in known_df.columns and not known_df.empty:
-                known_words = set(word.lower() for word in known_df['known'] if isinstance(word, str))
-            else:
-                known_words = set()
-        except (pd.errors.EmptyDataError, FileNotFoundError):
-            known_words = set()
-            
-        # Process each sentence to calculate the ratio of known words
-        for idx, row in self.sentence_bank.iterrows():
-            if not isinstance(row['Sentence'], str) or not row['Sentence'].strip():
-                self.sentence_bank.at[idx, 'Custom Ratio'] = 0
-                continue
-                
-            # Get words from the sentence, handling various scripts and punctuation
-            sentence = row['Sentence']
-            
-            # For languages using spaces (like English, Spanish, etc.)
-            if any(ord(c) < 128 for c in sentence):  # Contains ASCII chars
-                # Remove punctuation and split by whitespace
-                words = re.sub(r'[^\w\s]', ' ', sentence.lower()).split()
+        known_words = load_known_set(known_words_path)
+
+        # Compare lemmas instead of surface forms, one dict lookup per token
+        lemmas = {}
+        if lemmatizer is not None:
+            known_words = lemmatizer.lemmatize_all(known_words)
+            lemmas = lemmatizer.lemmas
+
+        # Readers keep using the current snapshot until the new one is published
+        with self._write_lock:
+            frame = self._snapshot.frame
+
+            # If the sentence bank is empty, there is nothing to count
+            if len(frame) == 0:
+                known_counts = []
+            elif workers is not None and workers > 1:
+                known_counts = self._count_known_parallel(self._snapshot, known_words, lemmas, workers, shard_size)
             else:
-                # For languages like Chinese where characters are words
-                words = list(sentence.lower())
-                # Remove punctuation characters
-                words = [w for w in words if not re.match(r'[^\w]', w, re.UNICODE)]
-            
-            # Skip empty sentences
-            if not words:
-                self.sentence_bank.at[idx, 'Custom Ratio'] = 0
-                continue
-                
-            # Count known words
-            known_count = sum(1 for word in words if word.lower() in known_words)
-            
-            # Calculate and store the ratio
-            if words:
-                ratio = known_count / len(words)
-                self.sentence_bank.at[idx, 'Custom Ratio'] = ratio
+                # Count known words from each sentence's precomputed tokens
+                known_counts = []
+                for words in frame["Tokens"]:
+                    if lemmas:
+                        known_counts.append(sum(1 for word in words if lemmas.get(word, word) in known_words))
+                    else:
+                        known_counts.append(sum(1 for word in words if word in known_words))
+
+            # Calculate the ratios, empty sentences have nothing to know
+            ratios = []
+            unknown_counts = []
+            for known_count, word_count in zip(known_counts, frame["Token Count"]):
+                ratios.append(known_count / word_count if word_count else 0)
+                unknown_counts.append(word_count - known_count)
+
+            # Copy on write: the published frame is never modified. The known
+            # words travel with the ratios so appended sentences and i+1
+            # queries agree with them
+            self._snapshot = self._snapshot.evolve(
+                frame=frame.assign(**{
+                    "Custom Ratio": pd.Series(ratios, index=frame.index, dtype=float),
+                    "Unknown Count": pd.Series(unknown_counts, index=frame.index, dtype=int)
+                }),
+                known_words=known_words,
+                lemmatizer=lemmatizer
+            )
+
+    def _rerank_positions(self, snapshot, positions, known_words, lemmatizer):
+        """
+        Publish a snapshot with the ratios of some rows recounted against
+        new known words. The caller holds the write lock.
+        """
+        frame = snapshot.frame
+        ratios = frame["Custom Ratio"].to_numpy(dtype=float).copy()
+        unknown_counts = frame["Unknown Count"].to_numpy(dtype=int).copy()
+        tokens_column = frame["Tokens"].to_numpy()
+        token_counts = frame["Token Count"].to_numpy()
+        lemmas = lemmatizer.lemmas if lemmatizer is not None else {}
+
+        for position in positions:
+            known_count = sum(1 for token in tokens_column[position] if lemmas.get(token, token) in known_words)
+            word_count = token_counts[position]
+            ratios[position] = known_count / word_count if word_count else 0
+            unknown_counts[position] = word_count - known_count
+
+        self._snapshot = snapshot.evolve(
+            frame=frame.assign(**{
+                "Custom Ratio": pd.Series(ratios, index=frame.index, dtype=float),
+                "Unknown Count": pd.Series(unknown_counts, index=frame.index, dtype=int)
+            }),
+            known_words=known_words,
+            lemmatizer=lemmatizer
+        )
+
+    def update_known_words(self, known_words_path):
+        """
+        Re-rank incrementally after the known words changed.
+
+        Only sentences containing a word that became known or unknown are
+        recounted, found through the token index. The result is the same as
+        calling rank_sentences again with the lemmatizer of the last call.
+
+        Args:
+            known_words_path (str or iterable): Like rank_sentences.
+
+        Returns:
+            tuple: (added, removed) sets of known words, lemmas with a lemmatizer.
+
+        Raises:
+            ValueError: If the bank was never ranked.
+        """
+        if self.known_words is None:
+            raise ValueError("rank_sentences must be called before update_known_words")
+
+        lemmatizer = self.lemmatizer
+        known_words = load_known_set(known_words_path)
+        if lemmatizer is not None:
+            known_words = lemmatizer.lemmatize_all(known_words)
+
+        with self._write_lock:
+            snapshot = self._snapshot
+            added = known_words - snapshot.known_words
+            removed = snapshot.known_words - known_words
+            changed = added | removed
+
+            token_index = self.get_token_index(snapshot)
+            if lemmatizer is not None:
+                tokens = [token for token in token_index if lemmatizer.lemmas.get(token, token) in changed]
             else:
-                self.sentence_bank.at[idx, 'Custom Ratio'] = 0
-    
-    def add_sentence():
-        pass
+                tokens = [token for token in changed if token in token_index]
+
+            positions = set()
+            for token in tokens:
+                positions.update(token_index[token])
+
+            self._rerank_positions(snapshot, sorted(positions), known_words, lemmatizer)
+
+        return added, removed
+
+    def reload(self):
+        """
+        Load the TSV again and publish it as the next snapshot, ranked
+        like the current one. Queries keep using the previous snapshot
+        until the new one is complete.
+
+        Raises:
+            ValueError: If the TSV is no longer valid. The bank is unchanged then.
+        """
+        fresh = Sentence_bank(self.path_to_sentences_tsv, token_cache=self.token_cache)
+
+        with self._write_lock:
+            snapshot = self._snapshot
+            if snapshot.known_words is not None:
+                fresh.rank_sentences(snapshot.known_words, snapshot.lemmatizer)
+
+            # Only indexes of the new rows come along, the rest are built on next use
+            loaded = fresh.snapshot()
+            self._snapshot = snapshot.evolve(
+                frame=loaded.frame,
+                known_words=loaded.known_words,
+                lemmatizer=loaded.lemmatizer,
+                indexes=loaded.built_indexes()
+            )
+
+    def get_token_index(self, snapshot=None):
+        """
+        Get the inverted index from token to the positions of the
+        sentences containing it, building it on first use.
+
+        Args:
+            snapshot (Bank_snapshot): Version to index. Defaults to the current one.
+
+        Returns:
+            dict: Token to a list of row positions in ascending order.
+                  Shared with other callers, so it must not be modified.
+        """
+        snapshot = self._snapshot if snapshot is None else snapshot
+
+        def build():
+            token_index = {}
+            for position, sentence_tokens in enumerate(snapshot.frame["Tokens"]):
+                for token in set(sentence_tokens):
+                    token_index.setdefault(token, []).append(position)
+            return token_index
+
+        return snapshot.index("token", build)
+
+    def get_token_characters(self, snapshot=None):
+        """
+        Get the map from every character to the tokens containing it,
+        building it on first use.
+
+        Args:
+            snapshot (Bank_snapshot): Version to index. Defaults to the current one.
+
+        Returns:
+            dict: Character to a list of tokens of the token index.
+                  Shared with other callers, so it must not be modified.
+        """
+        snapshot = self._snapshot if snapshot is None else snapshot
+
+        def build():
+            return self._extend_token_characters({}, self.get_token_index(snapshot))
+
+        return snapshot.index("token_characters", build)
+
+    @staticmethod
+    def _extend_token_characters(token_characters, tokens):
+        """
+        Get a copy of a token character map with new tokens added. Only
+        the lists of their characters are copied, the rest are shared.
+        """
+        token_characters = dict(token_characters)
+
+        copied = set()
+        for token in tokens:
+            for character in set(token):
+                if character not in copied:
+                    token_characters[character] = list(token_characters.get(character, ()))
+                    copied.add(character)
+                token_characters[character].append(token)
+
+        return token_characters
+
+    @staticmethod
+    def _extend_token_index(token_index, positions, token_lists):
+        """
+        Get a copy of a token index with appended sentences added. Only
+        the posting lists of their tokens are copied, the rest are shared.
+        """
+        token_index = dict(token_index)
+
+        copied = set()
+        for position, sentence_tokens in zip(positions, token_lists):
+            for token in set(sentence_tokens):
+                if token not in copied:
+                    token_index[token] = list(token_index.get(token, ()))
+                    copied.add(token)
+                token_index[token].append(position)
+
+        return token_index
+
+    def sentences_at(self, positions, snapshot=None):
+        """
+        Build Sentence records for row positions in bulk from the column arrays.
+
+        Args:
+            positions (list): Row positions in the order to return them.
+            snapshot (Bank_snapshot): Version to read the rows from.
+                                      Defaults to the current one.
+
+        Returns:
+            list: One Sentence per position.
+        """
+        frame = (self._snapshot if snapshot is None else snapshot).frame
+        positions = np.asarray(positions, dtype=np.int64)
+        return Sentence.from_columns(
+            frame["Sentence"].to_numpy()[positions],
+            frame["Meaning"].to_numpy()[positions],
+            frame["Custom Ratio"].to_numpy()[positions].tolist()
+        )
+
+    def _validate_i_plus_one_query(self, num_sentences, snapshot):
+        """Check the shared preconditions of the i+1 queries."""
+        if not isinstance(num_sentences, int) or isinstance(num_sentences, bool) or num_sentences <= 0:
+            raise ValueError("Num_sentences must be a int greater than zero")
+
+        if snapshot.known_words is None:
+            raise ValueError("rank_sentences must be called before i+1 queries")
+
+    def _intersect_postings(self, snapshot, target_tokens):
+        """
+        Find the rows containing every token of a word, in any order.
+
+        Args:
+            snapshot (Bank_snapshot): Version to search.
+            target_tokens (tuple): The word's tokens, e.g. ("火", "车").
+
+        Returns:
+            array: Row positions in ascending order.
+        """
+        # Intersect from the rarest token up, so the working set stays small
+        token_index = self.get_token_index(snapshot)
+        posting_lists = sorted((token_index.get(token, []) for token in set(target_tokens)), key=len)
+        positions = np.asarray(posting_lists[0], dtype=np.int64)
+        for posting_list in posting_lists[1:]:
+            positions = np.intersect1d(positions, posting_list, assume_unique=True)
+
+        return positions
+
+    @staticmethod
+    def _filter_token_runs(snapshot, positions, target_tokens):
+        """
+        Keep the rows where a word's tokens appear as one consecutive run.
+
+        Multi-token words, e.g. Chinese ones split per character, must not
+        match scattered tokens.
+
+        Args:
+            snapshot (Bank_snapshot): Version the positions belong to.
+            positions (array): Candidate row positions.
+            target_tokens (tuple): The word's tokens.
+
+        Returns:
+            array: The positions whose tokens contain the run, in input order.
+        """
+        if len(target_tokens) < 2 or len(positions) == 0:
+            return positions
+
+        tokens_column = snapshot.frame["Tokens"].to_numpy()
+        length = len(target_tokens)
+        return positions[[
+            any(tokens_column[position][i:i + length] == target_tokens
+                for i in range(len(tokens_column[position]) - length + 1))
+            for position in positions
+        ]]
+
+    def get_word_positions(self, word, snapshot=None):
+        """
+        Get the positions of the rows containing a word.
+
+        A word that tokenizes into several tokens, e.g. a Chinese word split
+        per character, must appear as a consecutive token sequence.
+
+        Args:
+            word (str): Word to look up.
+            snapshot (Bank_snapshot): Version to search. Defaults to the current one.
+
+        Returns:
+            array: Row positions in ascending order.
+        """
+        snapshot = self._snapshot if snapshot is None else snapshot
+
+        target_tokens = tokenize(normalize_text(word.strip()))
+        if not target_tokens:
+            return np.array([], dtype=np.int64)
+
+        positions = self._intersect_postings(snapshot, target_tokens)
+        return self._filter_token_runs(snapshot, positions, target_tokens)
+
+    def _i_plus_one_positions(self, snapshot, target_tokens):
+        """
+        Find the rows whose only unknown tokens are those of one occurrence
+        of a word's token sequence, highest Custom Ratio first.
+
+        Args:
+            snapshot (Bank_snapshot): The ranked version to search.
+            target_tokens (tuple): The word's tokens, e.g. ("火", "车").
+
+        Returns:
+            array: Row positions in Custom Ratio order.
+        """
+        unknown_in_target = sum(1 for token in target_tokens if not snapshot.is_known(token))
+
+        # A known word can never be the unknown word of a sentence
+        if unknown_in_target == 0:
+            return np.array([], dtype=np.int64)
+
+        positions = self._intersect_postings(snapshot, target_tokens)
+
+        # The word's unknown tokens must be the only unknown tokens
+        unknown_counts = snapshot.frame["Unknown Count"].to_numpy()
+        positions = positions[unknown_counts[positions] == unknown_in_target]
+
+        positions = self._filter_token_runs(snapshot, positions, target_tokens)
+
+        return positions[np.argsort(-snapshot.ratios[positions], kind="stable")]
+
+    def get_i_plus_one_sentences(self, word, num_sentences):
+        """
+        Get sentences whose only unknown word is the given word.
+
+        Uses the known words of the last rank_sentences call, the
+        "Unknown Count" column and the token index, so only sentences
+        containing the word are examined. A word that tokenizes into
+        several tokens, e.g. a Chinese word split per character, must
+        appear as a consecutive token sequence.
+
+        Parameters:
+        word (str): Word to find i+1 sentences for
+        num_sentences (int): Maximum number of sentences to return
+
+        Returns:
+        list: Matching Sentence records, highest Custom Ratio first
+
+        Raises:
+        ValueError: If inputs are invalid or the bank was never ranked
+        """
+        if not isinstance(word, str) or not word.strip():
+            raise ValueError("Word must be non-empty string")
+
+        snapshot = self._snapshot
+        self._validate_i_plus_one_query(num_sentences, snapshot)
+
+        target_tokens = tokenize(normalize_text(word.strip()))
+        if not target_tokens:
+            return []
+
+        positions = self._i_plus_one_positions(snapshot, target_tokens)
+
+        return self.sentences_at(positions[:num_sentences], snapshot)
+
+    def get_i_plus_one_sentences_batch(self, words, num_sentences):
+        """
+        Get i+1 sentences for many words in one pass over the candidates.
+
+        Every sentence with exactly one unknown token is visited once in
+        Custom Ratio order and handed to the word it teaches. Words that
+        tokenize into several tokens are looked up one by one like
+        get_i_plus_one_sentences.
+
+        Parameters:
+        words (list): Words to find i+1 sentences for
+        num_sentences (int): Maximum number of sentences per word
+
+        Returns:
+        dict: Each input word to its list of matching Sentence records
+
+        Raises:
+        ValueError: If inputs are invalid or the bank was never ranked
+        """
+        if not isinstance(words, list) or any(not isinstance(word, str) or not word.strip() for word in words):
+            raise ValueError("Words must be a list of non-empty strings")
+
+        snapshot = self._snapshot
+        self._validate_i_plus_one_query(num_sentences, snapshot)
+
+        # Map unknown single-token targets and multi-token targets back to
+        # the words that asked for them
+        targets = {}
+        sequences = {}
+        for word in words:
+            target_tokens = tokenize(normalize_text(word.strip()))
+            if len(target_tokens) == 1:
+                if not snapshot.is_known(target_tokens[0]):
+                    targets.setdefault(target_tokens[0], []).append(word)
+            elif target_tokens:
+                sequences.setdefault(target_tokens, []).append(word)
+
+        found = {token: [] for token in targets}
+
+        if targets and len(snapshot) > 0:
+            unknown_counts = snapshot.frame["Unknown Count"].to_numpy()
+
+            candidates = np.flatnonzero(unknown_counts == 1)
+            candidates = candidates[np.argsort(-snapshot.ratios[candidates], kind="stable")]
+
+            tokens_column = snapshot.frame["Tokens"].to_numpy()
+            open_targets = len(targets)
+            for position in candidates:
+                unknown = next(token for token in tokens_column[position] if not snapshot.is_known(token))
+
+                if unknown in found and len(found[unknown]) < num_sentences:
+                    found[unknown].append(position)
+                    if len(found[unknown]) == num_sentences:
+                        open_targets -= 1
+                        # Stop early once every target is full
+                        if open_targets == 0:
+                            break
+
+        result = {word: [] for word in words}
+        for token, positions in found.items():
+            sentences = self.sentences_at(positions, snapshot)
+            for word in targets[token]:
+                result[word] = sentences
+
+        for target_tokens, sequence_words in sequences.items():
+            positions = self._i_plus_one_positions(snapshot, target_tokens)
+            sentences = self.sentences_at(positions[:num_sentences], snapshot)
+            for word in sequence_words:
+                result[word] = sentences
+
+        return result
+
+    def add_sentence(self, sentence, meaning="", custom_ratio=0):
+        """
+        Append a sentence to the bank, computing its derived columns.
+
+        Args:
+            sentence (str): The text of the sentence.
+            meaning (str): The meaning of the sentence. Defaults to "".
+            custom_ratio (float): A value between 0 and 1. Defaults to 0.
+
+        Raises:
+            ValueError: If the sentence is empty or already in the bank,
+                        the meaning is not a string or the ratio is out
+                        of range.
+        """
+        self.add_sentences([sentence], [meaning], [custom_ratio])
+
+    def add_sentences(self, sentences, meanings=None, custom_ratios=None, rank=False):
+        """
+        Append many sentences at once, publishing a single new snapshot.
+
+        Args:
+            sentences (list): The texts of the sentences.
+            meanings (list): One meaning per sentence. Defaults to "".
+            custom_ratios (list): One value between 0 and 1 per sentence.
+                                  Defaults to 0.
+            rank (bool): Rank the new sentences against the known words of
+                         the last rank_sentences call instead of keeping
+                         custom_ratios, in the same snapshot.
+
+        Returns:
+            range: The row positions of the new sentences.
+
+        Raises:
+            ValueError: Like add_sentence, if the lists differ in length or
+                        repeat a sentence, or rank is set for a bank that
+                        was never ranked. Nothing is added then.
+        """
+        meanings = [""] * len(sentences) if meanings is None else list(meanings)
+        custom_ratios = [0] * len(sentences) if custom_ratios is None else list(custom_ratios)
+
+        if len(meanings) != len(sentences) or len(custom_ratios) != len(sentences):
+            raise ValueError("Meanings and Custom Ratios must have one entry per sentence")
+
+        for sentence, meaning, custom_ratio in zip(sentences, meanings, custom_ratios):
+            if not isinstance(sentence, str) or not sentence.strip():
+                raise ValueError("Sentence must be a non-empty string")
+
+            if not isinstance(meaning, str):
+                raise ValueError("Meaning must be a string")
+
+            if isinstance(custom_ratio, bool) or not isinstance(custom_ratio, (int, float)) or not 0 <= custom_ratio <= 1:
+                raise ValueError("Custom Ratios must be between 0 and 1")
+
+        rows = {
+            "Sentence": [sentence.strip() for sentence in sentences],
+            "Meaning": [meaning.strip() for meaning in meanings],
+            "Custom Ratio": [float(custom_ratio) for custom_ratio in custom_ratios]
+        }
+
+        if len(set(rows["Sentence"])) != len(rows["Sentence"]):
+            raise ValueError("Sentence column cannot contain duplicates")
+
+        rows.update(self._derive_columns(rows["Sentence"]))
+
+        with self._write_lock:
+            snapshot = self._snapshot
+
+            if snapshot.frame["Sentence"].isin(rows["Sentence"]).any():
+                raise ValueError("Sentence column cannot contain duplicates")
+
+            if rank and snapshot.known_words is None:
+                raise ValueError("rank_sentences must be called before ranking added sentences")
+
+            # Keep i+1 counts current once the bank has been ranked
+            if snapshot.known_words is not None:
+                rows["Unknown Count"] = [
+                    sum(1 for token in sentence_tokens if not snapshot.is_known(token))
+                    for sentence_tokens in rows["Tokens"]
+                ]
+
+            if rank:
+                rows["Custom Ratio"] = [
+                    (token_count - unknown_count) / token_count if token_count else 0
+                    for token_count, unknown_count in zip(rows["Token Count"], rows["Unknown Count"])
+                ]
+
+            positions = range(len(snapshot), len(snapshot) + len(sentences))
+
+            # Copy on write: built indexes are extended into copies for the
+            # new snapshot, readers of the current one keep theirs. The token
+            # id encoding is rebuilt on next use
+            built = snapshot.built_indexes()
+            indexes = {}
+            if "token" in built:
+                indexes["token"] = self._extend_token_index(built["token"], positions, rows["Tokens"])
+                if "token_characters" in built:
+                    new_tokens = {
+                        token for sentence_tokens in rows["Tokens"] for token in sentence_tokens
+                        if token not in built["token"]
+                    }
+                    indexes["token_characters"] = self._extend_token_characters(built["token_characters"], new_tokens)
+            if "trigram" in built:
+                indexes["trigram"] = built["trigram"].extended(rows["Normalized"])
+            if "fuzzy" in built:
+                indexes["fuzzy"] = built["fuzzy"].extended(
+                    token for sentence_tokens in rows["Tokens"] for token in sentence_tokens
+                )
+            if "frequency" in built:
+                table = Frequency_table(
+                    built["frequency"].counts, built["frequency"].sentence_count, built["frequency"].source
+                )
+                table.update(rows["Tokens"], rows["Sentence"])
+                table.path = built["frequency"].path
+                # A persisted table stays current, its source key tells
+                # later loads which rows it counted
+                if table.path is not None:
+                    try:
+                        table.save(table.path)
+                    except OSError:
+                        # Never block an append, the next load rebuilds or merges
+                        pass
+                indexes["frequency"] = table
+
+            # concat builds a new frame, the published one is left untouched
+            self._snapshot = snapshot.evolve(
+                frame=pd.concat([snapshot.frame, pd.DataFrame(rows)], ignore_index=True),
+                indexes=indexes
+            )
+
+        return positions
@@ -0,0 +1,97 @@
+class Sentence_cursor:
+    """
+    A resumable position in the ratio ordered matches of one word.
+
+    Each fetch scans the bank from where the previous one stopped, so
+    paging through "more examples" never rescans or materializes earlier
+    matches. The cursor holds the bank snapshot it started with, so pages
+    stay consistent if the bank is re-ranked or grows in the meantime.
+
+    A cursor is resumed elsewhere, e.g. by a later request, through its
+    token. The token records the snapshot's content id along with the
+    position, as a position only means something in the ratio order it was
+    taken from, and a token of another ratio order, e.g. of an older version
+    or another bank, is rejected.
+    """
+
+    def __init__(self, sentence_bank, word, token=None):
+        """
+        Args:
+            sentence_bank (Sentence_bank): The bank to page through.
+            word (str): Word to search for in sentences.
+            token (str): The token of an earlier cursor to resume from.
+                         None starts at the first match.
+
+        Raises:
+            ValueError: If the word is empty, or the token is malformed,
+                        out of range or from another version of the bank.
+        """
+        snapshot = sentence_bank.snapshot()
+        position = 0
+
+        if token is not None:
+            content_id, position = self._parse_token(token)
+            if content_id != snapshot.content_id:
+                raise ValueError("Cursor token is from another version of the bank, start a new cursor")
+            if not 0 <= position <= len(snapshot):
+                raise ValueError("Cursor token position must be between 0 and len(sentences.tsv)")
+
+        self.sentence_bank = sentence_bank
+        self.word = word
+        self.position = position
+        self.exhausted = False
+        self._snapshot = snapshot
+        self._matches = sentence_bank._scan_matches(word, snapshot, position)
+
+    @staticmethod
+    def _parse_token(token):
+        """Split a token into its snapshot content id and position."""
+        fields = token.split(":") if isinstance(token, str) else []
+        if (len(fields) != 2 or len(fields[0]) != 16
+                or any(character not in "0123456789abcdef" for character in fields[0])
+                or not fields[1].isdigit()):
+            raise ValueError("Cursor token must be the token of an earlier cursor")
+        return fields[0], int(fields[1])
+
+    @property
+    def token(self):
+        """
+        Returns:
+            str: "<content id>:<position>", resumes this cursor through
+                 Sentence_bank.cursor of any bank with the same sentences
+                 in the same ratio order.
+        """
+        return f"{self._snapshot.content_id}:{self.position}"
+
+    def fetch(self, num_sentences):
+        """
+        Get the next matches.
+
+        Args:
+            num_sentences (int): Largest number of sentences to return.
+
+        Returns:
+            list: Up to num_sentences Sentence records, fewer once the
+                  matches run out.
+
+        Raises:
+            ValueError: If num_sentences is not a positive int.
+        """
+        if isinstance(num_sentences, bool) or not isinstance(num_sentences, int) or num_sentences <= 0:
+            raise ValueError("Num_sentences must be a int greater than zero")
+
+        indices = []
+        for index in self._matches:
+            indices.append(index)
+            if len(indices) == num_sentences:
+                self.position = index + 1
+                break
+        else:
+            self.exhausted = True
+            self.position = len(self._snapshot)
+
+        return self.sentence_bank.sentences_at(self._snapshot.ratio_order[indices], self._snapshot)
+
+    def __iter__(self):
+        while not self.exhausted:
+            yield from self.fetch(1)
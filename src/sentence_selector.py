@@ -0,0 +1,152 @@
+import heapq
+
+from src.sentence_bank import normalize_text
+
+class Sentence_selector:
+    """
+    Chooses a small set of sentences from a Sentence_bank that covers a
+    list of target words.
+
+    Uses greedy weighted set cover: each step takes the sentence covering
+    the most targets that still need sentences, discounted by how many
+    unknown words it carries. Scores only ever go down as quotas fill, so
+    candidates live in a priority queue and are only rescored when they
+    reach the top (lazy greedy).
+    """
+
+    def __init__(self, sentence_bank, unknown_weight=0.5):
+        """
+        Initialize the selector.
+
+        Args:
+            sentence_bank (Sentence_bank): The bank to select sentences from.
+            unknown_weight (float): How strongly unknown words discount a
+                                    sentence. 0 ignores unknown load.
+
+        Raises:
+            ValueError: If unknown_weight is negative.
+        """
+        if isinstance(unknown_weight, bool) or not isinstance(unknown_weight, (int, float)) or unknown_weight < 0:
+            raise ValueError("unknown_weight must be a non-negative number")
+
+        self.sentence_bank = sentence_bank
+        self.unknown_weight = unknown_weight
+
+    def _unknown_loads(self, snapshot):
+        """
+        Get the unknown-word load of every sentence.
+
+        Args:
+            snapshot (Bank_snapshot): Version of the bank to read.
+
+        Returns:
+            array: "Unknown Count" once the bank is ranked, otherwise the
+                   number of tokens not covered by "Custom Ratio".
+        """
+        bank = snapshot.frame
+
+        if "Unknown Count" in bank.columns:
+            return bank["Unknown Count"].to_numpy()
+
+        return (bank["Token Count"].to_numpy() * (1 - bank["Custom Ratio"].to_numpy()))
+
+    def select(self, words, quotas=1):
+        """
+        Select sentences covering every target word its quota of times.
+
+        Args:
+            words (list): Target words. A word of several tokens, e.g. a
+                          Chinese word split per character, is covered by
+                          sentences containing its tokens consecutively.
+            quotas (int or dict): Sentences wanted per word, either one int
+                                  for all words or a dict of word to int.
+                                  Words missing from the dict get 1.
+
+        Returns:
+            tuple: (selected, uncovered) where selected is a list of
+                   sentence dictionaries with an extra "Targets" key listing
+                   the words each one covers, in selection order, and
+                   uncovered maps words to how many sentences they still
+                   lack because the bank ran out of candidates.
+
+        Raises:
+            ValueError: If words or quotas are invalid.
+        """
+        if not isinstance(words, list) or any(not isinstance(word, str) or not word.strip() for word in words):
+            raise ValueError("Words must be a list of non-empty strings")
+
+        if isinstance(quotas, dict):
+            quota_of = lambda word: quotas.get(word, 1)
+        else:
+            quota_of = lambda word: quotas
+
+        # Remaining quota per normalized target and the words it came from
+        remaining = {}
+        sources = {}
+        for word in words:
+            quota = quota_of(word)
+            if isinstance(quota, bool) or not isinstance(quota, int) or quota < 0:
+                raise ValueError("Quotas must be non-negative ints")
+
+            token = normalize_text(word.strip())
+            remaining[token] = max(remaining.get(token, 0), quota)
+            if word not in sources.setdefault(token, []):
+                sources[token].append(word)
+
+        # One version of the bank for the whole selection
+        snapshot = self.sentence_bank.snapshot()
+
+        # Targets covered by each candidate sentence, from the posting lists
+        covers = {}
+        for token, quota in remaining.items():
+            if quota == 0:
+                continue
+            for position in self.sentence_bank.get_word_positions(token, snapshot).tolist():
+                covers.setdefault(position, []).append(token)
+
+        unknown_loads = self._unknown_loads(snapshot)
+        ratios = snapshot.ratios
+
+        def score(position):
+            gain = sum(1 for token in covers[position] if remaining[token] > 0)
+            return gain / (1 + self.unknown_weight * float(unknown_loads[position]))
+
+        # Max-heap on score, ties broken by higher ratio then position
+        heap = [(-score(position), -ratios[position], position) for position in covers]
+        heapq.heapify(heap)
+
+        open_targets = sum(1 for quota in remaining.values() if quota > 0)
+        selected_positions = []
+        while heap and open_targets > 0:
+            negative_score, negative_ratio, position = heapq.heappop(heap)
+
+            current = score(position)
+            if current <= 0:
+                continue
+
+            # Stale entry: rescore and put it back unless it still beats the rest
+            if current < -negative_score and heap and -heap[0][0] > current:
+                heapq.heappush(heap, (-current, negative_ratio, position))
+                continue
+
+            covered = [token for token in covers[position] if remaining[token] > 0]
+            for token in covered:
+                remaining[token] -= 1
+                if remaining[token] == 0:
+                    open_targets -= 1
+
+            selected_positions.append((position, covered))
+
+        sentences = self.sentence_bank.sentences_at([position for position, _ in selected_positions], snapshot)
+        selected = [
+            {**sentence.to_dict(), "Targets": [word for token in covered for word in sources[token]]}
+            for sentence, (_, covered) in zip(sentences, selected_positions)
+        ]
+
+        uncovered = {
+            word: missing
+            for token, missing in remaining.items() if missing > 0
+            for word in sources[token]
+        }
+
+        return selected, uncovered
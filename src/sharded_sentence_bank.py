@@ -0,0 +1,210 @@
+import os
+import threading
+
+from collections import OrderedDict
+from concurrent.futures import Future
+from src.sentence_bank import Sentence_bank
+
+class Sharded_sentence_bank:
+    """
+    A collection of per-language Sentence_banks loaded lazily on first use.
+
+    Each language lives in its own TSV shard. Loaded shards are kept in
+    least recently used order and evicted once their combined memory goes
+    over max_memory_bytes, so a single process can serve many languages
+    without holding all of them in RAM.
+    """
+
+    def __init__(self, shards="./data/sentences", max_memory_bytes=None):
+        """
+        Initialize the sharded bank without loading any shard.
+
+        Args:
+            shards (str or dict): Either a directory holding one
+                                  "<language>.tsv" file per language, or a
+                                  dict mapping language to TSV path.
+                                  Defaults to "./data/sentences".
+            max_memory_bytes (int): Soft cap on the memory of loaded shards.
+                                    None disables eviction.
+
+        Raises:
+            ValueError: If shards is neither a directory nor a dict, or
+                        max_memory_bytes is not a positive int.
+        """
+        if max_memory_bytes is not None and (not isinstance(max_memory_bytes, int) or max_memory_bytes <= 0):
+            raise ValueError("max_memory_bytes must be a positive int or None")
+
+        if isinstance(shards, dict):
+            self.shard_paths = {
+                self._normalize_language(language): path for language, path in shards.items()
+            }
+        elif isinstance(shards, str) and os.path.isdir(shards):
+            self.shard_paths = {
+                self._normalize_language(file_name[:-len(".tsv")]): os.path.join(shards, file_name)
+                for file_name in sorted(os.listdir(shards))
+                if file_name.endswith(".tsv")
+            }
+        else:
+            raise ValueError("shards must be a directory of .tsv files or a dict of language to path")
+
+        self.max_memory_bytes = max_memory_bytes
+
+        # Loaded shards in least recently used order, with their sizes
+        self._loaded = OrderedDict()
+        self._sizes = {}
+
+        # Shards being loaded, language -> Future of the Sentence_bank
+        self._loading = {}
+
+        # Guards the dicts only, shards are loaded without holding it
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize_language(language):
+        """Normalize a language name the same way Word does."""
+        if not isinstance(language, str) or not language.strip():
+            raise ValueError("Language must be a non-empty string")
+
+        return language.strip().lower()
+
+    @staticmethod
+    def _estimate_size(sentence_bank):
+        """
+        Estimate the bytes held by a loaded Sentence_bank.
+
+        Args:
+            sentence_bank (Sentence_bank): The loaded shard.
+
+        Returns:
+            int: Approximate memory use of its DataFrame and derived columns.
+        """
+        frame = sentence_bank.snapshot().frame
+        base_columns = [
+            column for column in frame.columns
+            if column not in ("Normalized", "Tokens", "Token Count")
+        ]
+        base_usage = frame[base_columns].memory_usage(index=True, deep=True).sum()
+
+        return int(base_usage) + sentence_bank.derived_memory_usage()
+
+    def languages(self):
+        """
+        Returns:
+            list: Every language with a shard, loaded or not.
+        """
+        return sorted(self.shard_paths)
+
+    def loaded_languages(self):
+        """
+        Returns:
+            list: The currently loaded languages, least recently used first.
+        """
+        with self._lock:
+            return list(self._loaded)
+
+    def memory_usage(self):
+        """
+        Returns:
+            int: Approximate bytes held by all loaded shards.
+        """
+        with self._lock:
+            return sum(self._sizes.values())
+
+    def get_bank(self, language):
+        """
+        Get the Sentence_bank for a language, loading it on first use.
+
+        A shard is loaded outside the lock, so queries of loaded languages
+        never wait for it. Concurrent first requests for the same language
+        share one load.
+
+        Args:
+            language (str): The language of the shard.
+
+        Returns:
+            Sentence_bank: The loaded shard.
+
+        Raises:
+            ValueError: If there is no shard for the language.
+        """
+        language = self._normalize_language(language)
+
+        if language not in self.shard_paths:
+            raise ValueError(f"No sentence bank for language {language}")
+
+        with self._lock:
+            if language in self._loaded:
+                self._loaded.move_to_end(language)
+                return self._loaded[language]
+
+            future = self._loading.get(language)
+            loading = future is None
+            if loading:
+                future = Future()
+                self._loading[language] = future
+
+        # Another thread is loading the shard, wait for its result
+        if not loading:
+            return future.result()
+
+        try:
+            sentence_bank = Sentence_bank(self.shard_paths[language])
+            size = self._estimate_size(sentence_bank)
+        except BaseException as error:
+            with self._lock:
+                del self._loading[language]
+            future.set_exception(error)
+            raise
+
+        with self._lock:
+            del self._loading[language]
+            self._loaded[language] = sentence_bank
+            self._sizes[language] = size
+
+            self._evict_over_cap(keep=language)
+
+        future.set_result(sentence_bank)
+        return sentence_bank
+
+    def _evict_over_cap(self, keep):
+        """
+        Evict least recently used shards until under the memory cap.
+        The shard named by keep is never evicted. Caller holds the lock.
+        """
+        if self.max_memory_bytes is None:
+            return
+
+        while sum(self._sizes.values()) > self.max_memory_bytes and len(self._loaded) > 1:
+            oldest = next(iter(self._loaded))
+            if oldest == keep:
+                break
+
+            del self._loaded[oldest]
+            del self._sizes[oldest]
+
+    def evict(self, language):
+        """
+        Drop a loaded shard. It is reloaded on next use.
+
+        Args:
+            language (str): The language of the shard.
+        """
+        language = self._normalize_language(language)
+
+        with self._lock:
+            self._loaded.pop(language, None)
+            self._sizes.pop(language, None)
+
+    def get_sentences(self, language, word, num_sentences):
+        """
+        Get sentences containing a word from the shard of a language.
+
+        Args:
+            language (str): The language of the shard.
+            word (str): Word to search for in sentences.
+            num_sentences (int): Number of sentences to return.
+
+        Returns:
+            list: The matches, see Sentence_bank.get_sentences.
+        """
+        return self.get_bank(language).get_sentences(word, num_sentences)
@@ -0,0 +1,245 @@
+import os
+import pandas as pd
+import sqlite3
+
+from src.sentence import Sentence
+from src.sentence_bank import normalize_text
+
+SCHEMA = """
+CREATE TABLE sentences (
+    id INTEGER PRIMARY KEY,
+    sentence TEXT NOT NULL UNIQUE,
+    meaning TEXT NOT NULL,
+    custom_ratio REAL NOT NULL CHECK (custom_ratio BETWEEN 0 AND 1),
+    normalized TEXT NOT NULL
+);
+CREATE INDEX sentences_custom_ratio ON sentences (custom_ratio DESC, id);
+CREATE VIRTUAL TABLE sentences_fts USING fts5(
+    normalized,
+    content='sentences',
+    content_rowid='id',
+    tokenize='trigram'
+);
+"""
+
+# Optional, see Sqlite_sentence_bank.create
+GRAMS_SCHEMA = """
+CREATE TABLE sentences_grams (
+    gram TEXT NOT NULL,
+    custom_ratio REAL NOT NULL,
+    id INTEGER NOT NULL,
+    PRIMARY KEY (gram, custom_ratio DESC, id)
+) WITHOUT ROWID;
+"""
+
+# FTS5 trigram queries need at least this many characters
+TRIGRAM_LENGTH = 3
+
+def short_grams(normalized):
+    """
+    Args:
+        normalized (str): A sentence's normalized text.
+
+    Returns:
+        set: Every one and two character substring of the text, the terms
+             too short for the trigram index.
+    """
+    return {
+        normalized[i:i + length]
+        for length in range(1, TRIGRAM_LENGTH)
+        for i in range(len(normalized) - length + 1)
+    }
+
+class Sqlite_sentence_bank:
+    """
+    A Sentence_bank backed by a local SQLite database.
+
+    Sentences live on disk with an FTS5 trigram index over their
+    normalized text and an index on "Custom Ratio", so get_sentences is an
+    indexed query with a LIMIT and memory stays flat regardless of corpus
+    size. Terms shorter than a trigram, e.g. single Chinese characters,
+    scan the "Custom Ratio" index until enough rows match, or, in a
+    database created with short_terms, are looked up in a table of every
+    one and two character substring ordered by "Custom Ratio". The
+    database uses WAL so many processes can read it at once.
+    """
+
+    def __init__(self, path_to_sqlite_db="./data/sentences.sqlite"):
+        """
+        Open an existing database read-only.
+
+        Args:
+            path_to_sqlite_db (str): Path of a database written by create.
+                                     Defaults to "./data/sentences.sqlite".
+
+        Raises:
+            ValueError: If the path is not a string ending in .sqlite.
+            FileNotFoundError: If the database does not exist.
+        """
+        if not isinstance(path_to_sqlite_db, str) or not path_to_sqlite_db.split('.')[-1] == "sqlite":
+            raise ValueError("path_to_sqlite_db must be a string ending with .sqlite")
+
+        if not os.path.exists(path_to_sqlite_db):
+            raise FileNotFoundError(f"[Errno 2] No such file or directory: '{path_to_sqlite_db}'")
+
+        self.path_to_sqlite_db = path_to_sqlite_db
+        self.connection = sqlite3.connect(f"file:{path_to_sqlite_db}?mode=ro", uri=True)
+        self._length = self.connection.execute("SELECT COUNT(*) FROM sentences").fetchone()[0]
+
+        # Databases without sentences_grams scan for short terms
+        self._has_grams = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sentences_grams'"
+        ).fetchone() is not None
+
+    @classmethod
+    def create(cls, path_to_sentences_tsv, path_to_sqlite_db, chunk_size=50000, short_terms=False):
+        """
+        Build a database from a sentence bank TSV, streaming it in chunks.
+
+        Args:
+            path_to_sentences_tsv (str): TSV with "Sentence", "Meaning" and "Custom Ratio" columns.
+            path_to_sqlite_db (str): Path of the database to create. Must not exist.
+            chunk_size (int): Rows read and inserted per transaction.
+            short_terms (bool): Also build the table of one and two character
+                                substrings, so short terms are indexed rather
+                                than scanned. It holds a row per distinct
+                                substring of every sentence, making the
+                                database roughly 30 times the size of the TSV.
+
+        Returns:
+            Sqlite_sentence_bank: The new database opened read-only.
+
+        Raises:
+            ValueError: If the paths are invalid, the database exists,
+                        required columns are missing, duplicate sentences
+                        exist or custom ratios are out of range.
+        """
+        if not isinstance(path_to_sentences_tsv, str) or not path_to_sentences_tsv.split('.')[-1] == "tsv":
+            raise ValueError("path_to_sentences_tsv must end with .tsv")
+
+        if not isinstance(path_to_sqlite_db, str) or not path_to_sqlite_db.split('.')[-1] == "sqlite":
+            raise ValueError("path_to_sqlite_db must be a string ending with .sqlite")
+
+        if os.path.exists(path_to_sqlite_db):
+            raise ValueError(f"{path_to_sqlite_db} already exists")
+
+        connection = sqlite3.connect(path_to_sqlite_db)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA + GRAMS_SCHEMA if short_terms else SCHEMA)
+
+            REQUIRED_SENTENCE_BANK_COLUMNS = ["Sentence", "Meaning", "Custom Ratio"]
+            # Ids are assigned here so the grams can refer to them
+            next_id = 1
+            for chunk in pd.read_csv(path_to_sentences_tsv, sep='\t', chunksize=chunk_size):
+                for column_name in REQUIRED_SENTENCE_BANK_COLUMNS:
+                    if column_name not in chunk.columns:
+                        raise ValueError(
+                            f"Column {column_name} not found. Expected at least '{REQUIRED_SENTENCE_BANK_COLUMNS}', "
+                            f"but found {chunk.columns}"
+                        )
+
+                # Same cleaning as Sentence_bank
+                sentences = [i.strip() for i in chunk["Sentence"].fillna("")]
+                meanings = [i.strip() for i in chunk["Meaning"].fillna("")]
+                ratios = pd.to_numeric(chunk["Custom Ratio"].fillna(0).astype(float)).tolist()
+                normalized = [normalize_text(i) for i in sentences]
+                ids = range(next_id, next_id + len(sentences))
+                next_id += len(sentences)
+
+                try:
+                    with connection:
+                        connection.executemany(
+                            "INSERT INTO sentences (id, sentence, meaning, custom_ratio, normalized) VALUES (?, ?, ?, ?, ?)",
+                            zip(ids, sentences, meanings, ratios, normalized)
+                        )
+                        if short_terms:
+                            connection.executemany(
+                                "INSERT INTO sentences_grams (gram, custom_ratio, id) VALUES (?, ?, ?)",
+                                (
+                                    (gram, ratio, sentence_id)
+                                    for sentence_id, ratio, text in zip(ids, ratios, normalized)
+                                    for gram in short_grams(text)
+                                )
+                            )
+                except sqlite3.IntegrityError as error:
+                    if "UNIQUE" in str(error):
+                        raise ValueError("Sentence column cannot contain duplicates") from None
+                    raise ValueError("Custom Ratios must be between 0 and 1") from None
+
+            with connection:
+                connection.execute("INSERT INTO sentences_fts(sentences_fts) VALUES ('rebuild')")
+        except BaseException:
+            connection.close()
+            os.remove(path_to_sqlite_db)
+            raise
+
+        connection.close()
+        return cls(path_to_sqlite_db)
+
+    def __len__(self):
+        return self._length
+
+    def get_sentences(self, word, num_sentences):
+        """
+        Get sentences containing the specified word.
+
+        Words of three or more characters are looked up in the trigram
+        index, shorter words (e.g. single Chinese characters) in the table
+        of one and two character substrings when the database has one, and
+        otherwise by scanning sentences. All are read in Custom Ratio order
+        and stop after num_sentences matches.
+
+        Parameters:
+        word (str): Word to search for in sentences
+        num_sentences (int): Number of sentences to return
+
+        Returns:
+        list: Sentence records of the matches
+
+        Raises:
+        ValueError: If inputs are invalid
+        """
+        # Validate inputs
+        if not isinstance(word, str) or not word:
+            raise ValueError("Word must be non-empty string")
+
+        if not isinstance(num_sentences, int) or num_sentences <= 0:
+            raise ValueError("Num_sentences must be a int greater than zero and less than len(sentences.tsv)")
+
+        if num_sentences > self._length:
+            raise ValueError("Num_sentences must be a int greater than zero and less than len(sentences.tsv)")
+
+        search_term = normalize_text(word)
+
+        if len(search_term) >= TRIGRAM_LENGTH:
+            # Quote the term so FTS5 treats it as a literal substring
+            rows = self.connection.execute(
+                "SELECT s.sentence, s.meaning, s.custom_ratio "
+                "FROM sentences_fts JOIN sentences s ON s.id = sentences_fts.rowid "
+                "WHERE sentences_fts MATCH ? "
+                "ORDER BY s.custom_ratio DESC, s.id LIMIT ?",
+                ('"' + search_term.replace('"', '""') + '"', num_sentences)
+            )
+        elif self._has_grams:
+            rows = self.connection.execute(
+                "SELECT s.sentence, s.meaning, s.custom_ratio "
+                "FROM sentences_grams g JOIN sentences s ON s.id = g.id "
+                "WHERE g.gram = ? "
+                "ORDER BY g.custom_ratio DESC, g.id LIMIT ?",
+                (search_term, num_sentences)
+            )
+        else:
+            rows = self.connection.execute(
+                "SELECT sentence, meaning, custom_ratio FROM sentences "
+                "INDEXED BY sentences_custom_ratio "
+                "WHERE instr(normalized, ?) > 0 "
+                "ORDER BY custom_ratio DESC, id LIMIT ?",
+                (search_term, num_sentences)
+            )
+
+        return [Sentence(sentence, meaning, ratio) for sentence, meaning, ratio in rows]
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
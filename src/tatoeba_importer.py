@@ -0,0 +1,191 @@
+import argparse
+import bz2
+import csv
+import gzip
+import time
+
+def _open_text(path):
+    """
+    Open a dump for streaming text reads, decompressing .gz and .bz2.
+
+    Args:
+        path (str): Path of the dump.
+
+    Returns:
+        file: A text file object.
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8", newline="")
+    if path.endswith(".bz2"):
+        return bz2.open(path, "rt", encoding="utf-8", newline="")
+    return open(path, encoding="utf-8", newline="")
+
+class _Throughput:
+    """Reports rows per second of one import phase every progress_every rows."""
+
+    def __init__(self, phase, progress_every, report):
+        self.phase = phase
+        self.progress_every = progress_every
+        self.report = report
+        self.rows = 0
+        self.start = time.perf_counter()
+
+    def tick(self):
+        self.rows += 1
+        if self.report is not None and self.rows % self.progress_every == 0:
+            self.done(final=False)
+
+    def done(self, final=True):
+        if self.report is None:
+            return
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        status = "done" if final else "running"
+        self.report(f"{self.phase} {status}: {self.rows} rows, {self.rows / elapsed:.0f} rows/s")
+
+def _read_sentences(sentences_file):
+    """
+    Stream (id, language, text) rows from a Tatoeba sentences dump.
+
+    Malformed lines are skipped.
+    """
+    for line in sentences_file:
+        fields = line.rstrip("\r\n").split("\t", 2)
+        if len(fields) != 3 or not fields[0].isdigit():
+            continue
+        yield int(fields[0]), fields[1], fields[2].strip()
+
+def _read_links(links_file):
+    """Stream (sentence_id, translation_id) pairs from a Tatoeba links dump."""
+    for line in links_file:
+        fields = line.rstrip("\r\n").split("\t")
+        if len(fields) < 2 or not fields[0].isdigit() or not fields[1].isdigit():
+            continue
+        yield int(fields[0]), int(fields[1])
+
+def import_tatoeba(sentences_path, links_path, output_path, source_language, target_language, progress_every=100000, report=None):
+    """
+    Build a Sentence_bank TSV from Tatoeba sentences and links dumps.
+
+    The dumps are streamed three times, never loaded whole:
+    1. sentences: keep the texts of the source language (the output
+       sentences) and only the ids of the target language.
+    2. links: pair each source sentence with its first translation into
+       the target language.
+    3. sentences: when a needed translation streams past, write the rows
+       of every source sentence it translates.
+    Memory is therefore bounded by the size of the chosen language pair,
+    not by the size of the dumps.
+
+    Args:
+        sentences_path (str): Tatoeba sentences dump (id, lang, text), optionally .gz or .bz2.
+        links_path (str): Tatoeba links dump (sentence_id, translation_id), optionally .gz or .bz2.
+        output_path (str): TSV to write with "Sentence", "Meaning" and "Custom Ratio" columns.
+        source_language (str): Tatoeba code of the sentences, e.g. "spa".
+        target_language (str): Tatoeba code of the meanings, e.g. "eng".
+        progress_every (int): Rows between throughput reports.
+        report (callable): Receives throughput messages, e.g. print.
+                           Defaults to None, which silences them.
+
+    Returns:
+        int: Number of sentences written.
+
+    Raises:
+        ValueError: If the languages are invalid, the output is not a .tsv
+                    or progress_every is not a positive int.
+    """
+    for language in (source_language, target_language):
+        if not isinstance(language, str) or not language.strip():
+            raise ValueError("Languages must be non-empty strings")
+
+    if not isinstance(output_path, str) or not output_path.split('.')[-1] == "tsv":
+        raise ValueError("output_path must end with .tsv")
+
+    if isinstance(progress_every, bool) or not isinstance(progress_every, int) or progress_every < 1:
+        raise ValueError("progress_every must be a positive int")
+
+    # Pass 1: source texts (deduplicated, Sentence_bank rejects duplicates) and target ids
+    source_texts = {}
+    seen_texts = set()
+    target_ids = set()
+    throughput = _Throughput("sentences", progress_every, report)
+    with _open_text(sentences_path) as sentences_file:
+        for sentence_id, language, text in _read_sentences(sentences_file):
+            throughput.tick()
+            if language == source_language and text and text not in seen_texts:
+                source_texts[sentence_id] = text
+                seen_texts.add(text)
+            elif language == target_language and text:
+                target_ids.add(sentence_id)
+    throughput.done()
+    del seen_texts
+
+    # Pass 2: hash-join links against both sides, first translation wins
+    sources_of_translation = {}
+    paired = set()
+    throughput = _Throughput("links", progress_every, report)
+    with _open_text(links_path) as links_file:
+        for sentence_id, translation_id in _read_links(links_file):
+            throughput.tick()
+            if sentence_id in source_texts and translation_id in target_ids and sentence_id not in paired:
+                sources_of_translation.setdefault(translation_id, []).append(sentence_id)
+                paired.add(sentence_id)
+    throughput.done()
+    del target_ids, paired
+
+    # Pass 3: stream translations and write joined rows as they appear
+    written = 0
+    throughput = _Throughput("translations", progress_every, report)
+    with _open_text(sentences_path) as sentences_file, \
+            open(output_path, "w", encoding="utf-8", newline="", buffering=1024 * 1024) as output_file:
+        writer = csv.writer(output_file, delimiter="\t", lineterminator="\n")
+        writer.writerow(["Sentence", "Meaning", "Custom Ratio"])
+
+        for sentence_id, language, text in _read_sentences(sentences_file):
+            throughput.tick()
+            if language != target_language or sentence_id not in sources_of_translation:
+                continue
+
+            for source_id in sources_of_translation.pop(sentence_id):
+                writer.writerow([source_texts.pop(source_id), text, 0])
+                written += 1
+    throughput.done()
+
+    if report is not None:
+        report(f"wrote {written} {source_language}-{target_language} sentences to {output_path}")
+
+    return written
+
+def main(argv=None):
+    """
+    Command line entry point, printing throughput while importing.
+
+    Usage: python -m src.tatoeba_importer sentences.csv links.csv spa.tsv spa eng
+
+    Args:
+        argv (list): Arguments without the program name. Defaults to sys.argv.
+
+    Returns:
+        int: Number of sentences written.
+    """
+    parser = argparse.ArgumentParser(description="Build a Sentence_bank TSV from Tatoeba dumps.")
+    parser.add_argument("sentences_path", help="Tatoeba sentences dump, optionally .gz or .bz2")
+    parser.add_argument("links_path", help="Tatoeba links dump, optionally .gz or .bz2")
+    parser.add_argument("output_path", help="TSV to write")
+    parser.add_argument("source_language", help="Tatoeba code of the sentences, e.g. spa")
+    parser.add_argument("target_language", help="Tatoeba code of the meanings, e.g. eng")
+    parser.add_argument("--progress-every", type=int, default=100000, help="Rows between throughput reports")
+    parser.add_argument("--quiet", action="store_true", help="Do not print throughput")
+    arguments = parser.parse_args(argv)
+
+    return import_tatoeba(
+        arguments.sentences_path,
+        arguments.links_path,
+        arguments.output_path,
+        arguments.source_language,
+        arguments.target_language,
+        progress_every=arguments.progress_every,
+        report=None if arguments.quiet else print
+    )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+import hashlib
+import numpy as np
+import zipfile
+
+from src.atomic_write import atomic_path
+
+# Bump whenever normalize_text or tokenize change so old caches are ignored
+TOKENIZER_VERSION = 1
+
+def token_cache_path(path_to_sentences_tsv):
+    """
+    Get the path a bank's token cache is persisted to.
+
+    Args:
+        path_to_sentences_tsv (str): Path of the sentence bank TSV.
+
+    Returns:
+        str: The same path with ".tsv" replaced by ".tokens.npz".
+    """
+    return path_to_sentences_tsv[:-len(".tsv")] + ".tokens.npz"
+
+def sentence_keys(sentences):
+    """
+    Hash every sentence to a 64 bit key.
+
+    Args:
+        sentences (iterable): Stripped sentence strings.
+
+    Returns:
+        array: uint64 content hash of each sentence.
+    """
+    return np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(sentence.encode("utf-8"), digest_size=8).digest(), "little")
+            for sentence in sentences
+        ),
+        dtype=np.uint64
+    )
+
+class Token_cache:
+    """
+    Token ids of sentences keyed by a hash of their content.
+
+    Uses the layout of Sentence_bank.encode_tokens, a vocabulary plus flat
+    int32 token ids and int64 offsets, with one key per sentence. Sentences
+    are found by key, so the cache stays valid when rows are reordered,
+    removed or added; only sentences it has never seen need tokenizing.
+    """
+
+    def __init__(self, keys, vocabulary, token_ids, offsets):
+        """
+        Args:
+            keys (array): uint64 key of every cached sentence.
+            vocabulary (list): Distinct tokens indexed by id.
+            token_ids (array): int32 token ids of all sentences concatenated.
+            offsets (array): int64, sentence i is token_ids[offsets[i]:offsets[i + 1]].
+        """
+        self.keys = np.asarray(keys, dtype=np.uint64)
+        self.vocabulary = vocabulary
+        self.token_ids = np.asarray(token_ids, dtype=np.int32)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+
+        self._sorted = np.argsort(self.keys, kind="stable")
+
+    def __len__(self):
+        return len(self.keys)
+
+    def find(self, keys):
+        """
+        Look up the cached rows of sentences.
+
+        Args:
+            keys (array): uint64 keys from sentence_keys.
+
+        Returns:
+            array: int64 cached row of each key, -1 where it is not cached.
+        """
+        keys = np.asarray(keys, dtype=np.uint64)
+        if len(self.keys) == 0:
+            return np.full(len(keys), -1, dtype=np.int64)
+
+        sorted_keys = self.keys[self._sorted]
+        slots = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+        return np.where(sorted_keys[slots] == keys, self._sorted[slots], -1).astype(np.int64)
+
+    def save(self, path):
+        """
+        Persist the cache as an .npz file.
+
+        Args:
+            path (str): Path of the file, ending in ".npz".
+        """
+        # Tokens never contain whitespace, so newlines separate them
+        vocabulary = np.frombuffer("\n".join(self.vocabulary).encode("utf-8"), dtype=np.uint8)
+
+        with atomic_path(path) as temporary_path, open(temporary_path, "wb") as file:
+            np.savez(
+                file,
+                version=np.array([TOKENIZER_VERSION]),
+                keys=self.keys,
+                vocabulary=vocabulary,
+                token_ids=self.token_ids,
+                offsets=self.offsets
+            )
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load a cache written by save.
+
+        Args:
+            path (str): Path of the .npz file.
+
+        Returns:
+            Token_cache: The cache, or None if it was written by another
+                         tokenizer version or is unreadable.
+        """
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data["version"][0]) != TOKENIZER_VERSION:
+                    return None
+                blob = data["vocabulary"].tobytes().decode("utf-8")
+                return cls(
+                    data["keys"],
+                    blob.split("\n") if blob else [],
+                    data["token_ids"],
+                    data["offsets"]
+                )
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            return None
@@ -0,0 +1,159 @@
+import re
+
+# Runs of query characters that are not wildcards
+LITERAL_PATTERN = re.compile(r'[^*?]+')
+# Quoted phrases or single terms of a query
+QUERY_TERM_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+def trigrams(text):
+    """
+    Args:
+        text (str): Normalized text.
+
+    Returns:
+        set: Every three character substring of the text.
+    """
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _word_pattern(word):
+    """
+    Translate one query word into a regex.
+
+    "*" matches any run of word characters and "?" exactly one. Words
+    containing a wildcard must match whole words, so "habl*" is a prefix
+    query and "*ción" a suffix query. Plain words match anywhere, like
+    Sentence_bank.get_sentences.
+    """
+    pattern = "".join(
+        r'\w*' if c == "*" else r'\w' if c == "?" else re.escape(c)
+        for c in word
+    )
+
+    if "*" in word or "?" in word:
+        return r'(?<!\w)' + pattern + r'(?!\w)'
+    return pattern
+
+def parse_query(query):
+    """
+    Parse a query into a verification regex and its required literals.
+
+    A query is a list of terms that must all appear, in any order. A term
+    is either a single word or a "quoted phrase" whose words must appear
+    consecutively, separated only by spaces or punctuation.
+
+    Args:
+        query (str): A normalized query, e.g. 'habl* "muy bien" c?sa'.
+
+    Returns:
+        tuple: (patterns, literals) where patterns is a list of compiled
+               regexes, one per term, and literals lists the wildcard free
+               fragments every match must contain.
+
+    Raises:
+        ValueError: If the query has no terms.
+    """
+    patterns = []
+    literals = []
+
+    for match in QUERY_TERM_PATTERN.finditer(query):
+        phrase, word = match.groups()
+        words = phrase.split() if phrase is not None else [word]
+        if not words:
+            continue
+
+        patterns.append(re.compile(r'\W+'.join(_word_pattern(word) for word in words)))
+        for word in words:
+            literals.extend(LITERAL_PATTERN.findall(word))
+
+    if not patterns:
+        raise ValueError("Query must contain at least one term")
+
+    return patterns, literals
+
+class Trigram_index:
+    """
+    Character trigram index over normalized sentences.
+
+    Maps every trigram to the positions of the sentences containing it, so
+    the candidates for a query are the intersection of the posting lists
+    of its literal fragments. Only those candidates need to be checked
+    against the real pattern.
+    """
+
+    def __init__(self, normalized_sentences=()):
+        """
+        Args:
+            normalized_sentences (iterable): Sentences in row order.
+        """
+        self.postings = {}
+        self.size = 0
+
+        for sentence in normalized_sentences:
+            self.add(sentence)
+
+    def add(self, normalized_sentence):
+        """
+        Index the next sentence. Positions are assigned in insertion order.
+
+        Args:
+            normalized_sentence (str): The sentence's normalized text.
+        """
+        for trigram in trigrams(normalized_sentence):
+            self.postings.setdefault(trigram, []).append(self.size)
+        self.size += 1
+
+    def extended(self, normalized_sentences):
+        """
+        Get a copy with more sentences indexed, leaving this index as it is.
+
+        Only the posting lists of trigrams in the new sentences are copied,
+        every other list is shared with this index.
+
+        Args:
+            normalized_sentences (iterable): The next sentences in row order.
+
+        Returns:
+            Trigram_index: The extended copy.
+        """
+        index = Trigram_index()
+        index.postings = dict(self.postings)
+        index.size = self.size
+
+        copied = set()
+        for sentence in normalized_sentences:
+            for trigram in trigrams(sentence):
+                if trigram not in copied:
+                    index.postings[trigram] = list(index.postings.get(trigram, ()))
+                    copied.add(trigram)
+                index.postings[trigram].append(index.size)
+            index.size += 1
+
+        return index
+
+    def candidates(self, literals):
+        """
+        Get the positions that can contain every literal.
+
+        Args:
+            literals (list): Fragments a match must contain.
+
+        Returns:
+            list: Sorted candidate positions, or None when no literal is
+                  long enough to have a trigram and nothing can be ruled out.
+        """
+        required = set()
+        for literal in literals:
+            required |= trigrams(literal)
+
+        if not required:
+            return None
+
+        # Intersect the shortest posting lists first
+        posting_lists = sorted((self.postings.get(trigram, []) for trigram in required), key=len)
+        result = set(posting_lists[0])
+        for posting_list in posting_lists[1:]:
+            if not result:
+                break
+            result.intersection_update(posting_list)
+
+        return sorted(result)
@@ -1,9 +1,88 @@
+import os
 import pandas as pd
 import regex
 import genanki
 
+from functools import lru_cache
+from src.sentence_bank import normalize_text
+
+# Regex pattern:
+# \p{L}: Matches any kind of letter from any language.
+# \p{N}: Matches any kind of numeric character.
+# \s: Matches whitespace.
+VALID_STRING_PATTERN = regex.compile(r'^[\p{L}\p{N}\s]+$')
+
+def _file_version(path):
+    """Identify the current content of a file by modification time and size."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+@lru_cache(maxsize=32)
+def _read_known_words(path_to_known_csv, version):
+    known_df = pd.read_csv(path_to_known_csv)
+
+    return frozenset(i.strip() for i in known_df[known_df.columns[0]] if isinstance(i, str))
+
+@lru_cache(maxsize=32)
+def _lemmatize_known_words(path_to_known_csv, version, lemmatizer):
+    known_words = _read_known_words(path_to_known_csv, version)
+
+    return frozenset(lemmatizer.lemmatize_all(normalize_text(word) for word in known_words))
+
+def load_known_words(path_to_known_csv):
+    """
+    Load the set of known words from the first column of a CSV file.
+
+    The file is read once per version: later calls reuse the set until
+    the file's modification time or size changes.
+
+    Args:
+        path_to_known_csv (str): Path to the CSV file containing known words.
+
+    Returns:
+        frozenset: The stripped known words.
+    """
+    return _read_known_words(path_to_known_csv, _file_version(path_to_known_csv))
+
+def load_known_lemmas(path_to_known_csv, lemmatizer):
+    """
+    Load the lemmas of the known words of a CSV file, cached like
+    load_known_words and per lemmatizer.
+
+    Args:
+        path_to_known_csv (str): Path to the CSV file containing known words.
+        lemmatizer (Lemmatizer): Lemmatizer to apply to the normalized words.
+
+    Returns:
+        frozenset: The lemmas of the known words.
+    """
+    return _lemmatize_known_words(path_to_known_csv, _file_version(path_to_known_csv), lemmatizer)
+
+class WordValidationError(ValueError):
+    """
+    Raised by Word.from_many when one or more words are invalid.
+
+    Attributes:
+        errors (list): One (index, word, message) tuple per invalid word.
+    """
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__(
+            f"{len(errors)} invalid word(s): "
+            + "; ".join(f"[{index}] {word!r}: {message}" for index, word, message in errors)
+        )
+
 class Word:
-    def __init__(self, word, language, definition="",  path_to_known_csv="./data/known.csv"):
+    # Fixed attributes instead of a per-instance __dict__
+    __slots__ = ("word", "lang", "definition", "path_to_known_csv", "lemmatizer", "known_word", "_vocab_note")
+
+    # Hardcoded Model ID
+    vocab_model_id = 275837465987236587
+
+    # genanki.Model shared by every vocab note, built on first use
+    _vocab_model = None
+
+    def __init__(self, word, language, definition="",  path_to_known_csv="./data/known.csv", known_words=None, lemmatizer=None):
         """
         Initialize a Word object.
 
@@ -12,6 +91,8 @@ class Word:
             language (str): The language of the word. Must be a non-empty string containing valid characters.
             definition (str): The words defintion in you native language defaults to ""
             path_to_known_csv (str): Path to the CSV file containing known words. Defaults to "./data/known.csv".
+            known_words (set): Already loaded known words. When given the CSV file is not read.
+            lemmatizer (Lemmatizer): Optional lemmatizer so inflected forms of known words count as known.
 
         Raises:
             ValueError: If the word is not a non-empty string or contains invalid characters.
@@ -41,22 +122,190 @@ class Word:
         if not isinstance(definition, str):
             raise ValueError("Definition must be a string")
 
+        if known_words is not None and lemmatizer is not None:
+            known_words = lemmatizer.lemmatize_all(normalize_text(word) for word in known_words)
+
+        self._initialize(self.word, self.lang, definition, path_to_known_csv, known_words, lemmatizer)
+
+    @classmethod
+    def from_many(cls, words, language, definitions=None, path_to_known_csv="./data/known.csv", lemmatizer=None):
+        """
+        Validate and construct many Word objects in a single pass.
+
+        The language is validated once, every word is checked against the
+        precompiled pattern and known status is resolved against a single
+        load of the known words CSV.
+
+        Args:
+            words (list): The words to construct.
+            language (str): The language shared by all the words.
+            definitions (list): Optional definitions, one per word.
+            path_to_known_csv (str): Path to the CSV file containing known words. Defaults to "./data/known.csv".
+            lemmatizer (Lemmatizer): Optional lemmatizer so inflected forms of known words count as known.
+
+        Returns:
+            list: One Word per input word, in input order.
+
+        Raises:
+            ValueError: If the language or definitions are invalid.
+            WordValidationError: If any word is invalid, listing every invalid word.
+        """
+        lang, normalized_words, definitions = cls.validate_many(words, language, definitions)
+
+        if lemmatizer is not None:
+            known_words = load_known_lemmas(path_to_known_csv, lemmatizer)
+        else:
+            known_words = load_known_words(path_to_known_csv)
+
+        result = []
+        for word, definition in zip(normalized_words, definitions):
+            instance = cls.__new__(cls)
+            instance._initialize(word, lang, definition, path_to_known_csv, known_words, lemmatizer)
+            result.append(instance)
+
+        return result
+
+    @staticmethod
+    def validate_many(words, language, definitions=None):
+        """
+        Validate many words without constructing them or reading the known
+        words, e.g. to reject a batch before building any of it.
+
+        Args:
+            words (list): The words to validate.
+            language (str): The language shared by all the words.
+            definitions (list): Optional definitions, one per word.
+
+        Returns:
+            tuple: (language, words, definitions) normalized the way Word
+                   stores them.
+
+        Raises:
+            ValueError: If the language or definitions are invalid.
+            WordValidationError: If any word is invalid, listing every invalid word.
+        """
+        # Validate lang input once for the whole batch
+        if not isinstance(language, str) or not language:
+            raise ValueError("Language must be a non-empty string")
+
+        if not VALID_STRING_PATTERN.match(language):
+            raise ValueError("Language must contain normal characters")
+
+        lang = language.strip().lower()
+
+        if definitions is None:
+            definitions = [""] * len(words)
+
+        if len(definitions) != len(words):
+            raise ValueError("Definitions must have one entry per word")
+
+        # Validate and normalize every word, collecting all errors
+        errors = []
+        normalized_words = []
+        for index, (word, definition) in enumerate(zip(words, definitions)):
+            if not isinstance(word, str) or not word:
+                errors.append((index, word, "Word must be a non-empty string"))
+            elif not VALID_STRING_PATTERN.match(word):
+                errors.append((index, word, "Word must contain normal characters"))
+            elif not isinstance(definition, str):
+                errors.append((index, word, "Definition must be a string"))
+            else:
+                normalized_words.append(word.strip().lower())
+
+        if errors:
+            raise WordValidationError(errors)
+
+        return lang, normalized_words, definitions
+
+    def _initialize(self, word, lang, definition, path_to_known_csv, known_words, lemmatizer=None):
+        """
+        Set the attributes shared by __init__ and from_many once inputs
+        have been validated and normalized. When a lemmatizer is given,
+        known_words must already be a set of lemmas.
+        """
+        self.word = word
+        self.lang = lang
+
         # Normalize the definition and save it
         self.definition = definition
 
         # Store the path to the known words CSV file
         self.path_to_known_csv = path_to_known_csv
 
+        # Store the optional lemmatizer used for known checks
+        self.lemmatizer = lemmatizer
+
         # Determine if the word is known
-        self.known_word = self.is_known_word()
+        if known_words is None:
+            self.known_word = self.is_known_word()
+        elif lemmatizer is not None:
+            self.known_word = self.word in known_words or lemmatizer.lemmatize(normalize_text(self.word)) in known_words
+        else:
+            self.known_word = self.word in known_words
 
-        # Hardcoded Model ID
-        self.vocab_model_id = 275837465987236587
+        # The note is built on first access of vocab_note
+        self._vocab_note = None
 
-        if not self.known_word:
-            self.vocab_note = self.get_vocab_note()
-        else:
-            self.vocab_note = None
+    def to_state(self):
+        """
+        Get the resolved state of the word, e.g. to checkpoint a deck build.
+
+        Returns:
+            dict: JSON serializable attributes. The lemmatizer is not
+                  included, its effect is already part of known_word.
+        """
+        return {
+            "word": self.word,
+            "lang": self.lang,
+            "definition": self.definition,
+            "path_to_known_csv": self.path_to_known_csv,
+            "known_word": self.known_word
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Restore a Word saved by to_state without validating it or
+        reading the known words again.
+
+        Args:
+            state (dict): A dict returned by to_state.
+
+        Returns:
+            Word: The restored word.
+        """
+        instance = cls.__new__(cls)
+        instance.word = state["word"]
+        instance.lang = state["lang"]
+        instance.definition = state["definition"]
+        instance.path_to_known_csv = state["path_to_known_csv"]
+        instance.lemmatizer = None
+        instance.known_word = state["known_word"]
+        instance._vocab_note = None
+        return instance
+
+    @property
+    def vocab_note(self):
+        """
+        The genanki.Note of the word, built on first access.
+
+        Returns:
+            genanki.Note: The note, or None for known words.
+        """
+        if self.known_word:
+            return None
+
+        if self._vocab_note is None:
+            self._vocab_note = self.get_vocab_note()
+
+        return self._vocab_note
+
+    def release_note(self):
+        """
+        Drop the built note, e.g. once it has been packaged. It is
+        rebuilt if vocab_note is accessed again.
+        """
+        self._vocab_note = None
 
     def get_vocab_note(self):
         return genanki.Note(
@@ -76,24 +325,37 @@ class Word:
 
 
     def get_vocab_model(self):
-        return genanki.Model(
-                    model_id = self.vocab_model_id,
-                    name = 'Vocab Card',
-                    fields = [{'name':key} for key in self.get_vocab_fields().keys()]
-                )
+        """
+        returns the genanki.Model of vocab notes, shared by every Word
+        """
+        if Word._vocab_model is None:
+            Word._vocab_model = genanki.Model(
+                        model_id = self.vocab_model_id,
+                        name = 'Vocab Card',
+                        fields = [{'name':key} for key in self.get_vocab_fields().keys()]
+                    )
+
+        return Word._vocab_model
 
     def is_known_word(self):
         """
-        Check if the word is in the list of known words.
+        Check if the word is in the list of known words. With a lemmatizer
+        the word is also known when its lemma matches the lemma of a known word.
 
         Returns:
             bool: True if the word is known, False otherwise.
         """
-        # Load the known words from the CSV file
-        known_df = pd.read_csv(self.path_to_known_csv)
+        known_words = load_known_words(self.path_to_known_csv)
 
         # Check if the word matches any entry in the first column of the CSV
-        return any(self.word == i.strip() for i in known_df[known_df.columns[0]])
+        if self.word in known_words:
+            return True
+
+        if self.lemmatizer is None:
+            return False
+
+        known_lemmas = load_known_lemmas(self.path_to_known_csv, self.lemmatizer)
+        return self.lemmatizer.lemmatize(normalize_text(self.word)) in known_lemmas
 
     def is_valid_string(self, s):
         """
@@ -105,14 +367,8 @@ class Word:
         Returns:
             bool: True if the string is valid, False otherwise.
         """
-        # Regex pattern:
-        # \p{L}: Matches any kind of letter from any language.
-        # \p{N}: Matches any kind of numeric character.
-        # \s: Matches whitespace.
-        pattern = r'^[\p{L}\p{N}\s]+$'
-
-        # Use the regex to test the string
-        return bool(regex.match(pattern, s))
+        # Use the precompiled regex to test the string
+        return bool(VALID_STRING_PATTERN.match(s))
 
     def __str__(self):
         return f"Word({self.word},{self.lang},{self.definition},{self.path_to_known_csv},{self.known_word})"
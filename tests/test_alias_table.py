@@ -0,0 +1,32 @@
+import numpy as np
+import pytest
+
+from src.alias_table import Alias_table
+
+def test_samples_follow_weights():
+    table = Alias_table([1, 0, 3, 6])
+    rng = np.random.default_rng(0)
+
+    counts = np.bincount([table.sample(rng) for _ in range(20000)], minlength=4)
+
+    assert counts[1] == 0
+    assert np.allclose(counts / counts.sum(), [0.1, 0, 0.3, 0.6], atol=0.02)
+
+def test_seeded_samples_repeat():
+    table = Alias_table([0.2, 0.5, 0.3])
+
+    first = [table.sample(np.random.default_rng(7)) for _ in range(5)]
+    second = [table.sample(np.random.default_rng(7)) for _ in range(5)]
+
+    assert first == second
+    assert len(table) == 3
+
+def test_invalid_weights():
+    with pytest.raises(ValueError, match="Weights must be non-negative and not all zero"):
+        Alias_table([])
+
+    with pytest.raises(ValueError, match="Weights must be non-negative and not all zero"):
+        Alias_table([0, 0])
+
+    with pytest.raises(ValueError, match="Weights must be non-negative and not all zero"):
+        Alias_table([1, -1])
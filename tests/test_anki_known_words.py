@@ -0,0 +1,152 @@
+import os
+import sqlite3
+import tempfile
+
+import pandas as pd
+import pytest
+
+from src.anki_known_words import Anki_known_words, field_text
+from src.sentence_bank import Sentence_bank
+
+SCHEMA = """
+CREATE TABLE notes (id INTEGER PRIMARY KEY, mod INTEGER NOT NULL, flds TEXT NOT NULL);
+CREATE TABLE cards (id INTEGER PRIMARY KEY, nid INTEGER NOT NULL, mod INTEGER NOT NULL, ivl INTEGER NOT NULL);
+CREATE TABLE graves (usn INTEGER NOT NULL, oid INTEGER NOT NULL, type INTEGER NOT NULL);
+"""
+
+def make_collection(tempdir):
+    path = os.path.join(tempdir, "collection.anki2")
+    connection = sqlite3.connect(path)
+    connection.executescript(SCHEMA)
+    connection.executemany("INSERT INTO notes VALUES (?, ?, ?)", [
+        (1, 100, "Hola\x1fhello"),
+        (2, 100, "<b>Queso</b>&nbsp;\x1fcheese"),
+        (3, 100, "pan\x1fbread")
+    ])
+    connection.executemany("INSERT INTO cards VALUES (?, ?, ?, ?)", [
+        (10, 1, 100, 30),
+        (11, 1, 100, 2),
+        (20, 2, 100, 21),
+        (30, 3, 100, 5)
+    ])
+    connection.commit()
+    return path, connection
+
+def test_field_text():
+    assert field_text("<b>Queso</b>&nbsp;\x1fcheese", 0) == "queso"
+    assert field_text("Queso\x1fcheese", 1) == "cheese"
+    assert field_text("Queso", 3) == ""
+
+def test_sync_is_incremental():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path, connection = make_collection(tempdir)
+
+        known = Anki_known_words(path)
+        assert known.sync() == ({"hola", "queso"}, set())
+        assert set(known) == {"hola", "queso"}
+
+        # A card matures, a note is edited and another note is deleted
+        connection.execute("UPDATE cards SET ivl = 40, mod = 200 WHERE id = 30")
+        connection.execute("UPDATE notes SET flds = 'Hello', mod = 200 WHERE id = 1")
+        connection.execute("DELETE FROM cards WHERE nid = 2")
+        connection.execute("DELETE FROM notes WHERE id = 2")
+        connection.executemany("INSERT INTO graves VALUES (-1, ?, ?)", [(20, 0), (2, 1)])
+        connection.commit()
+
+        added, removed = known.sync()
+        assert added == {"pan", "hello"}
+        assert removed == {"hola", "queso"}
+        assert set(known) == {"pan", "hello"}
+
+        # A lapse makes a card young again
+        connection.execute("UPDATE cards SET ivl = 1, mod = 300 WHERE id = 30")
+        connection.commit()
+        assert known.sync() == (set(), {"pan"})
+        assert "hello" in known and len(known) == 1
+
+def test_synced_graves_are_read_once():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path, connection = make_collection(tempdir)
+
+        known = Anki_known_words(path)
+        known.sync()
+
+        connection.execute("DELETE FROM cards WHERE id = 10")
+        connection.execute("INSERT INTO graves VALUES (-1, 10, 0)")
+        connection.commit()
+        assert known.sync() == (set(), {"hola"})
+        assert known.graves_usn == -1
+
+        # Anki syncs the deletion and assigns it a usn
+        connection.execute("UPDATE graves SET usn = 7 WHERE usn = -1")
+        connection.commit()
+        known.sync()
+        assert known.graves_usn == 7
+
+        # Only pending entries and entries newer than usn 7 are read from now on
+        connection.execute("INSERT INTO graves VALUES (8, 20, 0)")
+        connection.execute("DELETE FROM cards WHERE id = 20")
+        connection.commit()
+        assert known.sync() == (set(), {"queso"})
+        assert known.graves_usn == 8
+
+def test_deletions_missing_from_graves_trigger_a_rescan():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path, connection = make_collection(tempdir)
+
+        known = Anki_known_words(path)
+        known.sync()
+
+        # A full sync replaced the collection, its deletions left no graves
+        connection.execute("DELETE FROM cards WHERE id = 20")
+        connection.execute("DELETE FROM notes WHERE id = 2")
+        connection.execute("UPDATE cards SET ivl = 40, mod = 200 WHERE id = 30")
+        connection.commit()
+
+        assert known.sync() == ({"pan"}, {"queso"})
+        assert set(known) == {"hola", "pan"}
+
+def test_state_persists_between_processes():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path, connection = make_collection(tempdir)
+        state_path = os.path.join(tempdir, "state.json")
+
+        Anki_known_words(path, state_path=state_path).sync()
+
+        connection.execute("UPDATE cards SET ivl = 40, mod = 200 WHERE id = 30")
+        connection.commit()
+
+        resumed = Anki_known_words(path, state_path=state_path)
+        assert set(resumed) == {"hola", "queso"}
+        assert resumed.sync() == ({"pan"}, set())
+
+        # Different settings do not reuse the state
+        assert len(Anki_known_words(path, mature_interval=1, state_path=state_path)) == 0
+
+def test_rank_sentences_with_anki_known_words():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path, _ = make_collection(tempdir)
+        known = Anki_known_words(path)
+        known.sync()
+
+        tsv_path = os.path.join(tempdir, "sentences.tsv")
+        pd.DataFrame({
+            "Sentence": ["Hola queso", "Hola pan"],
+            "Meaning": ["Hello cheese", "Hello bread"],
+            "Custom Ratio": [0, 0]
+        }).to_csv(tsv_path, sep="\t")
+
+        sentence_bank = Sentence_bank(tsv_path)
+        sentence_bank.rank_sentences(known)
+
+        assert list(sentence_bank.sentence_bank["Custom Ratio"]) == [1.0, 0.5]
+
+def test_invalid_arguments():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path, _ = make_collection(tempdir)
+
+        with pytest.raises(ValueError, match="field must be a non-negative int"):
+            Anki_known_words(path, field=-1)
+
+        with pytest.raises(FileNotFoundError):
+            Anki_known_words(os.path.join(tempdir, "missing.anki2"))
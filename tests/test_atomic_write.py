@@ -0,0 +1,64 @@
+import os
+import tempfile
+
+import pytest
+
+from src.atomic_write import atomic_path
+
+def test_atomic_path_replaces_file_once_complete():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "deck.tsv.gz")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("old")
+
+        with atomic_path(path) as temporary_path:
+            assert os.path.dirname(temporary_path) == tempdir
+            assert temporary_path.endswith("-deck.tsv.gz")
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                file.write("new")
+
+            # Readers still see the old file until the block completes
+            with open(path, encoding="utf-8") as file:
+                assert file.read() == "old"
+
+        with open(path, encoding="utf-8") as file:
+            assert file.read() == "new"
+        assert os.listdir(tempdir) == ["deck.tsv.gz"]
+
+def test_atomic_path_gives_default_permissions():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "sentences.freq.tsv")
+        with open(os.path.join(tempdir, "plain.tsv"), "w", encoding="utf-8"):
+            pass
+
+        with atomic_path(path) as temporary_path:
+            with open(temporary_path, "w", encoding="utf-8") as file:
+                file.write("Token\tCount\n")
+
+        # The same permissions as a file opened directly, not mkstemp's 0o600
+        expected = os.stat(os.path.join(tempdir, "plain.tsv")).st_mode & 0o777
+        assert os.stat(path).st_mode & 0o777 == expected
+
+        umask = os.umask(0o022)
+        try:
+            with atomic_path(path) as temporary_path:
+                open(temporary_path, "w", encoding="utf-8").close()
+            assert os.stat(path).st_mode & 0o777 == 0o644
+        finally:
+            os.umask(umask)
+
+def test_atomic_path_keeps_file_on_error():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "state.json")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("old")
+
+        with pytest.raises(RuntimeError):
+            with atomic_path(path) as temporary_path:
+                with open(temporary_path, "w", encoding="utf-8") as file:
+                    file.write("half")
+                raise RuntimeError("interrupted")
+
+        with open(path, encoding="utf-8") as file:
+            assert file.read() == "old"
+        assert os.listdir(tempdir) == ["state.json"]
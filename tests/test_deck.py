@@ -1,7 +1,10 @@
+import os
+import tempfile
+
 import pytest
 
 from src.deck import Deck
-from src.word import Word
+from src.word import Word, WordValidationError
 
 class TestDeckInit:
     """
@@ -84,4 +87,137 @@ class TestDeckCreateDeck:
     """
     Class that tests function create deck
     """
-    pass
+
+    def test_create_deck_one_note_per_distinct_word(self):
+        simple_deck = Deck(["test", "Test", "prueba", "火车"])
+        simple_deck.create_deck()
+
+        # 火车 is known and the duplicate test is merged
+        assert len(simple_deck.deck.notes) == 2
+
+class TestDeckDuplicates:
+    """
+    Class that tests how Deck interns duplicate words
+    """
+
+    def test_deck_merges_duplicates_by_default(self):
+        simple_deck = Deck(["test", " Test ", "TEST", "prueba"])
+
+        assert [word.word for word in simple_deck.words] == ["test", "prueba"]
+        assert simple_deck.word_sources["test"] == ["test", " Test ", "TEST"]
+
+    def test_deck_keep_first_duplicate(self):
+        simple_deck = Deck(["Test", "test", "prueba"], duplicates="first")
+
+        assert [word.word for word in simple_deck.words] == ["test", "prueba"]
+        assert simple_deck.word_sources["test"] == ["Test"]
+
+    def test_deck_error_on_duplicates(self):
+        with pytest.raises(ValueError, match="Duplicate word 'test' at position 2"):
+            Deck(["Test", "prueba", "test"], duplicates="error")
+
+    def test_deck_with_unknown_duplicate_policy(self):
+        with pytest.raises(ValueError):
+            Deck(["test"], duplicates="sum")
+
+    def test_deck_invalid_word_positions_refer_to_input(self):
+        with pytest.raises(WordValidationError) as excinfo:
+            Deck(["test", "test", "!"])
+
+        assert excinfo.value.errors[0][0] == 2
+
+class TestDeckCheckpoints:
+    """
+    Class that tests checkpointed, resumable deck builds
+    """
+
+    def test_resume_after_failed_build(self, monkeypatch):
+        words = ["uno", "dos", "tres", "cuatro", "cinco", "seis", "siete"]
+
+        with tempfile.TemporaryDirectory() as work_dir:
+            original = Word.from_many.__func__
+
+            # The build is killed while building the third chunk, after two checkpoints
+            calls = []
+            def failing_from_many(cls, chunk, *args, **kwargs):
+                calls.append(chunk)
+                if len(calls) == 3:
+                    raise KeyboardInterrupt
+                return original(cls, chunk, *args, **kwargs)
+            monkeypatch.setattr(Word, "from_many", classmethod(failing_from_many))
+
+            with pytest.raises(KeyboardInterrupt):
+                Deck(words, work_dir=work_dir, checkpoint_every=2)
+
+            # Simulate a crash halfway through appending the next chunk
+            with open(os.path.join(work_dir, "words.jsonl"), "ab") as file:
+                file.write(b'{"word": "cin')
+
+            built = []
+            def counting_from_many(cls, chunk, *args, **kwargs):
+                built.extend(chunk)
+                return original(cls, chunk, *args, **kwargs)
+            monkeypatch.setattr(Word, "from_many", classmethod(counting_from_many))
+
+            resumed = Deck(words, work_dir=work_dir, checkpoint_every=2, resume=True)
+
+            # Only the words after the last checkpoint were built again
+            assert built == words[4:]
+            assert [word.to_state() for word in resumed.words] == [word.to_state() for word in Deck(words).words]
+
+            # The finished build resumes without building anything
+            built.clear()
+            assert len(Deck(words, work_dir=work_dir, checkpoint_every=2, resume=True).words) == 7
+            assert built == []
+
+    def test_invalid_word_fails_before_any_checkpoint(self):
+        words = ["uno", "dos", "tres", "cuatro", "!", "seis", "siete"]
+
+        with tempfile.TemporaryDirectory() as work_dir:
+            with pytest.raises(WordValidationError) as excinfo:
+                Deck(words, work_dir=work_dir, checkpoint_every=2)
+
+            assert excinfo.value.errors[0][0] == 4
+            assert os.listdir(work_dir) == []
+
+    def test_resume_recomputes_known_words(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            known_path = os.path.join(work_dir, "known.csv")
+            with open(known_path, "w", encoding="utf-8") as file:
+                file.write("known\nuno\n")
+
+            checkpoint_dir = os.path.join(work_dir, "checkpoint")
+            deck = Deck(["uno", "dos"], work_dir=checkpoint_dir, checkpoint_every=1, path_to_known_csv=known_path)
+            assert [word.known_word for word in deck.words] == [True, False]
+
+            # dos was learned since the checkpoint was written
+            with open(known_path, "w", encoding="utf-8") as file:
+                file.write("known\nuno\ndos\n")
+
+            resumed = Deck(["uno", "dos"], work_dir=checkpoint_dir, resume=True, path_to_known_csv=known_path)
+            assert [word.known_word for word in resumed.words] == [True, True]
+
+    def test_resume_without_words_file_starts_over(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            Deck(["uno", "dos"], work_dir=work_dir, checkpoint_every=1)
+            os.remove(os.path.join(work_dir, "words.jsonl"))
+
+            resumed = Deck(["uno", "dos"], work_dir=work_dir, checkpoint_every=1, resume=True)
+            assert [word.word for word in resumed.words] == ["uno", "dos"]
+
+    def test_resume_rejects_a_different_build(self):
+        with tempfile.TemporaryDirectory() as work_dir:
+            Deck(["uno", "dos"], work_dir=work_dir, checkpoint_every=1)
+
+            with pytest.raises(ValueError, match="belongs to a different build"):
+                Deck(["uno", "tres"], work_dir=work_dir, resume=True)
+
+            with pytest.raises(ValueError, match="belongs to a different build"):
+                Deck(["uno", "dos"], language="es", work_dir=work_dir, resume=True)
+
+            # Without resume the old checkpoint is replaced
+            assert [word.word for word in Deck(["tres"], work_dir=work_dir).words] == ["tres"]
+
+    def test_checkpoint_every_must_be_positive(self):
+        with pytest.raises(ValueError, match="checkpoint_every must be a positive int"):
+            Deck(["uno"], work_dir="unused", checkpoint_every=0)
@@ -0,0 +1,94 @@
+import gzip
+import json
+import os
+import tempfile
+
+import pandas as pd
+import pytest
+
+from src import deck_exporter
+from src.deck import Deck
+from src.deck_exporter import export_jsonl, export_tsv
+from src.sentence_bank import Sentence_bank
+
+def make_sentence_bank(tempdir):
+    path = os.path.join(tempdir, "sentences.tsv")
+    pd.DataFrame({
+        "Sentence": ["Me gusta el queso", "Queso y pan", "Pan\tcon tomate", "Hola amigo"],
+        "Meaning": ["I like cheese", "Cheese and bread", "Bread with tomato", "Hello friend"],
+        "Custom Ratio": [0.5, 0.9, 0.7, 1.0]
+    }).to_csv(path, sep="\t")
+    return Sentence_bank(path)
+
+def write_known(tempdir):
+    path = os.path.join(tempdir, "known.csv")
+    pd.DataFrame({"known": ["hola", "火车"]}).to_csv(path, index=False)
+    return path
+
+def test_export_tsv():
+    with tempfile.TemporaryDirectory() as tempdir:
+        deck = Deck(["hola", "queso", "pan"], "es", path_to_known_csv=write_known(tempdir))
+        path = os.path.join(tempdir, "deck.txt")
+
+        count = export_tsv(deck, path, make_sentence_bank(tempdir), num_sentences=2)
+
+        assert count == 2
+        with open(path, encoding="utf-8") as file:
+            assert file.readline() == "#separator:tab\n"
+            assert file.readline() == "#html:false\n"
+            assert file.readline() == "#columns:Word\tSentence 1\tMeaning 1\tSentence 2\tMeaning 2\n"
+
+        rows = pd.read_csv(path, sep="\t", comment="#", header=None, keep_default_na=False)
+        assert rows.values.tolist() == [
+            ["queso", "Queso y pan", "Cheese and bread", "Me gusta el queso", "I like cheese"],
+            ["pan", "Queso y pan", "Cheese and bread", "Pan\tcon tomate", "Bread with tomato"]
+        ]
+        # The temporary file was moved in place, readable like known.csv
+        assert sorted(os.listdir(tempdir)) == ["deck.txt", "known.csv", "sentences.tsv"]
+        assert os.stat(path).st_mode & 0o777 == os.stat(os.path.join(tempdir, "known.csv")).st_mode & 0o777
+
+def test_export_jsonl_gzip():
+    with tempfile.TemporaryDirectory() as tempdir:
+        deck = Deck(["hola", "queso"], "es", path_to_known_csv=write_known(tempdir))
+        path = os.path.join(tempdir, "deck.jsonl.gz")
+
+        assert export_jsonl(deck, path, make_sentence_bank(tempdir), buffer_size=16) == 1
+
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            notes = [json.loads(line) for line in file]
+
+        assert notes == [{
+            "Word": "queso",
+            "Sentences": [{"Sentence": "Queso y pan", "Meaning": "Cheese and bread", "Custom Ratio": 0.9}]
+        }]
+
+def test_export_words_only():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "deck.jsonl")
+
+        export_jsonl(Deck(["queso"], "es", path_to_known_csv=write_known(tempdir)), path)
+
+        with open(path, encoding="utf-8") as file:
+            assert json.loads(file.read()) == {"Word": "queso", "Sentences": []}
+
+def test_export_zstd_requires_zstandard(monkeypatch):
+    monkeypatch.setattr(deck_exporter, "zstandard", None)
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        deck = Deck(["queso"], "es", path_to_known_csv=write_known(tempdir))
+
+        with pytest.raises(ImportError, match="requires the zstandard package"):
+            export_tsv(deck, os.path.join(tempdir, "deck.txt.zst"))
+
+        # Nothing is left behind
+        assert os.listdir(tempdir) == ["known.csv"]
+
+def test_export_invalid_arguments():
+    with tempfile.TemporaryDirectory() as tempdir:
+        deck = Deck(["queso"], "es", path_to_known_csv=write_known(tempdir))
+
+    with pytest.raises(ValueError, match="num_sentences must be a non-negative int"):
+        export_tsv(deck, "deck.txt", num_sentences=-1)
+
+    with pytest.raises(ValueError, match="buffer_size must be a positive int"):
+        export_jsonl(deck, "deck.jsonl", buffer_size=0)
@@ -0,0 +1,129 @@
+# Standard library imports
+import os
+import tempfile
+
+# Third-party imports
+import pandas as pd
+import pytest
+
+# Local imports
+from src.frequency_table import Frequency_table, frequency_table_path
+from src.sentence_bank import Sentence_bank
+
+def write_bank(tempdir):
+    tmpfilepath = os.path.join(tempdir, 'sentences.tsv')
+    pd.DataFrame({
+        "Sentence": ["Me gusta queso", "El queso es bueno", "Me gusta el pan", "你不懂"],
+        "Meaning": ["I like cheese", "The cheese is good", "I like the bread", "You don't understand"],
+        "Custom Ratio": [0, 0, 0, 0]
+    }).to_csv(tmpfilepath, sep="\t")
+    return tmpfilepath
+
+def test_frequency_and_rank_lookups():
+    table = Frequency_table.from_token_lists([("b", "a", "a"), ("c", "a", "b"), ()], chunk_size=2)
+
+    assert table.sentence_count == 3
+    assert table.frequency("a") == 3
+    assert table.frequency("z") == 0
+    assert [table.rank(token) for token in ("a", "b", "c", "z")] == [1, 2, 3, None]
+
+    # Ranks follow updates
+    table.update([("c", "c", "c")])
+    assert table.rank("c") == 1
+    assert table.sentence_count == 4
+
+def test_chunked_parallel_and_merged_counts_agree():
+    token_lists = [("hola", "amigo"), ("hola",), ("me", "gusta", "hola")] * 50
+
+    serial = Frequency_table.from_token_lists(token_lists, chunk_size=7)
+    parallel = Frequency_table.from_token_lists(token_lists, chunk_size=7, workers=2)
+
+    merged = Frequency_table.from_token_lists(token_lists[:40])
+    merged.merge(Frequency_table.from_token_lists(token_lists[40:]))
+
+    assert serial.counts == parallel.counts == merged.counts
+    assert serial.sentence_count == parallel.sentence_count == merged.sentence_count == 150
+
+    with pytest.raises(ValueError):
+        Frequency_table.from_token_lists(token_lists, chunk_size=0)
+
+def test_sentence_bank_frequency_table_persisted_and_incremental():
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = write_bank(tempdir)
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+        table = sentence_bank.get_frequency_table(persist=True)
+
+        assert table.frequency("queso") == 2
+        assert table.frequency("不") == 1
+        assert os.path.exists(frequency_table_path(tmpfilepath))
+
+        # Added sentences are counted into the loaded table and persisted
+        sentence_bank.add_sentence("Queso y pan", "Cheese and bread")
+        assert sentence_bank.get_frequency_table(persist=True).frequency("queso") == 3
+        saved = Frequency_table.load(frequency_table_path(tmpfilepath))
+        assert saved.sentence_count == 5
+        assert saved.frequency("y") == 1
+
+        # The file gained a different fifth row, so the saved table has the
+        # right row count but the wrong sentences and is rebuilt
+        with open(tmpfilepath, "a", encoding="utf-8") as file:
+            file.write("4\tNull queso\tNull cheese\t0\n")
+
+        reloaded = Sentence_bank(tmpfilepath).get_frequency_table(persist=True)
+        assert reloaded.sentence_count == 5
+        assert reloaded.frequency("queso") == 3
+        assert reloaded.frequency("null") == 1
+        assert reloaded.frequency("y") == 0
+
+        saved = Frequency_table.load(frequency_table_path(tmpfilepath))
+        assert saved.counts == reloaded.counts
+
+def test_frequency_table_saved_only_when_asked_and_best_effort():
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = write_bank(tempdir)
+        path = frequency_table_path(tmpfilepath)
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+        assert sentence_bank.get_frequency_table().frequency("queso") == 2
+        assert not os.path.exists(path)
+
+        # A table that cannot be saved never blocks an append
+        sentence_bank = Sentence_bank(tmpfilepath)
+        sentence_bank.get_frequency_table(persist=True)
+        os.remove(path)
+        os.mkdir(path)
+        sentence_bank.add_sentence("Queso y pan", "Cheese and bread")
+        assert sentence_bank.get_frequency_table().frequency("queso") == 3
+
+def test_persisted_frequency_table_keyed_on_sentences():
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = write_bank(tempdir)
+        path = frequency_table_path(tmpfilepath)
+
+        Sentence_bank(tmpfilepath).get_frequency_table(persist=True)
+
+        # A matching prefix is reused and only appended rows are counted
+        with open(tmpfilepath, "a", encoding="utf-8") as file:
+            file.write("4\tQueso\tCheese\t0\n")
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+        assert Frequency_table.load(path, sentence_bank.snapshot().frame["Sentence"]).sentence_count == 4
+        assert sentence_bank.get_frequency_table(persist=True).frequency("queso") == 3
+
+        # An edited row invalidates the table even though the count fits
+        pd.DataFrame({
+            "Sentence": ["Me gusta pan", "El queso es bueno", "Me gusta el pan", "你不懂", "Queso"],
+            "Meaning": ["I like bread", "The cheese is good", "I like the bread", "You don't understand", "Cheese"],
+            "Custom Ratio": [0, 0, 0, 0, 0]
+        }).to_csv(tmpfilepath, sep="\t")
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+        assert Frequency_table.load(path, sentence_bank.snapshot().frame["Sentence"]) is None
+        assert sentence_bank.get_frequency_table(persist=True).frequency("queso") == 2
+
+        # Tables saved without a source key are rebuilt
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("# sentences\t5\nToken\tCount\nqueso\t99\n")
+
+        assert Sentence_bank(tmpfilepath).get_frequency_table(persist=True).frequency("queso") == 2
@@ -0,0 +1,71 @@
+# Standard library imports
+import os
+import tempfile
+
+# Third-party imports
+import pandas as pd
+import pytest
+
+# Local imports
+from src.fuzzy_index import Fuzzy_index, edit_distance, fold_accents
+from src.sentence_bank import Sentence_bank
+
+def test_fold_accents_and_edit_distance():
+    assert fold_accents("está") == "esta"
+    assert fold_accents("Ñandú") == "Nandu"
+    assert fold_accents("你好") == "你好"
+
+    assert edit_distance("gusta", "gusta", 2) == 0
+    assert edit_distance("gusta", "gsuta", 2) == 1
+    assert edit_distance("gusta", "gut", 2) == 2
+    assert edit_distance("gusta", "g", 2) == 3
+
+def test_fuzzy_index_lookup():
+    index = Fuzzy_index(["está", "esta", "estás", "gusta", "queso", "habló", "extraordinariamente"], max_distance=2)
+
+    # Accents are ignored, closest matches first
+    assert index.lookup("esta", 0) == ["esta", "está"]
+    assert index.lookup("estas", 1) == ["estás", "esta", "está"]
+    assert index.lookup("qeuso", 1) == ["queso"]
+    assert index.lookup("extraordinariamnete", 2) == ["extraordinariamente"]
+    assert index.lookup("perro", 2) == []
+
+    with pytest.raises(ValueError):
+        index.lookup("esta", 3)
+
+def test_fuzzy_index_extended_leaves_original():
+    index = Fuzzy_index(["esta", "queso"], max_distance=1)
+    extended = index.extended(["está", "perro", "perro"])
+
+    assert extended.lookup("esta", 0) == ["esta", "está"]
+    assert extended.lookup("pero", 1) == ["perro"]
+    assert index.lookup("esta", 0) == ["esta"]
+    assert index.lookup("pero", 1) == []
+    assert len(index) == 2 and len(extended) == 3
+
+def test_get_sentences_fuzzy():
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = os.path.join(tempdir, 'fuzzy.tsv')
+        pd.DataFrame({
+            "Sentence": ["¿Cómo está usted?", "Me gusta queso", "Esta casa es grande", "Hola amigo"],
+            "Meaning": ["How are you?", "I like cheese", "This house is big", "Hello friend"],
+            "Custom Ratio": [0.9, 0.8, 0.7, 0.6]
+        }).to_csv(tmpfilepath, sep="\t")
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+
+        # Literal lookups keep their old behaviour
+        assert [s["Sentence"] for s in sentence_bank.get_sentences("esta", 4)] == ["Esta casa es grande"]
+
+        results = sentence_bank.get_sentences("esta", 4, fuzzy=1)
+        assert [s["Sentence"] for s in results] == ["¿Cómo está usted?", "Esta casa es grande"]
+
+        assert sentence_bank.get_sentences("qeuso", 1, fuzzy=1)[0]["Sentence"] == "Me gusta queso"
+        assert sentence_bank.get_sentences("zzzz", 1, fuzzy=1) == []
+
+        # Added sentences are indexed
+        sentence_bank.add_sentence("El perro ladra", "The dog barks")
+        assert sentence_bank.get_sentences("pero", 1, fuzzy=1)[0]["Sentence"] == "El perro ladra"
+
+        with pytest.raises(ValueError, match="Fuzzy must be a non-negative int"):
+            sentence_bank.get_sentences("esta", 1, fuzzy=-1)
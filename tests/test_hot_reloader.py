@@ -0,0 +1,193 @@
+import os
+import tempfile
+import time
+
+import pandas as pd
+import pytest
+
+from src.hot_reloader import File_watcher, Hot_reloader
+from src.sentence_bank import Sentence_bank
+
+def write_sentences(path, sentences, mode="w"):
+    pd.DataFrame({
+        "Sentence": sentences,
+        "Meaning": [f"Meaning of {sentence}" for sentence in sentences],
+        "Custom Ratio": [0] * len(sentences)
+    }).to_csv(path, sep="\t", mode=mode, header=(mode == "w"))
+
+def write_known(path, words):
+    pd.DataFrame({"known": words}).to_csv(path, index=False)
+
+def test_file_watcher():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "known.csv")
+        watcher = File_watcher(path)
+
+        assert not watcher.changed()
+        write_known(path, ["hola"])
+        assert watcher.changed()
+        assert not watcher.changed()
+
+        write_known(path, ["hola", "amigo"])
+        assert watcher.changed()
+
+def test_appended_rows_are_added_and_ranked():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "sentences.tsv")
+        write_sentences(path, ["Hola amigo", "Me gusta el queso"])
+
+        sentence_bank = Sentence_bank(path)
+        sentence_bank.rank_sentences(["hola", "amigo"])
+        reloader = Hot_reloader(sentence_bank)
+
+        before = sentence_bank.snapshot()
+        write_sentences(path, ["Hola queso", "Adios amigo"], mode="a")
+        # A line still being written waits for its newline
+        with open(path, "a", encoding="utf-8") as file:
+            file.write("9\tHola")
+
+        result = reloader.poll()
+
+        assert result["appended"] == 2 and not result["reloaded"]
+        assert list(sentence_bank.sentence_bank["Sentence"]) == ["Hola amigo", "Me gusta el queso", "Hola queso", "Adios amigo"]
+        assert list(sentence_bank.sentence_bank["Custom Ratio"]) == [1.0, 0.0, 0.5, 0.5]
+        assert sentence_bank.get_sentences("adios", 1)[0]["Meaning"] == "Meaning of Adios amigo"
+
+        # Rows are added and ranked in a single snapshot
+        assert sentence_bank.snapshot().version == before.version + 1
+
+        # Readers holding the old snapshot are unaffected
+        assert len(before) == 2
+
+        with open(path, "a", encoding="utf-8") as file:
+            file.write(" pan\tHello bread\t0\n")
+
+        assert reloader.poll()["appended"] == 1
+        assert sentence_bank.sentence_bank["Sentence"].iloc[-1] == "Hola pan"
+        assert reloader.poll()["appended"] == 0
+
+def test_edited_file_is_reloaded():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "sentences.tsv")
+        write_sentences(path, ["Hola amigo", "Me gusta el queso"])
+
+        sentence_bank = Sentence_bank(path)
+        sentence_bank.rank_sentences(["hola"])
+        reloader = Hot_reloader(sentence_bank)
+
+        # Sleep so the edit gets a new modification time on coarse clocks
+        time.sleep(0.01)
+        write_sentences(path, ["Hola queso"])
+
+        result = reloader.poll()
+
+        assert result["reloaded"]
+        assert list(sentence_bank.sentence_bank["Sentence"]) == ["Hola queso"]
+        assert list(sentence_bank.sentence_bank["Custom Ratio"]) == [0.5]
+        assert sentence_bank.get_sentences("queso", 1)[0]["Sentence"] == "Hola queso"
+
+def test_unchanged_content_is_not_reloaded():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "sentences.tsv")
+        write_sentences(path, ["Hola amigo", "Me gusta el queso"])
+
+        sentence_bank = Sentence_bank(path)
+        reloader = Hot_reloader(sentence_bank)
+        before = sentence_bank.snapshot()
+
+        # A touch and a save of the same content change only the stat
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+        assert reloader.poll() == {"appended": 0, "reloaded": False, "known_added": set(), "known_removed": set()}
+
+        write_sentences(path, ["Hola amigo", "Me gusta el queso"])
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 2 * 10 ** 9))
+        assert not reloader.poll()["reloaded"]
+        assert sentence_bank.snapshot() is before
+
+        # A same size edit is still reloaded
+        write_sentences(path, ["Hola amiga", "Me gusta el queso"])
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 3 * 10 ** 9))
+        assert reloader.poll()["reloaded"]
+        assert sentence_bank.sentence_bank["Sentence"].iloc[0] == "Hola amiga"
+
+def test_edit_far_from_the_end_is_not_taken_for_an_append():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "sentences.tsv")
+        sentences = ["Hola amigo"] + [f"Relleno numero {i}" for i in range(50)]
+        write_sentences(path, sentences)
+
+        sentence_bank = Sentence_bank(path)
+        reloader = Hot_reloader(sentence_bank)
+
+        # Same length edit of the first row, then an append
+        with open(path, "r+b") as file:
+            content = file.read()
+            file.seek(content.index(b"Hola amigo"))
+            file.write(b"Hola amiga")
+        write_sentences(path, ["Adios amigo"], mode="a")
+
+        result = reloader.poll()
+
+        assert result["reloaded"] and result["appended"] == 0
+        assert sentence_bank.sentence_bank["Sentence"].iloc[0] == "Hola amiga"
+        assert len(sentence_bank.sentence_bank) == 52
+
+        # Later appends are recognized against the reloaded file
+        write_sentences(path, ["Hasta luego"], mode="a")
+        assert reloader.poll()["appended"] == 1
+
+def test_known_word_changes_rerank_incrementally():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "sentences.tsv")
+        known_path = os.path.join(tempdir, "known.csv")
+        write_sentences(path, ["Hola amigo", "Me gusta el queso", "Hola queso"])
+        write_known(known_path, ["hola", "amigo"])
+
+        sentence_bank = Sentence_bank(path)
+        sentence_bank.rank_sentences(known_path)
+        reloader = Hot_reloader(sentence_bank, known_path)
+
+        time.sleep(0.01)
+        write_known(known_path, ["hola", "queso"])
+        result = reloader.poll()
+
+        assert result["known_added"] == {"queso"}
+        assert result["known_removed"] == {"amigo"}
+
+        expected = Sentence_bank(path)
+        expected.rank_sentences(known_path)
+        assert list(sentence_bank.sentence_bank["Custom Ratio"]) == list(expected.sentence_bank["Custom Ratio"])
+        assert list(sentence_bank.sentence_bank["Unknown Count"]) == list(expected.sentence_bank["Unknown Count"])
+        assert sentence_bank.known_words == {"hola", "queso"}
+
+def test_background_polling():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "sentences.tsv")
+        write_sentences(path, ["Hola amigo"])
+
+        sentence_bank = Sentence_bank(path)
+        reloader = Hot_reloader(sentence_bank, interval=0.01)
+        reloader.start()
+        try:
+            write_sentences(path, ["Adios amigo"], mode="a")
+            deadline = time.time() + 5
+            while len(sentence_bank.sentence_bank) < 2 and time.time() < deadline:
+                time.sleep(0.01)
+        finally:
+            reloader.stop()
+
+        assert len(sentence_bank.sentence_bank) == 2
+        assert reloader.last_error is None
+
+def test_invalid_arguments():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "sentences.tsv")
+        write_sentences(path, ["Hola amigo"])
+        sentence_bank = Sentence_bank(path)
+
+        with pytest.raises(ValueError, match="interval must be a positive number"):
+            Hot_reloader(sentence_bank, interval=0)
+
+        with pytest.raises(ValueError, match="rank_sentences must be called before watching known words"):
+            Hot_reloader(sentence_bank, os.path.join(tempdir, "known.csv"))
@@ -0,0 +1,84 @@
+# Standard library imports
+import os
+import tempfile
+
+# Third-party imports
+import pandas as pd
+import pytest
+
+# Local imports
+from src.lemmatizer import Lemmatizer, load_lemmatizer
+from src.sentence_bank import Sentence_bank
+from src.word import Word
+
+def write_lemma_table(tempdir):
+    """Write a small Spanish inflection table into tempdir."""
+    path = os.path.join(tempdir, "lemmas.tsv")
+    pd.DataFrame({
+        "Form": ["estás", "está", "estoy", "Gatos"],
+        "Lemma": ["estar", "estar", "estar", "gato"]
+    }).to_csv(path, sep="\t", index=False)
+    return path
+
+def test_lemmatizer_lookup():
+    with tempfile.TemporaryDirectory() as tempdir:
+        lemmatizer = Lemmatizer(write_lemma_table(tempdir))
+
+        assert len(lemmatizer) == 4
+        assert lemmatizer.lemmatize("estás") == "estar"
+        assert lemmatizer.lemmatize("gatos") == "gato"
+        # Unknown forms are their own lemma
+        assert lemmatizer.lemmatize("perro") == "perro"
+        assert lemmatizer.lemmatize_all(["estoy", "perro"]) == {"estar", "perro"}
+
+        # Tables are only loaded once per path
+        assert load_lemmatizer(lemmatizer.path_to_lemma_tsv) is load_lemmatizer(lemmatizer.path_to_lemma_tsv)
+
+def test_lemmatizer_invalid_table():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "bad.tsv")
+        pd.DataFrame({"Form": ["estás"]}).to_csv(path, sep="\t", index=False)
+
+        with pytest.raises(ValueError):
+            Lemmatizer(path)
+
+        with pytest.raises(ValueError, match="path_to_lemma_tsv must end with .tsv"):
+            Lemmatizer(os.path.join(tempdir, "lemmas.csv"))
+
+def test_rank_sentences_with_lemmatizer():
+    """Test that inflected forms of known lemmas count as known."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        lemmatizer = Lemmatizer(write_lemma_table(tempdir))
+
+        known_path = os.path.join(tempdir, "known.csv")
+        pd.DataFrame({"known": ["estar", "gato", "el"]}).to_csv(known_path)
+
+        sentences_path = os.path.join(tempdir, "sentences.tsv")
+        pd.DataFrame({
+            "Sentence": ["¿Cómo estás?", "El gatos está aquí"],
+            "Meaning": ["How are you?", "The cats are here"],
+            "Custom Ratio": [0, 0]
+        }).to_csv(sentences_path, sep="\t")
+
+        sentence_bank = Sentence_bank(sentences_path)
+
+        sentence_bank.rank_sentences(known_path)
+        assert sentence_bank.sentence_bank.loc[0, "Custom Ratio"] == 0
+        assert sentence_bank.sentence_bank.loc[1, "Custom Ratio"] == 0.25
+
+        sentence_bank.rank_sentences(known_path, lemmatizer=lemmatizer)
+        assert sentence_bank.sentence_bank.loc[0, "Custom Ratio"] == 0.5
+        assert sentence_bank.sentence_bank.loc[1, "Custom Ratio"] == 0.75
+
+def test_word_known_with_lemmatizer():
+    with tempfile.TemporaryDirectory() as tempdir:
+        lemmatizer = Lemmatizer(write_lemma_table(tempdir))
+
+        known_path = os.path.join(tempdir, "known.csv")
+        pd.DataFrame({"known": ["estar"]}).to_csv(known_path, index=False)
+
+        assert Word("estás", "spanish", path_to_known_csv=known_path).known_word == False
+        assert Word("estás", "spanish", path_to_known_csv=known_path, lemmatizer=lemmatizer).known_word == True
+
+        words = Word.from_many(["Estoy", "gatos"], "spanish", path_to_known_csv=known_path, lemmatizer=lemmatizer)
+        assert [word.known_word for word in words] == [True, False]
@@ -0,0 +1,60 @@
+# Standard library imports
+import os
+import tempfile
+
+# Third-party imports
+import pandas as pd
+import pytest
+
+# Local imports
+from src.profile_ranker import Profile_ranker
+from src.sentence_bank import Sentence_bank
+
+def test_rank_many_profiles_matches_rank_sentences():
+    """Test that every profile gets exactly the ratios rank_sentences computes."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath_sentences = os.path.join(tempdir, 'sentences.tsv')
+        tmpfilepath_known = os.path.join(tempdir, 'known.csv')
+
+        pd.DataFrame({
+            "Sentence": ["Hola, Como estas?", "Me gusta queso", "你不懂。", "   ", "hola hola amigo"],
+            "Meaning": ["Hello", "I like cheese", "You don't understand", "Nothing", "Hi hi friend"],
+            "Custom Ratio": [0.5, 0.5, 0.5, 0.5, 0.5]
+        }).to_csv(tmpfilepath_sentences, sep="\t")
+        pd.DataFrame({"known": ["Hola", "queso"]}).to_csv(tmpfilepath_known)
+
+        profiles = {
+            "csv": tmpfilepath_known,
+            "chinese": ["你", "不"],
+            "nothing": [],
+            "spanish": ["hola", "como", "estas", "me", "gusta"]
+        }
+
+        sentence_bank = Sentence_bank(tmpfilepath_sentences)
+        results = Profile_ranker(sentence_bank).rank(profiles, batch_size=3)
+
+        # The bank is not mutated
+        assert list(sentence_bank.sentence_bank["Custom Ratio"]) == [0.5] * 5
+
+        for name, known in profiles.items():
+            reference = Sentence_bank(tmpfilepath_sentences)
+            reference.rank_sentences(known)
+
+            assert list(results[name]) == list(reference.sentence_bank["Custom Ratio"])
+
+def test_rank_invalid_profiles():
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath_sentences = os.path.join(tempdir, 'sentences.tsv')
+        pd.DataFrame({
+            "Sentence": ["Hola"],
+            "Meaning": ["Hello"],
+            "Custom Ratio": [0]
+        }).to_csv(tmpfilepath_sentences, sep="\t")
+
+        ranker = Profile_ranker(Sentence_bank(tmpfilepath_sentences))
+
+        with pytest.raises(ValueError):
+            ranker.rank([["hola"]])
+
+        with pytest.raises(ValueError):
+            ranker.rank({"a": ["hola"]}, batch_size=0)
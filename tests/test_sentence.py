@@ -1,3 +1,5 @@
+import copy
+import pickle
 import pytest
 
 from src.sentence import Sentence
@@ -6,3 +8,50 @@ def test_init_with_valid_inputs():
     sentence_man = Sentence("我星期四要去香港")
 
     assert hasattr(sentence_man, "sentence")
+
+def test_defaults():
+    sentence = Sentence("hola")
+
+    assert sentence.meaning == ""
+    assert sentence.custom_ratio == 0.0
+
+def test_dict_compatibility():
+    sentence = Sentence("我星期四要去香港", "I'm going to Hong Kong on Thursday", 0.5)
+
+    assert sentence["Sentence"] == "我星期四要去香港"
+    assert sentence["Custom Ratio"] == 0.5
+    assert sentence.get("Targets") is None
+    assert "Meaning" in sentence
+    assert list(sentence) == ["Sentence", "Meaning", "Custom Ratio"]
+    assert dict(sentence) == sentence.to_dict()
+    assert sentence == {"Sentence": "我星期四要去香港", "Meaning": "I'm going to Hong Kong on Thursday", "Custom Ratio": 0.5}
+
+    with pytest.raises(KeyError):
+        sentence["Targets"]
+
+def test_slots():
+    sentence = Sentence("hola")
+
+    assert not hasattr(sentence, "__dict__")
+    with pytest.raises(AttributeError):
+        sentence.extra = 1
+
+def test_from_columns():
+    sentences = Sentence.from_columns(["a", "b"], ["x", "y"], [0.1, 0.2])
+
+    assert sentences == [Sentence("a", "x", 0.1), Sentence("b", "y", 0.2)]
+
+def test_immutable_and_hashable():
+    sentence = Sentence("hola", "hello", 0.5)
+
+    with pytest.raises(AttributeError):
+        sentence.custom_ratio = 1.0
+    with pytest.raises(AttributeError):
+        del sentence.meaning
+    assert sentence.custom_ratio == 0.5
+
+    assert hash(sentence) == hash(Sentence("hola", "hello", 0.5))
+    assert len({sentence, Sentence("hola", "hello", 0.5), Sentence("hola", "hi", 0.5)}) == 2
+
+    assert pickle.loads(pickle.dumps(sentence)) == sentence
+    assert copy.deepcopy(sentence) == sentence
@@ -2,6 +2,7 @@
 import os
 import re
 import tempfile
+import threading
 import time
 
 # Third-party imports
@@ -9,6 +10,7 @@ import pandas as pd
 import pytest
 
 # Local imports
+import src.sentence_bank as sentence_bank_module
 from src.sentence_bank import Sentence_bank
 
 def test_initialization_with_valid_inputs():
@@ -871,4 +873,499 @@ def test_rank_sentences_with_whitespace_only():
         assert sentence_bank.sentence_bank.loc[1, "Custom Ratio"] == 0
 
 def test_add_sentence():
-    pass
+    """Test that added sentences are queryable and get derived columns."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = os.path.join(tempdir, 'sentences.tsv')
+
+        sentences = pd.DataFrame({
+            "Sentence": ["Hola amigo"],
+            "Meaning": ["Hello friend"],
+            "Custom Ratio": [0.5]
+        })
+        sentences.to_csv(tmpfilepath, sep="\t")
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+        sentence_bank.add_sentence("  ¿Cómo ESTÁS?  ", "How are you?", 0.9)
+
+        assert len(sentence_bank.sentence_bank) == 2
+        assert sentence_bank.sentence_bank.loc[1, "Sentence"] == "¿Cómo ESTÁS?"
+        assert sentence_bank.sentence_bank.loc[1, "Tokens"] == ("cómo", "estás")
+        assert sentence_bank.sentence_bank.loc[1, "Token Count"] == 2
+        assert sentence_bank.get_sentences("estás", 1)[0]["Meaning"] == "How are you?"
+
+        # Duplicates and bad ratios are rejected just like on load
+        with pytest.raises(ValueError, match="Sentence column cannot contain duplicates"):
+            sentence_bank.add_sentence("Hola amigo", "Hi friend")
+
+        with pytest.raises(ValueError, match="Custom Ratios must be between 0 and 1"):
+            sentence_bank.add_sentence("Adios", "Bye", 2)
+
+def test_derived_columns():
+    """Test that normalized text and tokens are precomputed on load."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = os.path.join(tempdir, 'derived.tsv')
+
+        sentences = pd.DataFrame({
+            "Sentence": ["ＨＯＬＡ, Señor!", "你敢！", "   "],
+            "Meaning": ["Hello, sir!", "How dare you?", "Nothing"],
+            "Custom Ratio": [0, 0, 0]
+        })
+        sentences.to_csv(tmpfilepath, sep="\t")
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+
+        assert sentence_bank.sentence_bank.loc[0, "Normalized"] == "hola, señor!"
+        assert sentence_bank.sentence_bank.loc[0, "Tokens"] == ("hola", "señor")
+        assert sentence_bank.sentence_bank.loc[1, "Tokens"] == ("你", "敢")
+        assert sentence_bank.sentence_bank.loc[2, "Token Count"] == 0
+
+        # Full-width input is found by a plain ASCII query
+        assert len(sentence_bank.get_sentences("hola", 1)) == 1
+
+        assert sentence_bank.derived_memory_usage() > 0
+
+def test_get_i_plus_one_sentences():
+    """Test that only sentences whose single unknown token is the word are returned."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath_known = os.path.join(tempdir, 'known.csv')
+        tmpfilepath_sentences = os.path.join(tempdir, 'sentences.tsv')
+
+        pd.DataFrame({"known": ["me", "el", "es", "bueno", "gusta"]}).to_csv(tmpfilepath_known)
+
+        sentences = pd.DataFrame({
+            "Sentence": ["Me gusta queso", "El queso es bueno", "El queso es muy bueno", "Queso queso", "Me gusta"],
+            "Meaning": ["I like cheese", "The cheese is good", "The cheese is very good", "Cheese cheese", "I like it"],
+            "Custom Ratio": [0, 0, 0, 0, 0]
+        })
+        sentences.to_csv(tmpfilepath_sentences, sep="\t")
+
+        sentence_bank = Sentence_bank(tmpfilepath_sentences)
+
+        with pytest.raises(ValueError, match=re.escape("rank_sentences must be called before i+1 queries")):
+            sentence_bank.get_i_plus_one_sentences("queso", 2)
+
+        sentence_bank.rank_sentences(tmpfilepath_known)
+
+        assert list(sentence_bank.sentence_bank["Unknown Count"]) == [1, 1, 2, 2, 0]
+
+        results = sentence_bank.get_i_plus_one_sentences("Queso", 5)
+        assert [s["Sentence"] for s in results] == ["El queso es bueno", "Me gusta queso"]
+
+        # Known words and absent words have no i+1 sentences
+        assert sentence_bank.get_i_plus_one_sentences("gusta", 5) == []
+        assert sentence_bank.get_i_plus_one_sentences("leche", 5) == []
+
+        # Appended sentences are counted and indexed
+        sentence_bank.add_sentence("Es queso", "It is cheese")
+        assert len(sentence_bank.get_i_plus_one_sentences("queso", 5)) == 3
+
+def test_get_i_plus_one_sentences_batch():
+    """Test the batch i+1 query against the single word query."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath_sentences = os.path.join(tempdir, 'sentences.tsv')
+
+        sentences = pd.DataFrame({
+            "Sentence": ["Me gusta queso", "El queso es bueno", "Me gusta pan", "El pan es bueno", "Pan y queso"],
+            "Meaning": ["I like cheese", "The cheese is good", "I like bread", "The bread is good", "Bread and cheese"],
+            "Custom Ratio": [0, 0, 0, 0, 0]
+        })
+        sentences.to_csv(tmpfilepath_sentences, sep="\t")
+
+        sentence_bank = Sentence_bank(tmpfilepath_sentences)
+        sentence_bank.rank_sentences(["me", "el", "es", "bueno", "gusta", "y"])
+
+        results = sentence_bank.get_i_plus_one_sentences_batch(["queso", "Pan", "gusta", "leche"], 1)
+
+        assert results["queso"] == sentence_bank.get_i_plus_one_sentences("queso", 1)
+        assert results["Pan"] == sentence_bank.get_i_plus_one_sentences("pan", 1)
+        assert results["gusta"] == []
+        assert results["leche"] == []
+
+def test_get_i_plus_one_sentences_multi_token_word():
+    """Test that words tokenized per character match as a consecutive sequence."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath_sentences = os.path.join(tempdir, 'sentences.tsv')
+
+        sentences = pd.DataFrame({
+            "Sentence": ["我要坐火车。", "火要坐车。", "我坐火车去北京。", "要坐火车！"],
+            "Meaning": ["I want to take the train", "Fire wants to ride a car", "I take the train to Beijing", "I want to take the train"],
+            "Custom Ratio": [0.1, 0.5, 0.9, 0.3]
+        })
+        sentences.to_csv(tmpfilepath_sentences, sep="\t")
+
+        sentence_bank = Sentence_bank(tmpfilepath_sentences)
+        sentence_bank.rank_sentences(["我", "要", "坐"])
+
+        # Scattered characters and sentences with other unknown words do not count
+        results = sentence_bank.get_i_plus_one_sentences("火车", 5)
+        assert sorted(s["Sentence"] for s in results) == ["我要坐火车。", "要坐火车！"]
+
+        batch = sentence_bank.get_i_plus_one_sentences_batch(["火车", "我要"], 5)
+        assert batch["火车"] == results
+        assert batch["我要"] == []
+
+def test_rank_sentences_parallel_matches_serial():
+    """Test that ranking in a process pool gives exactly the serial result."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath_sentences = os.path.join(tempdir, 'sentences.tsv')
+
+        sentences = pd.DataFrame({
+            "Sentence": [f"Hola amigo {i} me gusta queso" if i % 3 else f"你不懂{i}。" for i in range(200)] + ["   "],
+            "Meaning": [f"Meaning {i}" for i in range(201)],
+            "Custom Ratio": [0] * 201
+        })
+        sentences.to_csv(tmpfilepath_sentences, sep="\t")
+
+        known = ["hola", "gusta", "你", "不", "7"]
+
+        serial = Sentence_bank(tmpfilepath_sentences)
+        serial.rank_sentences(known)
+
+        parallel = Sentence_bank(tmpfilepath_sentences)
+        parallel.rank_sentences(known, workers=2, shard_size=17)
+
+        assert list(parallel.sentence_bank["Custom Ratio"]) == list(serial.sentence_bank["Custom Ratio"])
+        assert list(parallel.sentence_bank["Unknown Count"]) == list(serial.sentence_bank["Unknown Count"])
+
+        with pytest.raises(ValueError, match="workers must be a positive int"):
+            parallel.rank_sentences(known, workers=0)
+
+def test_iter_sentences_and_cursor():
+    """Test lazy iteration and resumable paging in Custom Ratio order."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = os.path.join(tempdir, 'sentences.tsv')
+
+        sentences = pd.DataFrame({
+            "Sentence": [f"Hola {i}" for i in range(10)] + ["Adios"],
+            "Meaning": [f"Hello {i}" for i in range(10)] + ["Bye"],
+            "Custom Ratio": [i / 10 for i in range(10)] + [1.0]
+        })
+        sentences.to_csv(tmpfilepath, sep="\t")
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+        expected = sentence_bank.get_sentences("hola", 10)
+
+        # Iteration gives get_sentences' order and can stop early
+        iterator = sentence_bank.iter_sentences("hola")
+        assert next(iterator) == expected[0]
+        assert list(iterator) == expected[1:]
+
+        # Pages resume where the last one stopped, also from a new cursor
+        cursor = sentence_bank.cursor("hola")
+        assert cursor.fetch(4) == expected[:4]
+        resumed = sentence_bank.cursor("hola", cursor.token)
+        assert resumed.fetch(4) == expected[4:8]
+        assert resumed.fetch(4) == expected[8:]
+        assert resumed.exhausted
+        assert resumed.fetch(4) == []
+
+        # An open cursor keeps its order when the bank is re-ranked
+        cursor = sentence_bank.cursor("hola")
+        first_page = cursor.fetch(5)
+        original_token = cursor.token
+        sentence_bank.add_sentence("Hola otra vez", "Hello again", 1.0)
+        assert first_page + cursor.fetch(5) == expected
+        assert sentence_bank.cursor("hola").fetch(1)[0]["Sentence"] == "Hola otra vez"
+
+        with pytest.raises(ValueError, match="Word must be non-empty string"):
+            sentence_bank.iter_sentences("")
+
+        # Tokens are tied to the version they were taken from
+        stale_token = cursor.token
+        sentence_bank.rank_sentences(["hola"])
+        with pytest.raises(ValueError, match="another version of the bank"):
+            sentence_bank.cursor("hola", stale_token)
+
+        # Tokens of another bank only resume over the same ratio order
+        reloaded = Sentence_bank(tmpfilepath)
+        assert reloaded.cursor("hola", original_token).fetch(5) == expected[5:]
+        with pytest.raises(ValueError, match="another version of the bank"):
+            reloaded.cursor("hola", sentence_bank.cursor("hola").token)
+
+        current = sentence_bank.snapshot().content_id
+        with pytest.raises(ValueError, match="Cursor token position"):
+            sentence_bank.cursor("hola", f"{current}:100")
+
+        for token in ("5", "a:b", "0:1", 5):
+            with pytest.raises(ValueError, match="Cursor token must be"):
+                sentence_bank.cursor("hola", token)
+
+def test_iter_sentences_candidates_match_scan():
+    """Test that indexed candidates give the order of get_sentences for short, long and punctuation terms."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = os.path.join(tempdir, 'sentences.tsv')
+
+        sentences = pd.DataFrame({
+            "Sentence": [f"我要坐火车{i}。" if i % 7 == 0 else f"Hola amigo {i}, me gusta" for i in range(100)],
+            "Meaning": [f"Meaning {i}" for i in range(100)],
+            "Custom Ratio": [(i * 37 % 100) / 100 for i in range(100)]
+        })
+        sentences.to_csv(tmpfilepath, sep="\t")
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+
+        for word in ["火", "火车", "坐火车", "o", "amigo 1", ",", "9"]:
+            expected = sentence_bank.get_sentences(word, 100)
+            assert list(sentence_bank.iter_sentences(word)) == expected
+
+            cursor = sentence_bank.cursor(word)
+            first_page = cursor.fetch(3)
+            assert first_page + sentence_bank.cursor(word, cursor.token).fetch(100) == expected
+
+        # Digits make these sentences space delimited, so 火 sits inside longer tokens
+        assert "我要坐火车7" in sentence_bank.get_token_characters()["火"]
+
+        # Characters of appended tokens are found as well
+        sentence_bank.add_sentence("汽车很快", "Cars are fast", 1.0)
+        assert "汽" in sentence_bank.get_token_characters()["汽"]
+        assert [s["Sentence"] for s in sentence_bank.iter_sentences("汽")] == ["汽车很快"]
+        assert list(sentence_bank.iter_sentences("车")) == sentence_bank.get_sentences("车", 16)
+
+def test_add_sentences_ranked():
+    """Test that added sentences can be ranked in the snapshot that adds them."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = os.path.join(tempdir, 'sentences.tsv')
+
+        pd.DataFrame({
+            "Sentence": ["Hola amigo", "Me gusta"],
+            "Meaning": ["Hello friend", "I like it"],
+            "Custom Ratio": [0, 0]
+        }).to_csv(tmpfilepath, sep="\t")
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+
+        with pytest.raises(ValueError, match="rank_sentences must be called before ranking added sentences"):
+            sentence_bank.add_sentences(["Hola"], rank=True)
+        assert len(sentence_bank.sentence_bank) == 2
+
+        sentence_bank.rank_sentences(["hola", "me"])
+        version = sentence_bank.snapshot().version
+
+        positions = sentence_bank.add_sentences(["Hola queso", "!!!"], custom_ratios=[1, 1], rank=True)
+
+        assert list(positions) == [2, 3]
+        assert sentence_bank.snapshot().version == version + 1
+        assert list(sentence_bank.sentence_bank["Custom Ratio"].iloc[2:]) == [0.5, 0.0]
+        assert list(sentence_bank.sentence_bank["Unknown Count"].iloc[2:]) == [1, 0]
+
+def test_snapshots_are_isolated_from_writers():
+    """Test that a held snapshot keeps its ratios while the bank is re-ranked."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = os.path.join(tempdir, 'sentences.tsv')
+
+        sentences = pd.DataFrame({
+            "Sentence": [f"Hola {i} amigo" if i % 2 else f"Hola {i} queso" for i in range(50)],
+            "Meaning": [f"Hello {i}" for i in range(50)],
+            "Custom Ratio": [0] * 50
+        })
+        sentences.to_csv(tmpfilepath, sep="\t")
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+        before = sentence_bank.snapshot()
+        token_index = sentence_bank.get_token_index(before)
+
+        sentence_bank.rank_sentences(["hola", "amigo"])
+        after = sentence_bank.snapshot()
+
+        assert after.version == before.version + 1
+        assert after.known_words == {"hola", "amigo"}
+        assert before.known_words is None
+        assert not before.ratios.any()
+        assert not before.ratios.flags.writeable
+        assert sentence_bank.sentences_at([1], before)[0]["Custom Ratio"] == 0
+        assert sentence_bank.sentences_at([1])[0]["Custom Ratio"] == 2 / 3
+
+        # Re-ranking keeps the rows, so the indexes are shared
+        assert sentence_bank.get_token_index(after) is token_index
+        trigram_index = sentence_bank.get_trigram_index(after)
+
+        sentence_bank.add_sentence("Hola queso amigo", "Hello cheese friend")
+        assert len(sentence_bank.snapshot()) == 51
+        assert len(after) == 50
+        assert sentence_bank.snapshot().known_words is after.known_words
+
+        # The append extended copies of the indexes, the held ones are unchanged
+        assert sentence_bank.get_token_index(after) is token_index
+        assert token_index["amigo"][-1] == 49
+        assert sentence_bank.get_token_index()["amigo"][-1] == 50
+        assert sentence_bank.get_token_index()["hola"] is not token_index["hola"]
+        assert trigram_index.size == 50
+        assert sentence_bank.get_trigram_index().size == 51
+
+        # The DataFrame handed out shares the rows but refuses writes
+        frame = sentence_bank.sentence_bank
+        with pytest.raises(ValueError, match="read-only"):
+            frame.loc[0, "Custom Ratio"] = 1.0
+        with pytest.raises(ValueError, match="read-only"):
+            frame.loc[0, "Sentence"] = "Changed"
+        frame["Custom Ratio"] = 0.0
+        assert sentence_bank.sentences_at([0])[0]["Sentence"] == "Hola 0 queso"
+        assert sentence_bank.snapshot().ratios.any()
+
+        # An edited copy assigned back is published
+        frame = sentence_bank.sentence_bank.copy()
+        frame.loc[0, "Sentence"] = "Changed"
+        sentence_bank.sentence_bank = frame
+        assert sentence_bank.sentences_at([0])[0]["Sentence"] == "Changed"
+
+def test_concurrent_reads_during_rerank():
+    """Test that readers always see one consistent ranking while writers swap them."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = os.path.join(tempdir, 'sentences.tsv')
+
+        sentences = pd.DataFrame({
+            "Sentence": [f"Hola amigo {i}" for i in range(200)],
+            "Meaning": [f"Hello friend {i}" for i in range(200)],
+            "Custom Ratio": [0] * 200
+        })
+        sentences.to_csv(tmpfilepath, sep="\t")
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+        # Every sentence has the same ratio under each ranking
+        rankings = [["hola"], ["hola", "amigo"]]
+        allowed = {0.0, 1 / 3, 2 / 3}
+        errors = []
+
+        def read():
+            try:
+                for _ in range(50):
+                    ratios = {sentence["Custom Ratio"] for sentence in sentence_bank.get_sentences("hola", 200)}
+                    assert len(ratios) == 1 and ratios <= allowed
+            except Exception as error:
+                errors.append(error)
+
+        readers = [threading.Thread(target=read) for _ in range(4)]
+        for reader in readers:
+            reader.start()
+        for i in range(20):
+            sentence_bank.rank_sentences(rankings[i % 2])
+        for reader in readers:
+            reader.join()
+
+        assert errors == []
+
+def test_filter_sentences():
+    """Test word queries restricted by ranges over numeric columns."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = os.path.join(tempdir, 'sentences.tsv')
+
+        sentences = pd.DataFrame({
+            "Sentence": ["我是学生", "我是老师", "我喜欢喝茶", "他是医生", "我们明天去北京吧"],
+            "Meaning": ["I am a student", "I am a teacher", "I like tea", "He is a doctor", "Let's go to Beijing tomorrow"],
+            "Custom Ratio": [0.9, 0.8, 0.95, 0.9, 0.85],
+            "HSK average": [1.0, 1.5, 2.5, 1.0, None]
+        })
+        sentences.to_csv(tmpfilepath, sep="\t")
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+
+        results = sentence_bank.filter_sentences("我", filters={
+            "HSK average": (None, 2),
+            "Token Count": (4, 6),
+            "Custom Ratio": (0.8, None)
+        })
+        assert [result["Sentence"] for result in results] == ["我是学生", "我是老师"]
+
+        # Without a word every row is a candidate, rows without a value never match
+        results = sentence_bank.filter_sentences(filters={"HSK average": (1, 1)})
+        assert [result["Sentence"] for result in results] == ["我是学生", "他是医生"]
+
+        # Without filters it agrees with get_sentences
+        assert sentence_bank.filter_sentences("是", 2) == sentence_bank.get_sentences("是", 2)
+        assert sentence_bank.filter_sentences("我们明天") == sentence_bank.get_sentences("我们明天", 1)
+
+        with pytest.raises(ValueError, match="Column Pinyin not found"):
+            sentence_bank.filter_sentences("我", filters={"Pinyin": (1, 2)})
+
+        with pytest.raises(ValueError, match="Column Meaning must be numeric"):
+            sentence_bank.filter_sentences("我", filters={"Meaning": (1, 2)})
+
+        with pytest.raises(ValueError, match="must be a \\(low, high\\) pair"):
+            sentence_bank.filter_sentences("我", filters={"Token Count": 5})
+
+def test_sample_sentences():
+    """Test seeded, ratio weighted and diversity penalized sampling."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = os.path.join(tempdir, 'sentences.tsv')
+
+        sentences = pd.DataFrame({
+            "Sentence": ["Hola a b", "Hola a c", "Hola d e", "Adios"],
+            "Meaning": ["Hello a b", "Hello a c", "Hello d e", "Bye"],
+            "Custom Ratio": [0.5, 0.5, 0.5, 1.0]
+        })
+        sentences.to_csv(tmpfilepath, sep="\t")
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+
+        # Reproducible with a seed, only matches, never repeated
+        sample = sentence_bank.sample_sentences("hola", 2, seed=3)
+        assert sample == sentence_bank.sample_sentences("hola", 2, seed=3)
+        assert len({sentence["Sentence"] for sentence in sample}) == 2
+        assert all(sentence["Sentence"].startswith("Hola") for sentence in sample)
+
+        # Asking for more than exist returns every match
+        assert len(sentence_bank.sample_sentences("hola", 10, seed=1)) == 3
+        assert sentence_bank.sample_sentences("queso", 2) == []
+
+        # A strong penalty keeps sentences sharing "a" apart
+        for seed in range(20):
+            drawn = {sentence["Sentence"] for sentence in sentence_bank.sample_sentences("hola", 2, seed=seed, diversity=1e9)}
+            assert drawn != {"Hola a b", "Hola a c"}
+
+        # Zero ratio sentences are almost never drawn while others remain
+        sentence_bank.rank_sentences(["a", "b"])
+        draws = [sentence_bank.sample_sentences("hola", 1, seed=seed)[0]["Sentence"] for seed in range(50)]
+        assert set(draws) == {"Hola a b", "Hola a c"}
+        assert draws.count("Hola a b") > draws.count("Hola a c")
+
+        with pytest.raises(ValueError, match="Diversity must be a non-negative number"):
+            sentence_bank.sample_sentences("hola", 1, diversity=-1)
+
+def test_token_cache_skips_tokenizing_known_sentences(monkeypatch):
+    """Test that a second load takes tokens of unchanged sentences from the cache."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = os.path.join(tempdir, 'sentences.tsv')
+
+        sentences = pd.DataFrame({
+            "Sentence": ["Hola amigo", "我是学生", "¿Cómo ESTÁS?"],
+            "Meaning": ["Hello friend", "I am a student", "How are you?"],
+            "Custom Ratio": [0.5, 0.5, 0.5]
+        })
+        sentences.to_csv(tmpfilepath, sep="\t")
+
+        # The cache is opt-in, a plain load leaves the directory alone
+        Sentence_bank(tmpfilepath)
+        assert sorted(os.listdir(tempdir)) == ['sentences.tsv']
+
+        first = Sentence_bank(tmpfilepath, token_cache=True)
+        assert sorted(os.listdir(tempdir)) == ['sentences.tokens.npz', 'sentences.tsv']
+
+        # Reorder the rows and add one, only the new one is tokenized
+        sentences = pd.concat([sentences.iloc[::-1], pd.DataFrame({
+            "Sentence": ["Adios amigo"], "Meaning": ["Bye friend"], "Custom Ratio": [0.5]
+        })], ignore_index=True)
+        sentences.to_csv(tmpfilepath, sep="\t")
+
+        tokenized = []
+        original_tokenize = sentence_bank_module.tokenize
+        def counting_tokenize(sentence):
+            tokenized.append(sentence)
+            return original_tokenize(sentence)
+        monkeypatch.setattr(sentence_bank_module, "tokenize", counting_tokenize)
+
+        second = Sentence_bank(tmpfilepath, token_cache=True)
+        assert tokenized == ["adios amigo"]
+        assert list(second.sentence_bank["Tokens"]) == list(first.sentence_bank["Tokens"])[::-1] + [("adios", "amigo")]
+
+        # The encoding comes with the cache and matches the Tokens column
+        vocabulary, token_ids, offsets = second.encode_tokens()
+        assert [tuple(vocabulary[i] for i in token_ids[offsets[row]:offsets[row + 1]]) for row in range(4)] == list(second.sentence_bank["Tokens"])
+
+        tokenized.clear()
+        third = Sentence_bank(tmpfilepath, token_cache=True)
+        assert tokenized == []
+        assert list(third.sentence_bank["Tokens"]) == list(second.sentence_bank["Tokens"])
+
+        # Without the cache everything is tokenized
+        Sentence_bank(tmpfilepath)
+        assert len(tokenized) == 4
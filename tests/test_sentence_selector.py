@@ -0,0 +1,99 @@
+# Standard library imports
+import os
+import tempfile
+
+# Third-party imports
+import pandas as pd
+import pytest
+
+# Local imports
+from src.sentence_bank import Sentence_bank
+from src.sentence_selector import Sentence_selector
+
+def make_bank(tempdir):
+    """Write and load a small Spanish bank."""
+    tmpfilepath = os.path.join(tempdir, 'sentences.tsv')
+    pd.DataFrame({
+        "Sentence": [
+            "Me gusta queso",
+            "Me gusta pan",
+            "Pan y queso con leche",
+            "El pan es bueno",
+            "La leche es buena",
+            "Hasta luego"
+        ],
+        "Meaning": ["I like cheese", "I like bread", "Bread and cheese with milk", "The bread is good", "The milk is good", "See you"],
+        "Custom Ratio": [0, 0, 0, 0, 0, 0]
+    }).to_csv(tmpfilepath, sep="\t")
+
+    sentence_bank = Sentence_bank(tmpfilepath)
+    sentence_bank.rank_sentences(["me", "gusta", "y", "con", "el", "la", "es", "bueno", "buena"])
+    return sentence_bank
+
+def test_select_covers_targets_with_fewest_sentences():
+    with tempfile.TemporaryDirectory() as tempdir:
+        selector = Sentence_selector(make_bank(tempdir))
+
+        selected, uncovered = selector.select(["queso", "pan", "Leche"])
+
+        # One sentence covers all three targets
+        assert len(selected) == 1
+        assert selected[0]["Sentence"] == "Pan y queso con leche"
+        assert sorted(selected[0]["Targets"]) == ["Leche", "pan", "queso"]
+        assert uncovered == {}
+
+def test_select_respects_quotas_and_reports_uncovered():
+    with tempfile.TemporaryDirectory() as tempdir:
+        selector = Sentence_selector(make_bank(tempdir))
+
+        selected, uncovered = selector.select(["queso", "pan", "adios"], quotas={"pan": 3, "queso": 2})
+
+        counts = {"queso": 0, "pan": 0}
+        for sentence in selected:
+            for word in sentence["Targets"]:
+                counts[word] += 1
+
+        assert counts == {"queso": 2, "pan": 3}
+        # Every pan and queso sentence is needed, the shared one only once
+        assert len(selected) == 4
+        assert uncovered == {"adios": 1}
+
+def test_select_prefers_fewer_unknown_words():
+    with tempfile.TemporaryDirectory() as tempdir:
+        selector = Sentence_selector(make_bank(tempdir))
+
+        # "Pan y queso con leche" has three unknown words, the others one,
+        # and ties go to the higher Custom Ratio
+        selected, _ = selector.select(["pan"])
+        assert [sentence["Sentence"] for sentence in selected] == ["El pan es bueno"]
+
+def test_select_covers_multi_character_words():
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = os.path.join(tempdir, 'sentences.tsv')
+        pd.DataFrame({
+            "Sentence": ["我要坐火车", "火很大，车很小", "我坐火车去北京"],
+            "Meaning": ["I will take the train", "The fire is big, the car is small", "I take the train to Beijing"],
+            "Custom Ratio": [0, 0, 0]
+        }).to_csv(tmpfilepath, sep="\t")
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+        sentence_bank.rank_sentences(["我", "要", "坐"])
+        selector = Sentence_selector(sentence_bank)
+
+        # Scattered 火 and 车 do not cover 火车
+        selected, uncovered = selector.select(["火车"], quotas=3)
+        assert sorted(sentence["Sentence"] for sentence in selected) == ["我坐火车去北京", "我要坐火车"]
+        assert uncovered == {"火车": 1}
+
+def test_select_invalid_inputs():
+    with tempfile.TemporaryDirectory() as tempdir:
+        selector = Sentence_selector(make_bank(tempdir))
+
+        with pytest.raises(ValueError):
+            selector.select("queso")
+
+        with pytest.raises(ValueError):
+            selector.select(["queso"], quotas=-1)
+
+    with pytest.raises(ValueError):
+        Sentence_selector(None, unknown_weight=-1)
@@ -0,0 +1,127 @@
+# Standard library imports
+import os
+import tempfile
+import threading
+
+# Third-party imports
+import pandas as pd
+import pytest
+
+# Local imports
+import src.sharded_sentence_bank as sharded_module
+from src.sharded_sentence_bank import Sharded_sentence_bank
+
+def write_shards(tempdir):
+    """Write a small Spanish and Mandarin shard into tempdir."""
+    pd.DataFrame({
+        "Sentence": ["Hola amigo", "Me gusta queso"],
+        "Meaning": ["Hello friend", "I like cheese"],
+        "Custom Ratio": [0.9, 0.5]
+    }).to_csv(os.path.join(tempdir, "Spanish.tsv"), sep="\t")
+
+    pd.DataFrame({
+        "Sentence": ["你好，世界", "我不懂"],
+        "Meaning": ["Hello, world", "I don't understand"],
+        "Custom Ratio": [0.8, 0.4]
+    }).to_csv(os.path.join(tempdir, "mandarin.tsv"), sep="\t")
+
+def test_shards_load_lazily():
+    """Test that no shard is loaded until it is queried."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        write_shards(tempdir)
+
+        bank = Sharded_sentence_bank(tempdir)
+
+        assert bank.languages() == ["mandarin", "spanish"]
+        assert bank.loaded_languages() == []
+
+        results = bank.get_sentences(" Spanish ", "hola", 1)
+
+        assert results[0]["Sentence"] == "Hola amigo"
+        assert bank.loaded_languages() == ["spanish"]
+        assert bank.memory_usage() > 0
+
+def test_shards_evicted_under_memory_cap():
+    """Test that the least recently used shard is evicted over the cap."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        write_shards(tempdir)
+
+        bank = Sharded_sentence_bank(tempdir, max_memory_bytes=1)
+
+        bank.get_bank("spanish")
+        bank.get_bank("mandarin")
+
+        # The newest shard is always kept even if it alone is over the cap
+        assert bank.loaded_languages() == ["mandarin"]
+
+        # Evicted shards are transparently reloaded
+        assert bank.get_sentences("spanish", "queso", 1)[0]["Meaning"] == "I like cheese"
+        assert bank.loaded_languages() == ["spanish"]
+
+def test_loading_a_shard_does_not_block_loaded_shards(monkeypatch):
+    """Test that a slow load runs outside the lock and is shared by concurrent requests."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        write_shards(tempdir)
+
+        bank = Sharded_sentence_bank(tempdir)
+        bank.get_bank("spanish")
+
+        started = threading.Event()
+        release = threading.Event()
+        loads = []
+        original_sentence_bank = sharded_module.Sentence_bank
+
+        def slow_sentence_bank(path):
+            loads.append(path)
+            started.set()
+            release.wait(5)
+            return original_sentence_bank(path)
+
+        monkeypatch.setattr(sharded_module, "Sentence_bank", slow_sentence_bank)
+
+        results = []
+        loaders = [threading.Thread(target=lambda: results.append(bank.get_bank("mandarin"))) for _ in range(3)]
+        for loader in loaders:
+            loader.start()
+
+        # Queries of a loaded shard go on while mandarin is loading
+        started.wait(5)
+        assert bank.get_sentences("spanish", "hola", 1)[0]["Sentence"] == "Hola amigo"
+        assert results == []
+
+        release.set()
+        for loader in loaders:
+            loader.join()
+
+        assert len(loads) == 1
+        assert len(results) == 3 and all(result is results[0] for result in results)
+        assert bank.loaded_languages() == ["spanish", "mandarin"]
+
+def test_failed_load_can_be_retried(monkeypatch):
+    with tempfile.TemporaryDirectory() as tempdir:
+        write_shards(tempdir)
+        bank = Sharded_sentence_bank(tempdir)
+
+        def broken_sentence_bank(path):
+            raise ValueError("Broken shard")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(sharded_module, "Sentence_bank", broken_sentence_bank)
+            with pytest.raises(ValueError, match="Broken shard"):
+                bank.get_bank("spanish")
+
+        assert bank.get_bank("spanish").get_sentences("hola", 1)[0]["Sentence"] == "Hola amigo"
+
+def test_shards_from_dict_and_unknown_language():
+    with tempfile.TemporaryDirectory() as tempdir:
+        write_shards(tempdir)
+
+        bank = Sharded_sentence_bank({"ES": os.path.join(tempdir, "Spanish.tsv")})
+
+        assert bank.get_sentences("es", "gusta", 1)[0]["Sentence"] == "Me gusta queso"
+
+        with pytest.raises(ValueError, match="No sentence bank for language japanese"):
+            bank.get_bank("japanese")
+
+    with pytest.raises(ValueError):
+        Sharded_sentence_bank("./does/not/exist")
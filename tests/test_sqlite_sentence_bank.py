@@ -0,0 +1,115 @@
+# Standard library imports
+import os
+import tempfile
+
+# Third-party imports
+import pandas as pd
+import pytest
+
+# Local imports
+from src.sentence_bank import Sentence_bank
+from src.sqlite_sentence_bank import Sqlite_sentence_bank
+
+def write_tsv(tempdir, sentences):
+    tmpfilepath = os.path.join(tempdir, 'sentences.tsv')
+    sentences.to_csv(tmpfilepath, sep="\t")
+    return tmpfilepath
+
+def test_sqlite_get_sentences_matches_sentence_bank():
+    """Test that the SQLite backend returns what Sentence_bank returns."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = write_tsv(tempdir, pd.DataFrame({
+            "Sentence": ["Hola! Como estas?", "hola amigo", "HOLA MUNDO", "Holacuate", "你好，世界", "Hola* is a greeting", "Me gusta"],
+            "Meaning": ["Hello! How are you?", "hello friend", "HELLO WORLD", "Avocado", "Hello, world", "Greeting", "I like it"],
+            "Custom Ratio": [0.2, 0.9, 0.8, 0.7, 0.5, 0.3, None]
+        }))
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+        sqlite_bank = Sqlite_sentence_bank.create(tmpfilepath, os.path.join(tempdir, 'sentences.sqlite'))
+
+        assert len(sqlite_bank) == 7
+
+        for word, num_sentences in [("Hola", 5), ("hola", 2), ("你", 1), ("你好", 3), ("Hola*", 1), ("me", 7), ("xyz", 3)]:
+            assert sqlite_bank.get_sentences(word, num_sentences) == sentence_bank.get_sentences(word, num_sentences)
+
+        with pytest.raises(ValueError, match="Word must be non-empty string"):
+            sqlite_bank.get_sentences("", 1)
+
+        with pytest.raises(ValueError):
+            sqlite_bank.get_sentences("hola", 8)
+
+        sqlite_bank.close()
+
+def test_sqlite_short_terms_use_gram_table():
+    """Test that one and two character terms are served by the opt-in gram table, and scanned without it."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = write_tsv(tempdir, pd.DataFrame({
+            "Sentence": ["我要坐火车", "火车很快", "你好，世界", "我不懂", "Me gusta", "A mí me gusta"],
+            "Meaning": ["I take the train", "Trains are fast", "Hello, world", "I don't understand", "I like it", "I like it"],
+            "Custom Ratio": [0.2, 0.9, 0.8, 0.7, 0.5, 0.6]
+        }))
+        path = os.path.join(tempdir, 'sentences.sqlite')
+
+        sentence_bank = Sentence_bank(tmpfilepath)
+        sqlite_bank = Sqlite_sentence_bank.create(tmpfilepath, path, chunk_size=4, short_terms=True)
+
+        plan = " ".join(str(row) for row in sqlite_bank.connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM sentences_grams WHERE gram = ? ORDER BY custom_ratio DESC, id LIMIT 1", ("我",)
+        ))
+        assert "TEMP B-TREE" not in plan
+
+        queries = [("我", 2), ("火车", 3), ("me", 2), ("，", 1), ("z", 1)]
+        expected = [sentence_bank.get_sentences(word, num_sentences) for word, num_sentences in queries]
+        assert [sqlite_bank.get_sentences(word, num_sentences) for word, num_sentences in queries] == expected
+        sqlite_bank.close()
+
+        # By default there is no gram table and short terms are scanned
+        scan_path = os.path.join(tempdir, 'scan.sqlite')
+        scan_bank = Sqlite_sentence_bank.create(tmpfilepath, scan_path, chunk_size=4)
+        assert scan_bank.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'sentences_grams'"
+        ).fetchone() is None
+        assert [scan_bank.get_sentences(word, num_sentences) for word, num_sentences in queries] == expected
+        scan_bank.close()
+
+def test_sqlite_concurrent_readers():
+    with tempfile.TemporaryDirectory() as tempdir:
+        tmpfilepath = write_tsv(tempdir, pd.DataFrame({
+            "Sentence": ["Me gusta queso", "El queso es bueno"],
+            "Meaning": ["I like cheese", "The cheese is good"],
+            "Custom Ratio": [0.5, 0.6]
+        }))
+        path = os.path.join(tempdir, 'sentences.sqlite')
+        Sqlite_sentence_bank.create(tmpfilepath, path, chunk_size=1).close()
+
+        readers = [Sqlite_sentence_bank(path) for _ in range(3)]
+        for reader in readers:
+            assert reader.get_sentences("queso", 1)[0]["Sentence"] == "El queso es bueno"
+            reader.close()
+
+def test_sqlite_create_validation():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, 'sentences.sqlite')
+
+        duplicate = write_tsv(tempdir, pd.DataFrame({
+            "Sentence": ["Hola!", "Hola!"],
+            "Meaning": ["Hello!", "Hi!"],
+            "Custom Ratio": [1.0, 0.8]
+        }))
+        with pytest.raises(ValueError, match="Sentence column cannot contain duplicates"):
+            Sqlite_sentence_bank.create(duplicate, path)
+        assert not os.path.exists(path)
+
+        bad_ratio = write_tsv(tempdir, pd.DataFrame({
+            "Sentence": ["Uno"],
+            "Meaning": ["One"],
+            "Custom Ratio": [2]
+        }))
+        with pytest.raises(ValueError, match="Custom Ratios must be between 0 and 1"):
+            Sqlite_sentence_bank.create(bad_ratio, path)
+
+        with pytest.raises(FileNotFoundError):
+            Sqlite_sentence_bank(path)
+
+        with pytest.raises(ValueError):
+            Sqlite_sentence_bank(os.path.join(tempdir, 'sentences.db'))
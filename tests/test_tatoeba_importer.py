@@ -0,0 +1,98 @@
+# Standard library imports
+import bz2
+import os
+import tempfile
+
+# Third-party imports
+import pytest
+
+# Local imports
+from src.sentence_bank import Sentence_bank
+from src.tatoeba_importer import import_tatoeba, main
+
+SENTENCES = [
+    "1\tspa\tHola amigo.",
+    "2\teng\tHello friend.",
+    "3\tspa\t\"Sí\", dijo él.",
+    "4\teng\t\"Yes,\" he said.",
+    "5\tcmn\t你好。",
+    "6\tspa\tHola amigo.",
+    "7\tspa\tSin traducción.",
+    "8\tfra\tSalut ami.",
+    "9\teng\tHi friend.",
+    "not a row"
+]
+
+LINKS = [
+    "1\t8",
+    "1\t2",
+    "1\t9",
+    "2\t1",
+    "3\t4",
+    "6\t9",
+    "7\t5"
+]
+
+def write_dumps(tempdir, compress=False):
+    sentences_path = os.path.join(tempdir, "sentences.csv")
+    links_path = os.path.join(tempdir, "links.csv")
+
+    if compress:
+        sentences_path += ".bz2"
+        with bz2.open(sentences_path, "wt", encoding="utf-8") as file:
+            file.write("\n".join(SENTENCES) + "\n")
+    else:
+        with open(sentences_path, "w", encoding="utf-8") as file:
+            file.write("\n".join(SENTENCES) + "\n")
+
+    with open(links_path, "w", encoding="utf-8") as file:
+        file.write("\n".join(LINKS) + "\n")
+
+    return sentences_path, links_path
+
+def test_import_tatoeba_into_sentence_bank():
+    with tempfile.TemporaryDirectory() as tempdir:
+        sentences_path, links_path = write_dumps(tempdir)
+        output_path = os.path.join(tempdir, "spa.tsv")
+
+        messages = []
+        written = import_tatoeba(sentences_path, links_path, output_path, "spa", "eng", progress_every=2, report=messages.append)
+
+        assert written == 2
+        assert any("rows/s" in message for message in messages)
+
+        sentence_bank = Sentence_bank(output_path)
+        rows = dict(zip(sentence_bank.sentence_bank["Sentence"], sentence_bank.sentence_bank["Meaning"]))
+
+        # First English link wins, quotes survive, duplicates and untranslated sentences are skipped
+        assert rows == {"Hola amigo.": "Hello friend.", "\"Sí\", dijo él.": "\"Yes,\" he said."}
+        assert list(sentence_bank.sentence_bank["Custom Ratio"]) == [0, 0]
+
+def test_import_tatoeba_compressed_and_silent():
+    with tempfile.TemporaryDirectory() as tempdir:
+        sentences_path, links_path = write_dumps(tempdir, compress=True)
+        output_path = os.path.join(tempdir, "spa.tsv")
+
+        assert import_tatoeba(sentences_path, links_path, output_path, "spa", "fra", report=None) == 1
+        assert Sentence_bank(output_path).get_sentences("hola", 1)[0]["Meaning"] == "Salut ami."
+
+def test_import_tatoeba_silent_by_default_and_cli_reports(capsys):
+    with tempfile.TemporaryDirectory() as tempdir:
+        sentences_path, links_path = write_dumps(tempdir)
+        output_path = os.path.join(tempdir, "spa.tsv")
+
+        assert import_tatoeba(sentences_path, links_path, output_path, "spa", "eng") == 2
+        assert capsys.readouterr().out == ""
+
+        assert main([sentences_path, links_path, output_path, "spa", "eng", "--progress-every", "2"]) == 2
+        assert "rows/s" in capsys.readouterr().out
+
+def test_import_tatoeba_invalid_arguments():
+    with tempfile.TemporaryDirectory() as tempdir:
+        sentences_path, links_path = write_dumps(tempdir)
+
+        with pytest.raises(ValueError, match="output_path must end with .tsv"):
+            import_tatoeba(sentences_path, links_path, os.path.join(tempdir, "out.csv"), "spa", "eng")
+
+        with pytest.raises(ValueError):
+            import_tatoeba(sentences_path, links_path, os.path.join(tempdir, "out.tsv"), "", "eng")
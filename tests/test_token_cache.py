@@ -0,0 +1,42 @@
+import os
+import tempfile
+
+import numpy as np
+
+from src.token_cache import TOKENIZER_VERSION, Token_cache, sentence_keys, token_cache_path
+
+def test_token_cache_path():
+    assert token_cache_path("./data/sentences.tsv") == "./data/sentences.tokens.npz"
+
+def test_find_by_content():
+    keys = sentence_keys(["a b", "c", "d e f"])
+    cache = Token_cache(keys, ["a", "b", "c"], [0, 1, 2], [0, 2, 3, 3])
+
+    assert len(set(keys.tolist())) == 3
+    assert cache.find(sentence_keys(["d e f", "new", "a b"])).tolist() == [2, -1, 0]
+    assert Token_cache([], [], [], [0]).find(keys).tolist() == [-1, -1, -1]
+
+def test_save_and_load():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "sentences.tokens.npz")
+        cache = Token_cache(sentence_keys(["我是", "hola amigo"]), ["我", "是", "hola", "amigo"], [0, 1, 2, 3], [0, 2, 4])
+
+        cache.save(path)
+        loaded = Token_cache.load(path)
+
+        assert os.listdir(tempdir) == ["sentences.tokens.npz"]
+        assert loaded.vocabulary == cache.vocabulary
+        assert np.array_equal(loaded.keys, cache.keys)
+        assert loaded.token_ids.tolist() == [0, 1, 2, 3]
+        assert loaded.offsets.tolist() == [0, 2, 4]
+
+def test_load_rejects_other_versions_and_corrupt_files():
+    with tempfile.TemporaryDirectory() as tempdir:
+        path = os.path.join(tempdir, "sentences.tokens.npz")
+
+        np.savez(path, version=np.array([TOKENIZER_VERSION + 1]))
+        assert Token_cache.load(path) is None
+
+        with open(path, "wb") as file:
+            file.write(b"not a zip file")
+        assert Token_cache.load(path) is None
@@ -0,0 +1,86 @@
+# Standard library imports
+import os
+import tempfile
+
+# Third-party imports
+import pandas as pd
+import pytest
+
+# Local imports
+from src.sentence_bank import Sentence_bank
+from src.trigram_index import Trigram_index, parse_query
+
+def make_bank(tempdir):
+    tmpfilepath = os.path.join(tempdir, 'search.tsv')
+    pd.DataFrame({
+        "Sentence": [
+            "Hablo español muy bien",
+            "Ella habla muy rápido",
+            "Deshabla la canción",
+            "La casa es muy bonita",
+            "La cosa está muy bien",
+            "Muy, bien hecho",
+            "你不懂"
+        ],
+        "Meaning": ["I speak Spanish very well", "She speaks very fast", "Unspeak the song", "The house is very pretty", "The thing is very good", "Very well done", "You don't understand"],
+        "Custom Ratio": [0.1, 0.9, 0.8, 0.5, 0.4, 0.3, 0.2]
+    }).to_csv(tmpfilepath, sep="\t")
+    return Sentence_bank(tmpfilepath)
+
+def test_trigram_candidates():
+    index = Trigram_index(["hola amigo", "hola", "adios amigo"])
+
+    assert index.candidates(["amigo"]) == [0, 2]
+    assert index.candidates(["hola", "amigo"]) == [0]
+    assert index.candidates(["zzz"]) == []
+    # Nothing to narrow with
+    assert index.candidates(["ho"]) is None
+
+def test_trigram_extended_leaves_original():
+    index = Trigram_index(["hola amigo", "hola"])
+    extended = index.extended(["adios amigo"])
+
+    assert extended.candidates(["amigo"]) == [0, 2]
+    assert extended.size == 3
+    assert index.candidates(["amigo"]) == [0]
+    assert index.size == 2
+    # Lists of trigrams the new sentence lacks are shared
+    assert extended.postings["hol"] is index.postings["hol"]
+
+def test_parse_query():
+    patterns, literals = parse_query('habl* "muy bien" c?sa')
+
+    assert len(patterns) == 3
+    assert literals == ["habl", "muy", "bien", "c", "sa"]
+
+    with pytest.raises(ValueError):
+        parse_query('""')
+
+def test_search_prefix_phrase_and_wildcards():
+    with tempfile.TemporaryDirectory() as tempdir:
+        sentence_bank = make_bank(tempdir)
+
+        def sentences(query):
+            return [s["Sentence"] for s in sentence_bank.search(query, 10)]
+
+        # Prefixes only match word starts, ordered by ratio
+        assert sentences("habl*") == ["Ella habla muy rápido", "Hablo español muy bien"]
+        assert sentences("*ción") == ["Deshabla la canción"]
+
+        # Phrases match consecutive words across punctuation
+        assert sentences('"muy bien"') == ["La cosa está muy bien", "Muy, bien hecho", "Hablo español muy bien"]
+
+        # Single character wildcards and several terms
+        assert sentences("c?sa") == ["La casa es muy bonita", "La cosa está muy bien"]
+        assert sentences('c?sa "muy bien"') == ["La cosa está muy bien"]
+
+        # Plain words behave like get_sentences
+        assert sentences("HABLA") == ["Ella habla muy rápido", "Deshabla la canción"]
+        assert sentences("不") == ["你不懂"]
+
+        # Sentences added later are searchable
+        sentence_bank.add_sentence("Hablamos mañana", "We'll talk tomorrow", 1.0)
+        assert sentences("habl*")[0] == "Hablamos mañana"
+
+        with pytest.raises(ValueError):
+            sentence_bank.search("   ", 1)
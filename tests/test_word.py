@@ -1,6 +1,12 @@
+import os
+import tempfile
+
 import pytest
 import genanki
-from src.word import Word
+import pandas as pd
+
+import src.word as word_module
+from src.word import Word, WordValidationError
 
 def test_has_attr_word():
     """
@@ -194,3 +200,102 @@ class TestWordGeVocabtModel:
         assert isinstance(vocab_model, genanki.Model)
         assert False
 
+
+class TestWordFromMany:
+    """
+    Tests the bulk constructor Word.from_many
+    """
+
+    def test_from_many_with_val_input(self):
+        """
+        test that every word is normalized and resolved against known.csv
+        """
+        words = Word.from_many([" 火车 ", "Espejo", "辦"], "Mandarin", definitions=["train", "mirror", "do"])
+
+        assert [word.word for word in words] == ["火车", "espejo", "辦"]
+        assert [word.known_word for word in words] == [True, False, False]
+        assert all(word.lang == "mandarin" for word in words)
+        assert words[1].definition == "mirror"
+        assert words[1].vocab_note is not None
+
+    def test_from_many_reports_every_invalid_word(self):
+        """
+        test that all invalid words are reported together
+        """
+        with pytest.raises(WordValidationError) as excinfo:
+            Word.from_many(["Hola", "", "!", 123], "spanish")
+
+        assert [(index, message) for index, _, message in excinfo.value.errors] == [
+            (1, "Word must be a non-empty string"),
+            (2, "Word must contain normal characters"),
+            (3, "Word must be a non-empty string")
+        ]
+
+    def test_from_many_with_invalid_language(self):
+        with pytest.raises(ValueError, match="Language must contain normal characters"):
+            Word.from_many(["Hola"], "😀")
+
+class TestWordLazyNote:
+    """
+    Tests that Word is slotted and builds its note lazily
+    """
+
+    def test_word_has_no_instance_dict(self):
+        word = Word("雷霆", "Chinese")
+
+        assert not hasattr(word, "__dict__")
+
+        with pytest.raises(AttributeError):
+            word.extra = "not allowed"
+
+    def test_note_built_on_first_access_and_released(self):
+        word = Word("雷霆", "Chinese")
+
+        assert word._vocab_note is None
+
+        note = word.vocab_note
+        assert isinstance(note, genanki.Note)
+        assert word.vocab_note is note
+
+        word.release_note()
+        assert word._vocab_note is None
+        assert word.vocab_note is not None
+
+    def test_known_word_has_no_note(self):
+        word = Word("火车", "chinese")
+
+        assert word.vocab_note is None
+
+    def test_model_shared_between_words(self):
+        assert Word("雷霆", "Chinese").get_vocab_model() is Word("Espejo", "spanish").get_vocab_model()
+
+class TestKnownWordsCache:
+    """
+    Tests that the known words CSV is read once per version of the file
+    """
+
+    def test_known_words_read_once_until_file_changes(self, monkeypatch):
+        reads = []
+        original_read_csv = word_module.pd.read_csv
+        def counting_read_csv(path, *args, **kwargs):
+            reads.append(path)
+            return original_read_csv(path, *args, **kwargs)
+        monkeypatch.setattr(word_module.pd, "read_csv", counting_read_csv)
+
+        with tempfile.TemporaryDirectory() as tempdir:
+            known_path = os.path.join(tempdir, "known.csv")
+            pd.DataFrame({"known": ["hola"]}).to_csv(known_path, index=False)
+
+            words = [Word(word, "spanish", path_to_known_csv=known_path) for word in ["hola", "queso", "pan"]]
+            words += Word.from_many(["hola", "queso"], "spanish", path_to_known_csv=known_path)
+
+            assert [word.known_word for word in words] == [True, False, False, True, False]
+            assert reads == [known_path]
+
+            # A rewritten file is read again
+            pd.DataFrame({"known": ["hola", "queso"]}).to_csv(known_path, index=False)
+            assert Word("queso", "spanish", path_to_known_csv=known_path).known_word
+            assert len(reads) == 2
+
+            # The cached set is shared, so it cannot be modified
+            assert isinstance(word_module.load_known_words(known_path), frozenset)